@@ -0,0 +1,243 @@
+import hashlib
+from functools import wraps
+from typing import Any, Callable
+
+from django.contrib.auth.decorators import login_required
+from django.core.handlers.wsgi import WSGIRequest
+from django.db.models import Model, QuerySet
+from django.forms import Form
+from django.http import HttpResponse, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.utils.http import http_date
+from django.views.decorators.http import condition, require_GET
+
+from restaurant.assignments import COOK_DISHES_ORDERING, cook_dishes
+from restaurant.caching import get_stamps
+from restaurant.forms import (
+    COOK_PICKER_FIELDS,
+    CookSearchForm,
+    DishSearchForm,
+    DishTypeSearchForm,
+)
+from restaurant.models import Cook, Dish, DishType
+from restaurant.pagination import InvalidCursor, KeysetPaginator, CURSOR_PARAM
+from restaurant.search import search
+
+PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+DISH_TYPE_FIELDS = ("id", "name")
+DISH_FIELDS = ("id", "name", "price", "dish_type")
+COOK_FIELDS = (
+    "id", "username", "first_name", "last_name", "years_of_experience",
+)
+
+
+def versioned(model: type[Model]) -> Callable:
+    """Answer conditional GETs about one ``model`` row from its page
+    version, which every change shown in the response bumps (see
+    ``restaurant.caching``). Writes elsewhere in the table leave the ETag
+    alone."""
+
+    def etag(request: WSGIRequest, pk: int, **kwargs: Any) -> str | None:
+        version = model.objects.filter(pk=pk).values_list(
+            "version", flat=True
+        ).first()
+        if version is None:
+            return None
+        parts = [request.get_full_path(), str(version)]
+        return hashlib.md5(":".join(parts).encode()).hexdigest()
+
+    return condition(etag_func=etag)
+
+
+def conditional(*models: type[Model]) -> Callable:
+    """Answer conditional GETs from the change stamps of ``models``.
+
+    The ETag is derived from the stamps alone, which every worker shares,
+    so a poll that matches it gets a 304 before any of the view's queries
+    run. Last-Modified is sent too, but never answers a request: with its
+    one-second precision, a change made in the same second as the previous
+    response would be missed until the next write.
+    """
+
+    def etag(request: WSGIRequest, *args: Any, **kwargs: Any) -> str:
+        request._change_stamps = get_stamps(*models)
+        parts = [
+            request.get_full_path(),
+            *(repr(stamp) for _, stamp in sorted(
+                request._change_stamps.items()
+            )),
+        ]
+        return hashlib.md5(":".join(parts).encode()).hexdigest()
+
+    def decorator(view: Callable) -> Callable:
+        conditional_view = condition(etag_func=etag)(view)
+
+        @wraps(view)
+        def wrapper(
+                request: WSGIRequest, *args: Any, **kwargs: Any
+        ) -> HttpResponse:
+            response = conditional_view(request, *args, **kwargs)
+            if hasattr(request, "_change_stamps"):
+                response.setdefault(
+                    "Last-Modified",
+                    http_date(max(request._change_stamps.values())),
+                )
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def _limit(request: WSGIRequest) -> int:
+    try:
+        limit = min(int(request.GET.get("limit", PAGE_SIZE)), MAX_PAGE_SIZE)
+    except ValueError:
+        limit = PAGE_SIZE
+    return max(limit, 1)
+
+
+def _list_response(
+        request: WSGIRequest,
+        queryset: QuerySet,
+        fields: tuple[str, ...],
+        form: Form,
+        search_field: str,
+) -> JsonResponse:
+    if form.is_valid():
+        queryset = search(queryset, form.cleaned_data[search_field])
+
+    limit = _limit(request)
+
+    # Keyset pages in the model's default order, ranked or not.
+    paginator = KeysetPaginator(
+        queryset.values(*fields), limit, queryset.model._meta.ordering,
+    )
+    try:
+        page = paginator.page(request.GET.get(CURSOR_PARAM))
+    except InvalidCursor:
+        return JsonResponse({"error": "Invalid cursor."}, status=400)
+
+    return JsonResponse(
+        {"results": list(page.object_list), "next": page.next_cursor}
+    )
+
+
+@login_required
+@require_GET
+@conditional(DishType)
+def dish_type_list(request: WSGIRequest) -> JsonResponse:
+    return _list_response(
+        request,
+        DishType.objects.all(),
+        DISH_TYPE_FIELDS,
+        DishTypeSearchForm(request.GET),
+        "name",
+    )
+
+
+@login_required
+@require_GET
+@conditional(DishType)
+def dish_type_detail(request: WSGIRequest, pk: int) -> JsonResponse:
+    return JsonResponse(
+        get_object_or_404(
+            DishType.objects.values(*DISH_TYPE_FIELDS), pk=pk,
+        )
+    )
+
+
+@login_required
+@require_GET
+@conditional(Dish)
+def dish_list(request: WSGIRequest) -> JsonResponse:
+    return _list_response(
+        request,
+        Dish.objects.all(),
+        DISH_FIELDS,
+        DishSearchForm(request.GET),
+        "name",
+    )
+
+
+@login_required
+@require_GET
+@versioned(Dish)
+def dish_detail(request: WSGIRequest, pk: int) -> JsonResponse:
+    dish = get_object_or_404(
+        Dish.objects.values(*DISH_FIELDS, "description"), pk=pk,
+    )
+    dish["cooks"] = list(
+        Dish.cooks.through.objects.filter(dish_id=pk)
+        .order_by("cook_id").values_list("cook_id", flat=True)
+    )
+    return JsonResponse(dish)
+
+
+@login_required
+@require_GET
+@conditional(Cook)
+def cook_list(request: WSGIRequest) -> JsonResponse:
+    return _list_response(
+        request,
+        Cook.objects.all(),
+        COOK_FIELDS,
+        CookSearchForm(request.GET),
+        "username",
+    )
+
+
+@login_required
+@require_GET
+@conditional(Cook)
+def cook_autocomplete(request: WSGIRequest) -> JsonResponse:
+    """Cook choices for ``restaurant.forms.CookPicker``."""
+    return _list_response(
+        request,
+        Cook.objects.all(),
+        COOK_PICKER_FIELDS,
+        CookSearchForm(request.GET),
+        "username",
+    )
+
+
+@login_required
+@require_GET
+@versioned(Cook)
+def cook_detail(request: WSGIRequest, pk: int) -> JsonResponse:
+    cook = get_object_or_404(Cook.objects.values(*COOK_FIELDS), pk=pk)
+    cook["dishes"] = list(
+        Dish.cooks.through.objects.filter(cook_id=pk)
+        .order_by("dish_id").values_list("dish_id", flat=True)
+    )
+    return JsonResponse(cook)
+
+
+@login_required
+@require_GET
+@versioned(Cook)
+def cook_dishes_list(request: WSGIRequest, pk: int) -> JsonResponse:
+    """Further pages of the dishes on the cook detail page."""
+    paginator = KeysetPaginator(
+        cook_dishes(pk), _limit(request), COOK_DISHES_ORDERING,
+    )
+    try:
+        page = paginator.page(request.GET.get(CURSOR_PARAM))
+    except InvalidCursor:
+        return JsonResponse({"error": "Invalid cursor."}, status=400)
+
+    return JsonResponse(
+        {
+            "results": [
+                {
+                    "id": row["dish_id"],
+                    "name": row["name"],
+                    "dish_type": row["dish_type"],
+                }
+                for row in page.object_list
+            ],
+            "next": page.next_cursor,
+        }
+    )
@@ -0,0 +1,258 @@
+from typing import Any, Iterable
+
+from django.db import connections, router, transaction
+from django.db.models import (
+    Count,
+    F,
+    Model,
+    OuterRef,
+    QuerySet,
+    Subquery,
+    Value,
+)
+from django.db.models.constants import OnConflict
+from django.db.models.functions import Coalesce, Greatest
+from django.db.models.signals import m2m_changed
+
+from restaurant.models import Cook, Dish
+
+# Keyset order of a cook's dishes (the paginator adds the through ``id``);
+# a range read of restaurant_dish_cooks_cook_dish_idx.
+COOK_DISHES_ORDERING = ("dish_id",)
+
+# How each side reaches the other one: the through column holding its id
+# and the lookup from the other model back to it.
+SIDES = {
+    Dish: ("dish_id", "dishes"),
+    Cook: ("cook_id", "cooks"),
+}
+
+
+def _send(action: str, dish: Dish, pk_set: set[int], using: str) -> None:
+    m2m_changed.send(
+        sender=Dish.cooks.through,
+        action=action,
+        instance=dish,
+        reverse=False,
+        model=Cook,
+        pk_set=pk_set,
+        using=using,
+    )
+
+
+def _placeholders(values: list[int]) -> str:
+    return ", ".join(["%s"] * len(values))
+
+
+def _through_columns(using: str) -> tuple[str, str, str]:
+    """The quoted through table, dish column and cook column."""
+    through = Dish.cooks.through
+    quote = connections[using].ops.quote_name
+    return (
+        quote(through._meta.db_table),
+        quote(through._meta.get_field("dish").column),
+        quote(through._meta.get_field("cook").column),
+    )
+
+
+def insert_assignments(
+        dish_pk: int, cook_ids: list[int], using: str
+) -> set[int]:
+    """Assign the ``cook_ids`` cooks to the dish ``dish_pk``, skipping
+    assignments that already exist; return the cook ids actually inserted.
+
+    A concurrent request may insert the same rows after the caller checked
+    for them, so only the returned ids are new and may be counted.
+    """
+    connection = connections[using]
+    ops = connection.ops
+    table, dish_column, cook_column = _through_columns(using)
+    insert = (
+        f"{ops.insert_statement(on_conflict=OnConflict.IGNORE)} {table} "
+        f"({dish_column}, {cook_column}) VALUES "
+    )
+    # ON CONFLICT DO NOTHING; SQLite says INSERT OR IGNORE instead.
+    ignore = ops.on_conflict_suffix_sql([], OnConflict.IGNORE, None, None)
+    ignore = f" {ignore}" if ignore else ""
+
+    with connection.cursor() as cursor:
+        if connection.features.can_return_rows_from_bulk_insert:
+            cursor.execute(
+                f"{insert}{', '.join(['(%s, %s)'] * len(cook_ids))}"
+                f"{ignore} RETURNING {cook_column}",
+                [value for pk in cook_ids for value in (dish_pk, pk)],
+            )
+            return {row[0] for row in cursor.fetchall()}
+
+        # Without RETURNING, the row count of each single-row insert tells.
+        inserted = set()
+        for pk in cook_ids:
+            cursor.execute(f"{insert}(%s, %s){ignore}", [dish_pk, pk])
+            if cursor.rowcount:
+                inserted.add(pk)
+        return inserted
+
+
+def set_dish_cooks(
+        dish: Dish, cook_ids: Iterable[int]
+) -> tuple[set[int], set[int]]:
+    """Make ``cook_ids`` the cooks of ``dish``; return the ids added and
+    the ids removed.
+
+    Unlike ``dish.cooks.set()``, which reads every current assignment, the
+    database computes both differences, so only changed ids are read. They
+    are applied with one DELETE and one INSERT, between the same
+    ``m2m_changed`` signals ``set()`` sends. ``post_add`` (and the ids
+    returned) only has the rows the INSERT actually wrote, which leaves out
+    any a concurrent request added first. Unknown cook ids are ignored.
+    """
+    through = Dish.cooks.through
+    cook_ids = sorted({int(pk) for pk in cook_ids})
+    using = router.db_for_write(through, instance=dish)
+    quote = connections[using].ops.quote_name
+    table, dish_column, cook_column = _through_columns(using)
+    cook_table = quote(Cook._meta.db_table)
+    cook_pk = quote(Cook._meta.pk.column)
+    # Raw SQL: the ORM prepares ``__in`` lists value by value, which costs
+    # more than the queries themselves once a roster has thousands of ids.
+    assigned = f"SELECT {cook_column} FROM {table} WHERE {dish_column} = %s"
+
+    with transaction.atomic(using=using, savepoint=False):
+        with connections[using].cursor() as cursor:
+            if cook_ids:
+                cursor.execute(
+                    f"{assigned} AND {cook_column} NOT IN "
+                    f"({_placeholders(cook_ids)})",
+                    [dish.pk, *cook_ids],
+                )
+            else:
+                cursor.execute(assigned, [dish.pk])
+            removed = {row[0] for row in cursor.fetchall()}
+
+            added = set()
+            if cook_ids:
+                cursor.execute(
+                    f"SELECT {cook_pk} FROM {cook_table} "
+                    f"WHERE {cook_pk} IN ({_placeholders(cook_ids)}) "
+                    f"AND {cook_pk} NOT IN ({assigned})",
+                    [*cook_ids, dish.pk],
+                )
+                added = {row[0] for row in cursor.fetchall()}
+
+            if removed:
+                _send("pre_remove", dish, removed, using)
+                cursor.execute(
+                    f"DELETE FROM {table} WHERE {dish_column} = %s "
+                    f"AND {cook_column} IN ({_placeholders(list(removed))})",
+                    [dish.pk, *removed],
+                )
+                _send("post_remove", dish, removed, using)
+
+        if added:
+            _send("pre_add", dish, added, using)
+            added = insert_assignments(dish.pk, sorted(added), using)
+            _send("post_add", dish, added, using)
+
+    return added, removed
+
+
+def cook_dishes(cook_pk: int) -> QuerySet:
+    """The dishes of a cook as ``values()`` rows of ``dish_id``, ``name``
+    and ``dish_type``, read from the through table so that ordering by
+    ``COOK_DISHES_ORDERING`` needs no sort."""
+    return Dish.cooks.through.objects.filter(cook_id=cook_pk).values(
+        "id",
+        "dish_id",
+        name=F("dish__name"),
+        dish_type=F("dish__dish_type__name"),
+    )
+
+
+def _other(model: type[Model]) -> type[Model]:
+    return Cook if model is Dish else Dish
+
+
+def _model_of(instance: Dish | Cook) -> type[Model]:
+    return Dish if isinstance(instance, Dish) else Cook
+
+
+def _increment(model: type[Model], delta: int) -> dict[str, Any]:
+    field = model.assignment_count_field
+    # The assignment shows on the pages of both sides: the same UPDATE
+    # bumps their versions (see ``restaurant.caching``).
+    version = {"version": F("version") + 1}
+    if delta < 0:
+        # A count that drifted low must not fail the write that removes the
+        # assignment; repair_assignment_counts fixes it later.
+        return {field: Greatest(F(field) + delta, 0), **version}
+    return {field: F(field) + delta, **version}
+
+
+def count_added(instance: Dish | Cook, pk_set: set[int]) -> None:
+    """Count new assignments of ``instance`` to the ``pk_set`` rows of the
+    other model, in the transaction that added them."""
+    model = _model_of(instance)
+    _other(model).objects.filter(pk__in=pk_set).update(
+        **_increment(_other(model), 1)
+    )
+    model.objects.filter(pk=instance.pk).update(
+        **_increment(model, len(pk_set))
+    )
+
+
+def count_removed(
+        instance: Dish | Cook, pk_set: set[int] | None = None
+) -> None:
+    """Uncount the assignments of ``instance`` to ``pk_set`` (all of them
+    when ``None``); call it before they are deleted.
+
+    Only rows that are still assigned are decremented, as ``remove()``
+    reports every id it was given.
+    """
+    model = _model_of(instance)
+    other = _other(model)
+    rows = other.objects.filter(**{SIDES[model][1]: instance.pk})
+    if pk_set is not None:
+        rows = rows.filter(pk__in=pk_set)
+    removed = rows.update(**_increment(other, -1))
+    if removed:
+        model.objects.filter(pk=instance.pk).update(
+            **_increment(model, -removed)
+        )
+
+
+def uncount_dishes(dishes: QuerySet) -> None:
+    """Uncount the assignments of ``dishes`` from their cooks, with one
+    UPDATE however many there are; call it before they are deleted."""
+    assigned = Dish.cooks.through.objects.filter(dish__in=dishes)
+    per_cook = Subquery(
+        assigned.filter(cook_id=OuterRef("pk"))
+        .order_by()
+        .values("cook_id")
+        .annotate(count=Count("*"))
+        .values("count")
+    )
+    Cook.objects.filter(pk__in=assigned.values("cook_id")).update(
+        dish_count=Greatest(F("dish_count") - per_cook, 0),
+        version=F("version") + 1,
+    )
+
+
+def recount(model: type[Model]) -> int:
+    """Rewrite the wrong assignment counts of ``model`` from the through
+    table; return how many rows were fixed."""
+    column = SIDES[model][0]
+    actual = Coalesce(
+        Subquery(
+            Dish.cooks.through.objects.filter(**{column: OuterRef("pk")})
+            .order_by()
+            .values(column)
+            .annotate(count=Count("*"))
+            .values("count")
+        ),
+        Value(0),
+    )
+    field = model.assignment_count_field
+    return model.objects.alias(actual=actual).exclude(
+        **{field: F("actual")}
+    ).update(**{field: actual})
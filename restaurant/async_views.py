@@ -0,0 +1,200 @@
+from functools import wraps
+from typing import Any, Callable
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.views import redirect_to_login
+from django.core.cache import cache
+from django.core.exceptions import ObjectDoesNotExist
+from django.core.handlers.asgi import ASGIRequest
+from django.core.paginator import InvalidPage, Paginator
+from django.db.models import QuerySet
+from django.forms import Form
+from django.http import Http404, HttpResponse
+from django.template.response import TemplateResponse
+
+from restaurant import counters, visits
+from restaurant.forms import CookSearchForm, DishSearchForm, DishTypeSearchForm
+from restaurant.pagination import (
+    CURSOR_PARAM,
+    InvalidCursor,
+    KeysetPage,
+    KeysetPaginationMixin,
+    KeysetPaginator,
+)
+from restaurant.search import search
+from restaurant.views import (
+    CookDetailView,
+    CookListView,
+    DishDetailView,
+    DishListView,
+    DishTypeListView,
+)
+
+
+def async_login_required(view: Callable) -> Callable:
+    @wraps(view)
+    async def wrapper(
+            request: ASGIRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        # Resolving the lazy user hits the session and user tables; do it
+        # once here so templates can use ``request.user`` without queries.
+        is_authenticated = await sync_to_async(
+            lambda: request.user.is_authenticated
+        )()
+        if not is_authenticated:
+            return redirect_to_login(request.get_full_path())
+        return await view(request, *args, **kwargs)
+
+    return wrapper
+
+
+@async_login_required
+async def index(request: ASGIRequest) -> HttpResponse:
+    context = {
+        **await counters.aget_counts(),
+        "num_visits": await sync_to_async(visits.record_visit)(
+            request.user.pk
+        ),
+    }
+
+    return TemplateResponse(request, "restaurant/index.html", context)
+
+
+async def _list_context(
+        request: ASGIRequest,
+        view: KeysetPaginationMixin,
+        queryset: QuerySet,
+        context_object_name: str,
+) -> dict[str, Any]:
+    # The sync view's choices, so both serve the same pages.
+    paginate_by = view.paginate_by
+    if view.is_ranked(queryset):
+        # Ranked search results keep numbered pages, as in the sync views.
+        paginator = Paginator(queryset, paginate_by)
+        try:
+            page = await sync_to_async(paginator.page)(
+                request.GET.get("page") or 1
+            )
+        except InvalidPage as error:
+            raise Http404(str(error))
+        object_list = await sync_to_async(list)(page.object_list)
+    else:
+        paginator = KeysetPaginator(
+            queryset, paginate_by, view.get_keyset_ordering(queryset),
+        )
+        try:
+            page = paginator.page(request.GET.get(CURSOR_PARAM))
+        except InvalidCursor:
+            raise Http404("Invalid cursor.")
+        await page.aevaluate()
+        object_list = page.object_list
+
+    return {
+        "paginator": paginator,
+        "page_obj": page,
+        "is_paginated": page.has_other_pages(),
+        "object_list": object_list,
+        context_object_name: object_list,
+    }
+
+
+async def _list_response(
+        request: ASGIRequest,
+        view_class: type,
+        template_name: str,
+        context_object_name: str,
+        search_form: Form,
+        search_field: str,
+) -> TemplateResponse:
+    view = view_class(request=request)
+    queryset = view_class.queryset
+    if search_form.is_valid():
+        queryset = search(queryset, search_form.cleaned_data[search_field])
+
+    context = await _list_context(
+        request, view, queryset, context_object_name,
+    )
+    context["sort"] = view.get_sort()
+    context["search_form"] = type(search_form)(
+        initial={search_field: request.GET.get(search_field, "")}
+    )
+    return TemplateResponse(request, template_name, context)
+
+
+@async_login_required
+async def dish_type_list(request: ASGIRequest) -> HttpResponse:
+    return await _list_response(
+        request,
+        DishTypeListView,
+        "restaurant/dish_type_list.html",
+        "dish_type_list",
+        DishTypeSearchForm(request.GET),
+        "name",
+    )
+
+
+@async_login_required
+async def dish_list(request: ASGIRequest) -> HttpResponse:
+    return await _list_response(
+        request,
+        DishListView,
+        "restaurant/dish_list.html",
+        "dish_list",
+        DishSearchForm(request.GET),
+        "name",
+    )
+
+
+@async_login_required
+async def cook_list(request: ASGIRequest) -> HttpResponse:
+    return await _list_response(
+        request,
+        CookListView,
+        "restaurant/cook_list.html",
+        "cook_list",
+        CookSearchForm(request.GET),
+        "username",
+    )
+
+
+async def _detail_response(
+        request: ASGIRequest, view_class: type, pk: int
+) -> HttpResponse:
+    view = view_class(request=request, kwargs={"pk": pk})
+    key = await view.aget_page_cache_key(request)
+    if key is not None:
+        content = await cache.aget(key)
+        if content is not None:
+            return HttpResponse(content)
+
+    try:
+        view.object = await view.get_queryset().aget(pk=pk)
+    except ObjectDoesNotExist:
+        raise Http404("No object found matching the query.")
+
+    context = view.get_context_data(object=view.object)
+    # Pages in the context, such as a cook's dishes, are still lazy.
+    for value in context.values():
+        if isinstance(value, KeysetPage):
+            await value.aevaluate()
+
+    response = TemplateResponse(
+        request, view.get_template_names(), context,
+    )
+    if key is not None:
+        response.add_post_render_callback(
+            lambda rendered: cache.set(
+                key, rendered.content, view.cache_timeout
+            )
+        )
+    return response
+
+
+@async_login_required
+async def dish_detail(request: ASGIRequest, pk: int) -> HttpResponse:
+    return await _detail_response(request, DishDetailView, pk)
+
+
+@async_login_required
+async def cook_detail(request: ASGIRequest, pk: int) -> HttpResponse:
+    return await _detail_response(request, CookDetailView, pk)
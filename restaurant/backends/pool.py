@@ -0,0 +1,218 @@
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable
+
+from django.db import OperationalError
+
+DEFAULT_MAX_SIZE = 10
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_MAX_LIFETIME = 30 * 60
+
+
+class PoolTimeout(OperationalError):
+    pass
+
+
+def ping(connection: Any) -> bool:
+    try:
+        cursor = connection.cursor()
+        try:
+            cursor.execute("SELECT 1")
+        finally:
+            cursor.close()
+    except Exception:
+        return False
+    return True
+
+
+class ConnectionPool:
+    """A bounded, thread-safe pool of raw DB-API connections.
+
+    Idle connections are reused most-recently-returned first, checked with
+    ``health_check`` before being handed out and replaced once they are
+    older than ``max_lifetime`` seconds. ``acquire`` blocks for up to
+    ``timeout`` seconds when ``max_size`` connections are checked out.
+    """
+
+    def __init__(
+            self,
+            max_size: int = DEFAULT_MAX_SIZE,
+            timeout: float = DEFAULT_TIMEOUT,
+            max_lifetime: float = DEFAULT_MAX_LIFETIME,
+            health_check: Callable[[Any], bool] | None = ping,
+    ) -> None:
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.health_check = health_check
+        self._idle = deque()
+        self._created_at = {}
+        self._size = 0
+        self._checked_out = 0
+        self._available = threading.Condition()
+        self.counters = dict.fromkeys(
+            (
+                "connections_created",
+                "connections_reused",
+                "connections_closed",
+                "health_check_failures",
+                "waits",
+                "timeouts",
+            ),
+            0,
+        )
+        self.wait_seconds = 0.0
+
+    def acquire(self, connect: Callable[[], Any]) -> Any:
+        """A pooled connection, or a new one from ``connect``."""
+        start = time.monotonic()
+        with self._available:
+            while not self._idle and self._size >= self.max_size:
+                remaining = start + self.timeout - time.monotonic()
+                if remaining <= 0:
+                    self.counters["timeouts"] += 1
+                    raise PoolTimeout(
+                        f"No database connection available within "
+                        f"{self.timeout}s ({self.max_size} in use)."
+                    )
+                self.counters["waits"] += 1
+                self._available.wait(remaining)
+            self.wait_seconds += time.monotonic() - start
+
+            connection = self._idle.pop() if self._idle else None
+            if connection is None:
+                self._size += 1
+            self._checked_out += 1
+
+        if connection is not None:
+            if self._is_healthy(connection):
+                self._count("connections_reused")
+                return connection
+            self._discard(connection)
+            with self._available:
+                self._size += 1
+
+        try:
+            connection = connect()
+        except Exception:
+            with self._available:
+                self._size -= 1
+                self._checked_out -= 1
+                self._available.notify()
+            raise
+        self._created_at[id(connection)] = time.monotonic()
+        self._count("connections_created")
+        return connection
+
+    def release(self, connection: Any, reusable: bool = True) -> None:
+        if not reusable:
+            self._discard(connection)
+        with self._available:
+            self._checked_out -= 1
+            if reusable:
+                self._idle.append(connection)
+            self._available.notify()
+
+    def _is_healthy(self, connection: Any) -> bool:
+        age = time.monotonic() - self._created_at.get(id(connection), 0)
+        if age > self.max_lifetime:
+            return False
+        if self.health_check is not None and not self.health_check(
+            connection
+        ):
+            self._count("health_check_failures")
+            return False
+        return True
+
+    def _count(self, name: str) -> None:
+        with self._available:
+            self.counters[name] += 1
+
+    def _discard(self, connection: Any) -> None:
+        self._created_at.pop(id(connection), None)
+        try:
+            connection.close()
+        except Exception:
+            pass
+        with self._available:
+            self._size -= 1
+            self.counters["connections_closed"] += 1
+
+    def close(self) -> None:
+        with self._available:
+            idle, self._idle = list(self._idle), deque()
+        for connection in idle:
+            self._discard(connection)
+
+    def stats(self) -> dict[str, Any]:
+        with self._available:
+            return {
+                "max_size": self.max_size,
+                "size": self._size,
+                "idle": len(self._idle),
+                "checked_out": self._checked_out,
+                **self.counters,
+                "wait_ms": round(self.wait_seconds * 1000, 2),
+            }
+
+
+_pools: dict[tuple[int, str], ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(alias: str, options: dict[str, Any]) -> ConnectionPool:
+    # Keyed by pid too: a forked worker must not share its parent's sockets.
+    key = (os.getpid(), alias)
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = ConnectionPool(
+                max_size=options.get("MAX_SIZE", DEFAULT_MAX_SIZE),
+                timeout=options.get("TIMEOUT", DEFAULT_TIMEOUT),
+                max_lifetime=options.get(
+                    "MAX_LIFETIME", DEFAULT_MAX_LIFETIME
+                ),
+                health_check=(
+                    ping if options.get("HEALTH_CHECKS", True) else None
+                ),
+            )
+        return _pools[key]
+
+
+def pool_stats() -> dict[str, dict[str, Any]]:
+    pid = os.getpid()
+    with _pools_lock:
+        pools = {
+            alias: pool for (owner, alias), pool in _pools.items()
+            if owner == pid
+        }
+    return {alias: pool.stats() for alias, pool in pools.items()}
+
+
+class PooledDatabaseWrapperMixin:
+    """Borrow raw connections from a per-process pool instead of opening
+    one per request; closing the wrapper hands the connection back.
+
+    Configured by the ``POOL`` dict of the database settings: ``MAX_SIZE``,
+    ``TIMEOUT``, ``MAX_LIFETIME`` and ``HEALTH_CHECKS``.
+    """
+
+    @property
+    def pool(self) -> ConnectionPool:
+        return get_pool(self.alias, self.settings_dict.get("POOL", {}))
+
+    def get_new_connection(self, conn_params: dict[str, Any]) -> Any:
+        return self.pool.acquire(
+            lambda: super(PooledDatabaseWrapperMixin, self).get_new_connection(
+                conn_params
+            )
+        )
+
+    def _close(self) -> None:
+        if self.connection is None:
+            return
+        # A connection left mid-transaction may hold locks; drop it.
+        reusable = not self.in_atomic_block and self.autocommit
+        with self.wrap_database_errors:
+            self.pool.release(self.connection, reusable)
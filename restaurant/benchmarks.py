@@ -0,0 +1,377 @@
+import random
+import statistics
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Model
+from django.db.models.signals import post_delete
+from django.test import Client, override_settings
+from django.urls import URLPattern, reverse
+
+from restaurant import reports
+from restaurant.assignments import set_dish_cooks
+from restaurant.menu import COOK, DISH, DISH_TYPE, import_menu
+from restaurant.middleware import QueryTimer
+from restaurant.models import Cook, Dish, DishType
+
+WORDS = (
+    "apple", "beef", "braised", "chilled", "crispy", "gazpacho", "lamb",
+    "pie", "pork", "pumpkin", "risotto", "roast", "soup", "spanish", "tart",
+)
+FIRST_NAMES = ("Anna", "Jamie", "Mary", "Nigella", "Pierre", "Yotam")
+LAST_NAMES = ("Berry", "Lawson", "Oliver", "Ottolenghi", "Ramsay", "White")
+
+# Allowed growth over the baseline before a measure counts as a regression.
+# Small absolute changes are noise on any machine, whatever the ratio.
+MIN_DELTA = {"ms": 5.0, "peak_kb": 64.0}
+
+
+@contextmanager
+def test_database(verbosity: int = 0) -> Iterator[None]:
+    """Run the block against a throwaway, fully migrated test database."""
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(
+        verbosity=verbosity, autoclobber=True, serialize=False,
+    )
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity)
+        # SQLite ignores close() on in-memory databases, which would keep
+        # this one alive for the next block; the name is restored by now.
+        connection.close()
+
+
+def median_ms(func: Callable[[], Any], repeat: int = 5) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(timings)
+
+
+def kitchen_records(
+        dishes: int,
+        cooks: int,
+        assignments: int,
+        dish_types: int = 20,
+        seed: int = 0,
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Synthetic menu records for ``import_menu``; the same arguments
+    always produce the same records."""
+    rng = random.Random(seed)
+    dish_types = max(dish_types, 1)
+
+    # ``assignments`` distinct (dish, cook) pairs, drawn without replacement.
+    dish_cooks = defaultdict(list)
+    pairs = rng.sample(range(dishes * cooks), min(assignments, dishes * cooks))
+    for pair in sorted(pairs):
+        dish_cooks[pair // cooks].append(f"cook{pair % cooks:06}")
+
+    for number in range(dish_types):
+        yield DISH_TYPE, {"name": f"Type {number:03}"}
+
+    for number in range(cooks):
+        yield COOK, {
+            "username": f"cook{number:06}",
+            "first_name": rng.choice(FIRST_NAMES),
+            "last_name": rng.choice(LAST_NAMES),
+            "years_of_experience": rng.randint(0, 40),
+        }
+
+    for number in range(dishes):
+        yield DISH, {
+            "name": f"{' '.join(rng.sample(WORDS, 3)).upper()} {number}",
+            "description": " ".join(rng.choices(WORDS, k=12)).capitalize(),
+            "price": f"{rng.randint(100, 9_999) / 100:.2f}",
+            "dish_type": f"Type {rng.randrange(dish_types):03}",
+            "cooks": dish_cooks.pop(number, []),
+        }
+
+
+def seed_kitchen(
+        dishes: int,
+        cooks: int,
+        assignments: int,
+        dish_types: int = 20,
+        seed: int = 0,
+        batch_size: int = 1_000,
+) -> dict[str, int]:
+    return import_menu(
+        kitchen_records(dishes, cooks, assignments, dish_types, seed),
+        batch_size,
+    )
+
+
+# The model whose primary key each parameterised route takes.
+ROUTE_MODELS = {
+    "dish-type-update": DishType,
+    "dish-type-delete": DishType,
+    "dish-detail": Dish,
+    "dish-update": Dish,
+    "dish-delete": Dish,
+    "cook-detail": Cook,
+    "cook-update": Cook,
+    "cook-delete": Cook,
+    "api-dish-type-detail": DishType,
+    "api-dish-detail": Dish,
+    "api-cook-detail": Cook,
+    "api-cook-dishes": Cook,
+}
+# Routes that change data: timing them repeatedly would measure (and
+# undo) writes, so the read benchmark leaves them out.
+WRITE_ROUTES = {"assign-cook"}
+
+
+def _route_model(name: str) -> type[Model]:
+    try:
+        return ROUTE_MODELS[name]
+    except KeyError:
+        raise LookupError(
+            f"Add the model of route {name!r} to ROUTE_MODELS."
+        ) from None
+
+
+def _route_url(pattern: URLPattern) -> str:
+    kwargs = {}
+    if "pk" in pattern.pattern.converters:
+        pks = _route_model(pattern.name).objects.order_by("pk").values_list(
+            "pk", flat=True
+        )
+        kwargs["pk"] = pks[pks.count() // 2]
+    return reverse(f"restaurant:{pattern.name}", kwargs=kwargs)
+
+
+def benchmark_routes(repeat: int = 5) -> dict[str, dict[str, Any]]:
+    """GET every read-only route of ``restaurant.urls`` as a staff user.
+
+    ``queries`` and ``peak_kb`` come from one request on a cold cache;
+    ``ms`` is the median of ``repeat`` further (warm) requests. Detail
+    routes use the middle row of their model, and streamed responses are
+    consumed in full.
+    """
+    from restaurant.urls import urlpatterns
+
+    user = get_user_model().objects.create_user(
+        username="benchmark", password="benchmark", is_staff=True,
+    )
+    client = Client()
+    client.force_login(user)
+
+    def fetch(url: str) -> int:
+        response = client.get(url)
+        if response.streaming:
+            for _ in response.streaming_content:
+                pass
+        return response.status_code
+
+    results = {}
+    # Production settings: with DEBUG every query is also kept in
+    # ``connection.queries_log``, which skews the memory peaks.
+    with override_settings(
+        DEBUG=False,
+        ALLOWED_HOSTS=["testserver"],
+        RESTAURANT_QUERY_DETECTOR_RAISE=False,
+        RESTAURANT_QUERY_DETECTOR_SAMPLE_RATE=0.0,
+    ):
+        for pattern in urlpatterns:
+            if pattern.name in WRITE_ROUTES:
+                continue
+            url = _route_url(pattern)
+            # Compile templates and import lazily loaded modules first.
+            fetch(url)
+            cache.clear()
+
+            queries = QueryTimer()
+            tracemalloc.start()
+            with connection.execute_wrapper(queries):
+                status = fetch(url)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            results[pattern.name] = {
+                "status": status,
+                "ms": round(median_ms(lambda: fetch(url), repeat), 2),
+                "queries": queries.count,
+                "peak_kb": round(peak / 1024, 1),
+            }
+
+    return results
+
+
+def _measure(
+        func: Callable[[], Any], reset: Callable[[], Any], repeat: int
+) -> dict[str, Any]:
+    """Median time of ``func`` after ``reset`` and its query count."""
+    timings = []
+    for _ in range(repeat):
+        reset()
+        queries = QueryTimer()
+        start = time.perf_counter()
+        with connection.execute_wrapper(queries):
+            func()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return {"ms": round(statistics.median(timings), 2), "queries": queries.count}
+
+
+# With DEBUG, the cursor wrapper renders every statement with its
+# parameters, which dwarfs the queries that pass thousands of ids.
+@override_settings(DEBUG=False)
+def benchmark_assignments(
+        assignments: int = 10_000, repeat: int = 5
+) -> dict[str, dict[str, dict[str, Any]]]:
+    """Time changes to a dish with ``assignments`` cooks (and deletes of a
+    cook with as many dishes), old way against new.
+
+    Edits compare ``dish.cooks.set()`` with ``set_dish_cooks``; deletes
+    compare the collector's fast path with the row-by-row path it takes
+    once the through model has a delete receiver.
+    """
+    through = Dish.cooks.through
+    seed_kitchen(
+        dishes=assignments, cooks=assignments * 3 // 2, assignments=0,
+    )
+    cook_ids = list(Cook.objects.order_by("pk").values_list("pk", flat=True))
+    dish_ids = list(Dish.objects.order_by("pk").values_list("pk", flat=True))
+    assigned, spare = cook_ids[:assignments], cook_ids[assignments:]
+    dish = Dish.objects.get(pk=dish_ids[0])
+
+    def assign_all() -> None:
+        through.objects.filter(dish_id=dish.pk).delete()
+        through.objects.bulk_create(
+            [through(dish_id=dish.pk, cook_id=pk) for pk in assigned]
+        )
+
+    targets = {
+        "add one": assigned + spare[:1],
+        "remove one": assigned[1:],
+        "replace half": assigned[len(assigned) // 2:] + spare,
+        "clear": [],
+    }
+    results = {}
+    for name, target in targets.items():
+        results[name] = {
+            "set()": _measure(
+                lambda: dish.cooks.set(target), assign_all, repeat,
+            ),
+            "set_dish_cooks": _measure(
+                lambda: set_dish_cooks(dish, target), assign_all, repeat,
+            ),
+        }
+
+    victims = {}
+
+    def new_dish() -> None:
+        victims["dish"] = Dish.objects.create(
+            name="BENCHMARK", description="", price=1,
+            dish_type_id=dish.dish_type_id,
+        )
+        through.objects.bulk_create(
+            [through(dish_id=victims["dish"].pk, cook_id=pk) for pk in assigned]
+        )
+
+    def new_cook() -> None:
+        victims["cook"] = Cook.objects.create(
+            username=f"benchmark{len(victims)}{time.perf_counter_ns()}"
+        )
+        through.objects.bulk_create(
+            [through(dish_id=pk, cook_id=victims["cook"].pk) for pk in dish_ids]
+        )
+
+    def receiver(**kwargs: Any) -> None:
+        pass
+
+    for name, reset in (("delete dish", new_dish), ("delete cook", new_cook)):
+        victim = name.split()[1]
+        results[name] = {
+            "fast path": _measure(
+                lambda: victims[victim].delete(), reset, repeat,
+            ),
+        }
+        post_delete.connect(receiver, sender=through)
+        try:
+            results[name]["row by row"] = _measure(
+                lambda: victims[victim].delete(), reset, repeat,
+            )
+        finally:
+            post_delete.disconnect(receiver, sender=through)
+
+    return results
+
+
+def benchmark_reports(repeat: int = 5) -> dict[str, Any]:
+    """Time ``reports.refresh`` and the reports page it feeds, against
+    computing the reports on every request."""
+    user = get_user_model().objects.create_user(
+        username="benchmark-reports", password="benchmark",
+    )
+    client = Client()
+    client.force_login(user)
+    url = reverse("restaurant:reports")
+
+    def compute() -> None:
+        for build in reports.REPORTS.values():
+            list(build())
+
+    with override_settings(
+        DEBUG=False,
+        ALLOWED_HOSTS=["testserver"],
+        RESTAURANT_QUERY_DETECTOR_SAMPLE_RATE=0.0,
+    ):
+        refresh_ms = median_ms(reports.refresh, repeat)
+        # Compile the template first.
+        client.get(url)
+        queries = QueryTimer()
+        with connection.execute_wrapper(queries):
+            client.get(url)
+
+        return {
+            "refresh_ms": round(refresh_ms, 2),
+            "live_ms": round(median_ms(compute, repeat), 2),
+            "page_ms": round(median_ms(lambda: client.get(url), repeat), 2),
+            "page_queries": queries.count,
+        }
+
+
+def compare_to_baseline(
+        results: dict[str, dict[str, dict[str, Any]]],
+        baseline: dict[str, dict[str, dict[str, Any]]],
+        tolerance: float = 0.5,
+) -> list[str]:
+    """Describe every route measure of ``results`` (scale -> route ->
+    measures) that regressed against ``baseline``.
+
+    Any extra query is a regression; latency and memory must grow by more
+    than ``tolerance`` and by more than ``MIN_DELTA``.
+    """
+    regressions = []
+    for scale, routes in results.items():
+        for name, result in routes.items():
+            base = baseline.get(scale, {}).get(name)
+            if base is None:
+                continue
+
+            if result["queries"] > base["queries"]:
+                regressions.append(
+                    f"{name} @ {scale}: queries {base['queries']} -> "
+                    f"{result['queries']}"
+                )
+            for measure, min_delta in MIN_DELTA.items():
+                limit = max(
+                    base[measure] * (1 + tolerance), base[measure] + min_delta
+                )
+                if result[measure] > limit:
+                    regressions.append(
+                        f"{name} @ {scale}: {measure} {base[measure]} -> "
+                        f"{result[measure]}"
+                    )
+    return regressions
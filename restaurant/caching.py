@@ -0,0 +1,144 @@
+import hashlib
+import time
+from typing import Any
+
+from django.core.cache import cache
+from django.db.models import F, Model, QuerySet
+from django.http import HttpRequest, HttpResponse
+from django.middleware.csrf import get_token
+
+from restaurant.models import ChangeStamp, Cook, Dish, DishType
+
+PAGE_PREFIX = "restaurant:page:"
+
+
+def _labels(models: tuple[type[Model], ...]) -> list[str]:
+    return [model._meta.label_lower for model in models]
+
+
+def _new_stamps(labels: set[str]) -> list[ChangeStamp]:
+    now = time.time()
+    return [ChangeStamp(label=label, stamp=now) for label in labels]
+
+
+def get_stamps(*models: type[Model]) -> dict[str, float]:
+    """Last-change timestamps of ``models``, keyed by model label.
+
+    The stamps are ``ChangeStamp`` rows, shared by every worker. A model
+    that has never been stamped is stamped now, which conservatively
+    invalidates everything derived from it.
+    """
+    stamps = ChangeStamp.objects.filter(label__in=_labels(models))
+    found = dict(stamps.values_list("label", "stamp"))
+
+    missing = set(_labels(models)) - found.keys()
+    if missing:
+        # Ignoring conflicts keeps a stamp that a concurrent request wrote.
+        ChangeStamp.objects.bulk_create(
+            _new_stamps(missing), ignore_conflicts=True
+        )
+        found = dict(stamps.values_list("label", "stamp"))
+
+    return found
+
+
+def touch(*models: type[Model]) -> None:
+    """Stamp ``models`` as changed now.
+
+    Called inside the writing transaction: the new stamp becomes visible
+    with the new rows, so no request caches old rows under it.
+    """
+    now = time.time()
+    ChangeStamp.objects.bulk_create(
+        [ChangeStamp(label=label, stamp=now) for label in _labels(models)],
+        update_conflicts=True,
+        unique_fields=["label"],
+        update_fields=["stamp"],
+    )
+
+
+def bump(queryset: QuerySet) -> None:
+    """Bump the page version of the ``queryset`` rows."""
+    queryset.update(version=F("version") + 1)
+
+
+def bump_pages(instance: Cook | Dish | DishType) -> None:
+    """Bump the versions of the pages that show ``instance``: its own and
+    those of the dishes or cooks listing it.
+
+    Assignments are not covered here: their count updates already bump
+    both sides (see ``restaurant.assignments``).
+    """
+    if isinstance(instance, DishType):
+        dishes = Dish.objects.filter(dish_type=instance)
+        bump(Cook.objects.filter(dishes__in=dishes))
+        bump(dishes)
+    elif isinstance(instance, Dish):
+        bump(Dish.objects.filter(pk=instance.pk))
+        bump(Cook.objects.filter(dishes=instance))
+    else:
+        bump(Cook.objects.filter(pk=instance.pk))
+        bump(Dish.objects.filter(cooks=instance))
+
+
+class CachedPageMixin:
+    """Cache a detail page's rendered HTML per user.
+
+    The key includes the ``version`` of the page's object, which every
+    change shown on the page bumps, and the user's name, shown in the
+    sidebar; on a hit neither the ORM nor the template engine runs. Only the version is read from the database, so the pages
+    themselves may sit in a per-process cache.
+    """
+
+    cache_timeout = 60 * 10
+
+    def _page_cache_key(
+            self, request: HttpRequest, version: int | None
+    ) -> str | None:
+        if version is None:
+            # Missing: the view raises its own 404.
+            return None
+
+        # Pages embed a CSRF token, which is only valid for the secret in
+        # the client's cookie (it changes on login): cache per secret.
+        get_token(request)
+        parts = [
+            type(self).__name__,
+            request.get_full_path(),
+            str(request.user.pk),
+            request.user.get_username(),
+            request.META["CSRF_COOKIE"],
+            str(version),
+        ]
+        digest = hashlib.md5(":".join(parts).encode()).hexdigest()
+        return f"{PAGE_PREFIX}{digest}"
+
+    def _versions(self) -> QuerySet:
+        return self.model.objects.filter(pk=self.kwargs["pk"]).values_list(
+            "version", flat=True
+        )
+
+    def get_page_cache_key(self, request: HttpRequest) -> str | None:
+        return self._page_cache_key(request, self._versions().first())
+
+    async def aget_page_cache_key(self, request: HttpRequest) -> str | None:
+        return self._page_cache_key(
+            request, await self._versions().afirst()
+        )
+
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+        key = self.get_page_cache_key(request)
+        if key is None:
+            return super().get(request, *args, **kwargs)
+
+        content = cache.get(key)
+        if content is not None:
+            return HttpResponse(content)
+
+        response = super().get(request, *args, **kwargs)
+        response.add_post_render_callback(
+            lambda rendered: cache.set(
+                key, rendered.content, self.cache_timeout
+            )
+        )
+        return response
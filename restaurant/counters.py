@@ -0,0 +1,99 @@
+from typing import Iterable
+
+from django.db.models import F, Model
+
+from restaurant.models import Cook, Counter, Dish, DishType
+
+COUNTED_MODELS = {
+    "num_cooks": Cook,
+    "num_dish_types": DishType,
+    "num_dishes": Dish,
+}
+
+
+def _name_for(model: type[Model]) -> str:
+    for name, counted_model in COUNTED_MODELS.items():
+        if counted_model is model:
+            return name
+    raise LookupError(f"{model.__name__} has no counter.")
+
+
+def _stored() -> dict[str, int]:
+    return dict(
+        Counter.objects.filter(name__in=COUNTED_MODELS)
+        .values_list("name", "value")
+    )
+
+
+def get_counts() -> dict[str, int]:
+    counts = _stored()
+    missing = COUNTED_MODELS.keys() - counts.keys()
+    if missing:
+        counts.update(_fill(missing))
+
+    return counts
+
+
+async def aget_counts() -> dict[str, int]:
+    counts = {
+        name: value
+        async for name, value in Counter.objects.filter(
+            name__in=COUNTED_MODELS
+        ).values_list("name", "value")
+    }
+
+    # Counted one after another: the async ORM runs every query on the
+    # same thread anyway, and gathering thread-sensitive calls deadlocks
+    # under sync middleware (async_to_sync) on asgiref 3.5.
+    missing = COUNTED_MODELS.keys() - counts.keys()
+    for name in missing:
+        counts[name] = await COUNTED_MODELS[name].objects.acount()
+    if missing:
+        await Counter.objects.abulk_create(
+            [Counter(name=name, value=counts[name]) for name in missing],
+            ignore_conflicts=True,
+        )
+
+    return counts
+
+
+def _fill(names: Iterable[str]) -> dict[str, int]:
+    counts = {name: COUNTED_MODELS[name].objects.count() for name in names}
+    # Ignoring conflicts never overwrites a row that a concurrent fill
+    # created and an increment may already have changed.
+    Counter.objects.bulk_create(
+        [Counter(name=name, value=count) for name, count in counts.items()],
+        ignore_conflicts=True,
+    )
+    return counts
+
+
+def adjust(model: type[Model], delta: int) -> None:
+    """Add ``delta`` to the counter of ``model``.
+
+    Called inside the transaction that creates or deletes the row, so the
+    total commits (or rolls back) with it. Without a stored counter this
+    does nothing: the next read fills it from the table.
+    """
+    Counter.objects.filter(name=_name_for(model)).update(
+        value=F("value") + delta
+    )
+
+
+def reconcile() -> dict[str, tuple[int | None, int]]:
+    stored = _stored()
+    actual = {
+        name: model.objects.count() for name, model in COUNTED_MODELS.items()
+    }
+    Counter.objects.bulk_create(
+        [Counter(name=name, value=value) for name, value in actual.items()],
+        update_conflicts=True,
+        unique_fields=["name"],
+        update_fields=["value"],
+    )
+
+    return {
+        name: (stored.get(name), value)
+        for name, value in actual.items()
+        if stored.get(name) != value
+    }
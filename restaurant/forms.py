@@ -1,10 +1,16 @@
+from typing import Any
+
 from django import forms
-from django.contrib.auth import get_user_model
 from django.contrib.auth.forms import UserCreationForm
+from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator
+from django.urls import reverse_lazy
 
+from restaurant.assignments import set_dish_cooks
 from restaurant.models import Cook, Dish
 
+COOK_PICKER_FIELDS = ("id", "username", "first_name", "last_name")
+
 
 class CookCreationForm(UserCreationForm):
     class Meta(UserCreationForm.Meta):
@@ -28,16 +34,134 @@ class CookYearsOfExperienceUpdateForm(forms.ModelForm):
         fields = ("years_of_experience",)
 
 
+class CookPicker(forms.Widget):
+    """Checkboxes for the selected cooks only, plus a search box that adds
+    more from the cook autocomplete endpoint, one page at a time."""
+
+    template_name = "restaurant/widgets/cook_picker.html"
+    allow_multiple_selected = True
+
+    def __init__(
+            self,
+            attrs: dict[str, Any] | None = None,
+            url: str = reverse_lazy("restaurant:api-cook-autocomplete"),
+    ) -> None:
+        super().__init__(attrs)
+        self.url = url
+
+    def format_value(self, value: Any) -> list[str]:
+        if value is None:
+            return []
+        if not isinstance(value, (list, tuple)):
+            value = [value]
+        return [str(pk) for pk in value]
+
+    def value_from_datadict(
+            self, data: Any, files: Any, name: str
+    ) -> list[str]:
+        try:
+            getter = data.getlist
+        except AttributeError:
+            getter = data.get
+        return getter(name)
+
+    def value_omitted_from_data(self, data: Any, files: Any, name: str) -> bool:
+        # Like any checkbox list, nothing checked submits nothing.
+        return False
+
+    def get_context(
+            self, name: str, value: Any, attrs: dict[str, Any] | None
+    ) -> dict[str, Any]:
+        context = super().get_context(name, value, attrs)
+        pks = [pk for pk in context["widget"]["value"] if pk.isdigit()]
+        context["widget"]["url"] = str(self.url)
+        context["widget"]["selected"] = (
+            Cook.objects.filter(pk__in=pks)
+            .order_by("username")
+            .values(*COOK_PICKER_FIELDS)
+            if pks else []
+        )
+        return context
+
+
+class CookMultipleChoiceField(forms.Field):
+    """Cook primary keys, checked against the database in one query.
+
+    Unlike ``ModelMultipleChoiceField`` it never loads the cooks themselves:
+    ``clean`` returns the list of pks.
+    """
+
+    widget = CookPicker
+    default_error_messages = {
+        "invalid_list": "Enter a list of values.",
+        "invalid_choice": (
+            "Select a valid choice. %(value)s is not one of the available "
+            "choices."
+        ),
+        "invalid_pk_value": "“%(pk)s” is not a valid value.",
+    }
+
+    def to_python(self, value: Any) -> list[int]:
+        if not value:
+            return []
+        if not isinstance(value, (list, tuple)):
+            raise ValidationError(
+                self.error_messages["invalid_list"], code="invalid_list",
+            )
+        pks = []
+        for pk in value:
+            try:
+                pks.append(int(pk))
+            except (TypeError, ValueError):
+                raise ValidationError(
+                    self.error_messages["invalid_pk_value"],
+                    code="invalid_pk_value",
+                    params={"pk": pk},
+                )
+        return list(dict.fromkeys(pks))
+
+    def validate(self, value: list[int]) -> None:
+        super().validate(value)
+        if not value:
+            return
+        found = set(
+            Cook.objects.filter(pk__in=value).values_list("pk", flat=True)
+        )
+        for pk in value:
+            if pk not in found:
+                raise ValidationError(
+                    self.error_messages["invalid_choice"],
+                    code="invalid_choice",
+                    params={"value": pk},
+                )
+
+    def has_changed(self, initial: Any, data: Any) -> bool:
+        if self.disabled:
+            return False
+        initial = {str(pk) for pk in initial or []}
+        data = {str(pk) for pk in data or []}
+        return initial != data
+
+
 class DishForm(forms.ModelForm):
-    cooks = forms.ModelMultipleChoiceField(
-        queryset=get_user_model().objects.all(),
-        widget=forms.CheckboxSelectMultiple,
-        required=False,
-    )
+    cooks = CookMultipleChoiceField(required=False)
 
     class Meta:
         model = Dish
-        fields = "__all__"
+        # Read and written as pks below rather than as Cook rows.
+        exclude = ("cooks",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        if self.instance.pk is not None and "cooks" not in self.initial:
+            self.initial["cooks"] = list(
+                Dish.cooks.through.objects.filter(dish_id=self.instance.pk)
+                .values_list("cook_id", flat=True)
+            )
+
+    def _save_m2m(self) -> None:
+        super()._save_m2m()
+        set_dish_cooks(self.instance, self.cleaned_data["cooks"])
 
 
 class CookSearchForm(forms.Form):
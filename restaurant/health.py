@@ -0,0 +1,88 @@
+import logging
+import time
+from typing import Callable
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.migrations.executor import MigrationExecutor
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY = "restaurant:readyz"
+# Loading the migration graph takes milliseconds, so its result is reused
+# for this many seconds.
+MIGRATIONS_CHECK_INTERVAL = 10
+
+_migrations_checked_at = float("-inf")
+_pending_migrations = 0
+
+
+class NotReady(Exception):
+    pass
+
+
+def check_database() -> None:
+    with connections[DEFAULT_DB_ALIAS].cursor() as cursor:
+        cursor.execute("SELECT 1")
+
+
+def check_cache() -> None:
+    cache.set(CACHE_KEY, 1, timeout=10)
+    cache.get(CACHE_KEY)
+
+
+def pending_migrations() -> int:
+    executor = MigrationExecutor(connections[DEFAULT_DB_ALIAS])
+    return len(executor.migration_plan(executor.loader.graph.leaf_nodes()))
+
+
+def check_migrations() -> None:
+    global _migrations_checked_at, _pending_migrations
+
+    now = time.monotonic()
+    if now - _migrations_checked_at >= MIGRATIONS_CHECK_INTERVAL:
+        _pending_migrations = pending_migrations()
+        _migrations_checked_at = now
+    if _pending_migrations:
+        raise NotReady(f"{_pending_migrations} unapplied migration(s)")
+
+
+CHECKS = {
+    "database": check_database,
+    "cache": check_cache,
+    "migrations": check_migrations,
+}
+
+
+def cache_is_shared() -> bool:
+    return not isinstance(
+        caches[DEFAULT_CACHE_ALIAS], (LocMemCache, DummyCache)
+    )
+
+
+def enabled_checks() -> dict[str, Callable[[], None]]:
+    checks = dict(CHECKS)
+    if not cache_is_shared():
+        # A per-process cache cannot fail apart from the process itself.
+        del checks["cache"]
+    return checks
+
+
+def readiness() -> dict[str, str]:
+    """The outcome of each check: ``"ok"`` or ``"fail"``.
+
+    The endpoint is unauthenticated, so errors are logged, not returned:
+    driver messages can name hosts and databases.
+    """
+    results = {}
+    for name, check in enabled_checks().items():
+        try:
+            check()
+        except Exception:
+            logger.exception("Readiness check %r failed.", name)
+            results[name] = "fail"
+        else:
+            results[name] = "ok"
+    return results
@@ -0,0 +1,34 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from restaurant.benchmarks import benchmark_assignments, test_database
+
+
+class Command(BaseCommand):
+    help = (
+        "Time edits of a dish's cooks with dish.cooks.set() against "
+        "restaurant.assignments, and deletes of a dish or cook with many "
+        "assignments, on a throwaway database."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--assignments", type=int, default=10_000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        with test_database():
+            results = benchmark_assignments(
+                options["assignments"], options["repeat"]
+            )
+
+        self.stdout.write(
+            f"{options['assignments']} assignments\n"
+            f"{'change':<14} {'way':<16} {'ms':>9} {'queries':>8}"
+        )
+        for change, ways in results.items():
+            for way, result in ways.items():
+                self.stdout.write(
+                    f"{change:<14} {way:<16} {result['ms']:>9.2f} "
+                    f"{result['queries']:>8}"
+                )
@@ -0,0 +1,137 @@
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from typing import Any
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.test import Client
+
+from restaurant.management.commands.load_test import SERVERS, _free_port
+
+
+class Command(BaseCommand):
+    help = (
+        "Start a fresh single-worker gunicorn for each page, with and "
+        "without the startup warmup, against the configured database and "
+        "compare the first response of the new worker with later ones."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--username",
+            required=True,
+            help="An existing user to request the pages as.",
+        )
+        parser.add_argument(
+            "--mode", choices=SERVERS, default="wsgi",
+        )
+        parser.add_argument(
+            "--paths",
+            nargs="+",
+            default=["/", "/dishes/", "/cooks/", "/dish_types/"],
+        )
+        parser.add_argument("--runs", type=int, default=3)
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=10,
+            help="Requests after the first one, for the steady-state time.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        cookie = self.session_cookie(options["username"])
+
+        self.stdout.write(
+            f"{'warmup':<7} {'path':<14} {'boot ms':>9} {'first ms':>9} "
+            f"{'steady ms':>10}"
+        )
+        for warmup in (False, True):
+            for path in options["paths"]:
+                boot, first, steady = (
+                    statistics.median(timings)
+                    for timings in zip(
+                        *(
+                            self.measure(path, cookie, warmup, options)
+                            for _ in range(options["runs"])
+                        )
+                    )
+                )
+                self.stdout.write(
+                    f"{'on' if warmup else 'off':<7} {path:<14} {boot:>9.1f} "
+                    f"{first:>9.1f} {steady:>10.1f}"
+                )
+
+    @staticmethod
+    def session_cookie(username: str) -> str:
+        """Log ``username`` in without requesting a page, which would warm
+        the server up."""
+        try:
+            user = get_user_model().objects.get(username=username)
+        except get_user_model().DoesNotExist:
+            raise CommandError(f"No user named {username!r}.")
+        client = Client()
+        client.force_login(user)
+        name = settings.SESSION_COOKIE_NAME
+        return f"{name}={client.cookies[name].value}"
+
+    def measure(
+            self, path: str, cookie: str, warmup: bool, options: dict
+    ) -> tuple[float, float, float]:
+        """Boot time, first response and median later response, in ms."""
+        port = _free_port()
+        start = time.perf_counter()
+        server = subprocess.Popen(
+            [
+                sys.executable, "-m", "gunicorn", *SERVERS[options["mode"]],
+                "--bind", f"127.0.0.1:{port}",
+                "--workers", "1",
+                # The socket is bound once the application has loaded, so
+                # accepting a connection means the worker is ready.
+                "--preload",
+                "--log-level", "warning",
+            ],
+            env={
+                **os.environ,
+                "ASYNC_VIEWS": "1" if options["mode"] == "asgi" else "0",
+                "WARMUP": "1" if warmup else "0",
+            },
+        )
+        try:
+            self.wait_for_socket(port, server)
+            boot_ms = (time.perf_counter() - start) * 1000
+
+            request = urllib.request.Request(
+                f"http://127.0.0.1:{port}{path}", headers={"Cookie": cookie},
+            )
+            timings = []
+            for _ in range(options["requests"] + 1):
+                start = time.perf_counter()
+                with urllib.request.urlopen(request) as response:
+                    response.read()
+                timings.append((time.perf_counter() - start) * 1000)
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+
+        return boot_ms, timings[0], statistics.median(timings[1:])
+
+    @staticmethod
+    def wait_for_socket(
+            port: int, server: subprocess.Popen, timeout: float = 30
+    ) -> None:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if server.poll() is not None:
+                raise CommandError("The server exited during startup.")
+            try:
+                socket.create_connection(("127.0.0.1", port), 0.1).close()
+                return
+            except OSError:
+                time.sleep(0.01)
+        raise CommandError(f"The server did not start in {timeout}s.")
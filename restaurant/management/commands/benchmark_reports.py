@@ -0,0 +1,46 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from restaurant.benchmarks import (
+    benchmark_reports,
+    seed_kitchen,
+    test_database,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a throwaway database at each scale and time the reports "
+        "refresh job, the reports page, and computing the reports live."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--scales",
+            type=int,
+            nargs="+",
+            default=[1_000, 10_000, 100_000],
+            help="Number of dishes; cooks and assignments scale with it.",
+        )
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        self.stdout.write(
+            f"{'dishes':>10} {'refresh ms':>12} {'live ms':>10} "
+            f"{'page ms':>10} {'page queries':>13}"
+        )
+        for scale in sorted(options["scales"]):
+            with test_database():
+                seed_kitchen(
+                    dishes=scale,
+                    cooks=max(scale // 10, 1),
+                    assignments=scale * 3,
+                )
+                result = benchmark_reports(options["repeat"])
+
+            self.stdout.write(
+                f"{scale:>10} {result['refresh_ms']:>12.2f} "
+                f"{result['live_ms']:>10.2f} {result['page_ms']:>10.2f} "
+                f"{result['page_queries']:>13}"
+            )
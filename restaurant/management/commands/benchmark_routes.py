@@ -0,0 +1,84 @@
+import json
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from restaurant.benchmarks import (
+    benchmark_routes,
+    compare_to_baseline,
+    seed_kitchen,
+    test_database,
+)
+
+BASELINE = settings.BASE_DIR / "benchmarks" / "routes.json"
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a throwaway database at each scale, time every restaurant "
+        "route through the test client and compare latency, query counts "
+        "and memory peaks with a stored baseline."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--scales",
+            type=int,
+            nargs="+",
+            default=[100, 1_000, 10_000],
+            help="Number of dishes; cooks and assignments scale with it.",
+        )
+        parser.add_argument("--repeat", type=int, default=10)
+        parser.add_argument("--baseline", type=Path, default=BASELINE)
+        parser.add_argument("--tolerance", type=float, default=0.5)
+        parser.add_argument(
+            "--save-baseline",
+            action="store_true",
+            help="Overwrite the baseline with this run instead of comparing.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        results = {}
+        for scale in sorted(options["scales"]):
+            with test_database():
+                seed_kitchen(
+                    dishes=scale,
+                    cooks=max(scale // 10, 1),
+                    assignments=scale * 3,
+                )
+                results[str(scale)] = benchmark_routes(options["repeat"])
+            self.report(scale, results[str(scale)])
+
+        path = options["baseline"]
+        if options["save_baseline"]:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(results, indent=2) + "\n")
+            self.stdout.write(self.style.SUCCESS(f"Baseline saved to {path}."))
+            return
+
+        if not path.exists():
+            self.stdout.write(f"No baseline at {path}; nothing to compare.")
+            return
+
+        regressions = compare_to_baseline(
+            results, json.loads(path.read_text()), options["tolerance"],
+        )
+        if regressions:
+            raise CommandError(
+                "Regressions against the baseline:\n"
+                + "\n".join(f"  {regression}" for regression in regressions)
+            )
+        self.stdout.write(self.style.SUCCESS("No regressions."))
+
+    def report(self, scale: int, results: dict[str, dict[str, Any]]) -> None:
+        self.stdout.write(
+            f"\n{scale} dishes\n{'route':<24} {'status':>6} {'ms':>9} "
+            f"{'queries':>8} {'peak KB':>9}"
+        )
+        for name, result in results.items():
+            self.stdout.write(
+                f"{name:<24} {result['status']:>6} {result['ms']:>9.2f} "
+                f"{result['queries']:>8} {result['peak_kb']:>9.1f}"
+            )
@@ -0,0 +1,84 @@
+import random
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from restaurant.benchmarks import WORDS, median_ms, test_database
+from restaurant.models import Dish, DishType
+from restaurant.search import SearchBackend, get_search_backend
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare dish search latency of the plain icontains filter and the "
+        "configured search backend as the table grows."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--rows",
+            type=int,
+            nargs="+",
+            default=[1_000, 10_000, 100_000],
+        )
+        parser.add_argument(
+            "--terms",
+            nargs="+",
+            default=["pumpkin pie", "saffron"],
+        )
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        with test_database():
+            self.run(
+                sorted(options["rows"]), options["terms"], options["repeat"]
+            )
+
+    def run(self, scales: list[int], terms: list[str], repeat: int) -> None:
+        plain = SearchBackend()
+        backend = get_search_backend(Dish)
+        dish_type = DishType.objects.create(name="Benchmark")
+        rng = random.Random(0)
+
+        Dish.objects.create(
+            name="SAFFRON RISOTTO", description="", price=10,
+            dish_type=dish_type,
+        )
+
+        self.stdout.write(
+            f"{'rows':>10} {'term':>14} {'icontains ms':>14} "
+            f"{type(backend).__name__ + ' ms':>26}"
+        )
+        for rows in scales:
+            Dish.objects.bulk_create(
+                (
+                    Dish(
+                        name=" ".join(rng.sample(WORDS, 3)).upper(),
+                        description="",
+                        price=10,
+                        dish_type=dish_type,
+                    )
+                    for _ in range(rows - Dish.objects.count())
+                ),
+                batch_size=5_000,
+            )
+            backend.rebuild(Dish)
+
+            for term in terms:
+                plain_ms = median_ms(
+                    lambda: self.first_page(plain, term), repeat,
+                )
+                backend_ms = median_ms(
+                    lambda: self.first_page(backend, term), repeat,
+                )
+                self.stdout.write(
+                    f"{rows:>10} {term:>14} {plain_ms:>14.2f} "
+                    f"{backend_ms:>26.2f}"
+                )
+
+    @staticmethod
+    def first_page(backend: SearchBackend, term: str) -> None:
+        # What a paginated list view does: count, then fetch one page.
+        queryset = backend.search(Dish.objects.all(), term)
+        queryset.count()
+        list(queryset[:5])
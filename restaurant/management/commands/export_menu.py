@@ -0,0 +1,68 @@
+import csv
+import json
+from pathlib import Path
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from restaurant import menu
+
+CSV_FILES = {
+    menu.DISH_TYPE: "dish_types.csv",
+    menu.COOK: "cooks.csv",
+    menu.DISH: "dishes.csv",
+}
+
+EXPORTS = {
+    menu.DISH_TYPE: menu.export_dish_types,
+    menu.COOK: menu.export_cooks,
+    menu.DISH: menu.export_dishes,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream dish types, cooks and dishes (with their cooks) to JSON "
+        "Lines, or to a directory of CSV files."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "path",
+            help="Output .jsonl file, '-' for stdout, or a CSV directory.",
+        )
+        parser.add_argument(
+            "--format", choices=("jsonl", "csv"), default="jsonl",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["format"] == "csv":
+            self.write_csv(Path(options["path"]))
+        elif options["path"] == "-":
+            self.write_jsonl(self.stdout)
+        else:
+            with open(options["path"], "w", encoding="utf-8") as stream:
+                self.write_jsonl(stream)
+
+    @staticmethod
+    def write_jsonl(stream: Any) -> None:
+        for kind, export in EXPORTS.items():
+            for record in export():
+                stream.write(json.dumps({"model": kind, **record}) + "\n")
+
+    @staticmethod
+    def write_csv(directory: Path) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        for kind, export in EXPORTS.items():
+            with open(
+                    directory / CSV_FILES[kind], "w",
+                    encoding="utf-8", newline="",
+            ) as stream:
+                writer = csv.DictWriter(stream, fieldnames=menu.FIELDS[kind])
+                writer.writeheader()
+                for record in export():
+                    if kind == menu.DISH:
+                        record["cooks"] = menu.COOKS_SEPARATOR.join(
+                            record["cooks"]
+                        )
+                    writer.writerow(record)
@@ -0,0 +1,93 @@
+import csv
+import json
+import sys
+from pathlib import Path
+from typing import Any, Iterator
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from restaurant import menu
+from restaurant.management.commands.export_menu import CSV_FILES
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk load dish types, cooks and dishes from a JSON Lines file or a "
+        "directory of CSV files written by export_menu."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "path",
+            help="Input .jsonl file, '-' for stdin, or a CSV directory.",
+        )
+        parser.add_argument(
+            "--format", choices=("jsonl", "csv"), default="jsonl",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=menu.BATCH_SIZE,
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["format"] == "csv":
+            records = self.read_csv(Path(options["path"]))
+        elif options["path"] == "-":
+            records = self.read_jsonl(sys.stdin)
+        else:
+            records = self.read_jsonl_file(Path(options["path"]))
+
+        self.position = None
+        try:
+            created = menu.import_menu(records, options["batch_size"])
+        except ValidationError as error:
+            # Raised while the offending record is being added, so
+            # ``position`` is still the one the reader last yielded.
+            raise CommandError(
+                f"Import failed, nothing was saved: {self.position}: "
+                + " ".join(error.messages)
+            )
+        except (KeyError, ValueError) as error:
+            raise CommandError(f"Import failed, nothing was saved: {error}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {created[menu.DISH_TYPE]} dish type(s), "
+                f"{created[menu.COOK]} cook(s) and "
+                f"{created[menu.DISH]} dish(es)."
+            )
+        )
+
+    def read_jsonl_file(self, path: Path) -> Iterator[tuple[str, dict]]:
+        with open(path, encoding="utf-8") as stream:
+            yield from self.read_jsonl(stream)
+
+    def read_jsonl(self, stream: Any) -> Iterator[tuple[str, dict]]:
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                kind = record.pop("model")
+            except (json.JSONDecodeError, KeyError, AttributeError):
+                raise CommandError(f"Line {line_number} is not a record.")
+            self.position = f"Line {line_number}"
+            yield kind, record
+
+    def read_csv(self, directory: Path) -> Iterator[tuple[str, dict]]:
+        for kind, file_name in CSV_FILES.items():
+            path = directory / file_name
+            if not path.exists():
+                continue
+            with open(path, encoding="utf-8", newline="") as stream:
+                reader = csv.DictReader(stream)
+                for record in reader:
+                    self.position = f"{file_name} line {reader.line_num}"
+                    if kind == menu.DISH:
+                        cooks = record.get("cooks") or ""
+                        record["cooks"] = [
+                            username
+                            for username in cooks.split(menu.COOKS_SEPARATOR)
+                            if username
+                        ]
+                    yield kind, record
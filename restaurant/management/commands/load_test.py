@@ -0,0 +1,161 @@
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import CookieJar
+from itertools import cycle, islice
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+SERVERS = {
+    "wsgi": ["restaurant_kitchen_service.wsgi"],
+    "asgi": [
+        "restaurant_kitchen_service.asgi",
+        "--worker-class", "uvicorn.workers.UvicornWorker",
+    ],
+}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class Command(BaseCommand):
+    help = (
+        "Start the project under gunicorn (WSGI) and gunicorn + uvicorn "
+        "workers (ASGI, async views) against the configured database and "
+        "compare throughput and latency of the read-heavy pages."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--username", required=True)
+        parser.add_argument("--password", required=True)
+        parser.add_argument(
+            "--modes", nargs="+", choices=SERVERS, default=list(SERVERS),
+        )
+        parser.add_argument(
+            "--paths",
+            nargs="+",
+            default=["/", "/dishes/", "/cooks/", "/dish_types/"],
+        )
+        parser.add_argument("--requests", type=int, default=500)
+        parser.add_argument("--concurrency", type=int, default=16)
+        parser.add_argument("--workers", type=int, default=2)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        self.stdout.write(
+            f"{'mode':<6} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} "
+            f"{'errors':>7}"
+        )
+        for mode in options["modes"]:
+            port = _free_port()
+            server = self.start_server(mode, port, options["workers"])
+            try:
+                base_url = f"http://127.0.0.1:{port}"
+                self.wait_until_ready(base_url, server)
+                cookie = self.log_in(
+                    base_url, options["username"], options["password"],
+                )
+                self.report(mode, self.run(base_url, cookie, options))
+            finally:
+                server.terminate()
+                server.wait(timeout=30)
+
+    @staticmethod
+    def start_server(mode: str, port: int, workers: int) -> subprocess.Popen:
+        env = {**os.environ, "ASYNC_VIEWS": "1" if mode == "asgi" else "0"}
+        return subprocess.Popen(
+            [
+                sys.executable, "-m", "gunicorn", *SERVERS[mode],
+                "--bind", f"127.0.0.1:{port}",
+                "--workers", str(workers),
+                "--log-level", "warning",
+            ],
+            env=env,
+        )
+
+    @staticmethod
+    def wait_until_ready(
+            base_url: str, server: subprocess.Popen, timeout: float = 30
+    ) -> None:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if server.poll() is not None:
+                raise CommandError("The server exited during startup.")
+            try:
+                urllib.request.urlopen(f"{base_url}/accounts/login/")
+                return
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.2)
+        raise CommandError(f"The server did not start in {timeout}s.")
+
+    @staticmethod
+    def log_in(base_url: str, username: str, password: str) -> str:
+        cookies = CookieJar()
+        opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(cookies)
+        )
+        login_url = f"{base_url}/accounts/login/"
+        opener.open(login_url)
+        csrf_token = next(
+            cookie.value for cookie in cookies if cookie.name == "csrftoken"
+        )
+        opener.open(
+            login_url,
+            urllib.parse.urlencode(
+                {
+                    "username": username,
+                    "password": password,
+                    "csrfmiddlewaretoken": csrf_token,
+                }
+            ).encode(),
+        )
+        if not any(cookie.name == "sessionid" for cookie in cookies):
+            raise CommandError("Could not log in with the given credentials.")
+
+        return "; ".join(f"{cookie.name}={cookie.value}" for cookie in cookies)
+
+    @staticmethod
+    def run(base_url: str, cookie: str, options: dict) -> dict[str, Any]:
+        def fetch(path: str) -> float | None:
+            request = urllib.request.Request(
+                f"{base_url}{path}", headers={"Cookie": cookie},
+            )
+            start = time.perf_counter()
+            try:
+                with urllib.request.urlopen(request) as response:
+                    response.read()
+            except urllib.error.URLError:
+                return None
+            return (time.perf_counter() - start) * 1000
+
+        paths = list(islice(cycle(options["paths"]), options["requests"]))
+        start = time.perf_counter()
+        with ThreadPoolExecutor(options["concurrency"]) as executor:
+            timings = list(executor.map(fetch, paths))
+        elapsed = time.perf_counter() - start
+
+        succeeded = sorted(timing for timing in timings if timing is not None)
+        return {
+            "throughput": len(succeeded) / elapsed,
+            "p50": statistics.median(succeeded) if succeeded else 0.0,
+            "p95": (
+                succeeded[int(len(succeeded) * 0.95) - 1] if succeeded else 0.0
+            ),
+            "errors": len(timings) - len(succeeded),
+        }
+
+    def report(self, mode: str, result: dict[str, Any]) -> None:
+        self.stdout.write(
+            f"{mode:<6} {result['throughput']:>9.1f} {result['p50']:>9.1f} "
+            f"{result['p95']:>9.1f} {result['errors']:>7}"
+        )
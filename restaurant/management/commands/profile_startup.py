@@ -0,0 +1,113 @@
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+SETUP = "import django; django.setup(); "
+
+# What each kind of process imports before it can do its job.
+TARGETS = {
+    "setup": ["-c", SETUP],
+    "urls": [
+        "-c", SETUP + "from django.urls import get_resolver; "
+        "get_resolver().url_patterns",
+    ],
+    "wsgi": ["-c", "import restaurant_kitchen_service.wsgi"],
+    "manage-help": ["manage.py", "help"],
+    "manage-check": ["manage.py", "check"],
+}
+
+
+def parse_importtime(output: str) -> dict[str, int]:
+    """Self import time in microseconds per module, from the stderr of
+    ``python -X importtime``."""
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        if self_us.strip().isdigit():
+            times[name.strip()] = int(self_us)
+    return times
+
+
+def package(module: str) -> str:
+    parts = module.split(".")
+    if parts[0] != "django":
+        return parts[0]
+    # Django is too big to count as one package: split it by subpackage.
+    return ".".join(parts[:3] if parts[1:2] == ["contrib"] else parts[:2])
+
+
+def by_package(times: dict[str, int]) -> Counter:
+    packages = Counter()
+    for module, self_us in times.items():
+        packages[package(module)] += self_us
+    return packages
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the start of fresh Python processes that set Django up, load "
+        "the URLconf, load the WSGI application or run manage.py, and list "
+        "the packages that take the longest to import (python -X "
+        "importtime)."
+    )
+    requires_system_checks = []
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--targets", nargs="+", choices=TARGETS, default=list(TARGETS),
+        )
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--top", type=int, default=10)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        for target in options["targets"]:
+            wall_ms = statistics.median(
+                self.run(target)[0] for _ in range(options["repeat"])
+            )
+            times = parse_importtime(self.run(target, importtime=True)[1])
+
+            self.stdout.write(
+                f"\n{target}: {wall_ms:.0f} ms wall, {len(times)} modules, "
+                f"{sum(times.values()) / 1000:.0f} ms importing"
+            )
+            for package, self_us in by_package(times).most_common(
+                options["top"]
+            ):
+                self.stdout.write(f"  {self_us / 1000:>8.1f} ms  {package}")
+
+    @staticmethod
+    def run(target: str, importtime: bool = False) -> tuple[float, str]:
+        """Wall time in ms of a fresh process, and its stderr."""
+        command = [sys.executable, *(["-X", "importtime"] * importtime)]
+        env = {
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": os.environ.get(
+                "DJANGO_SETTINGS_MODULE", "restaurant_kitchen_service.settings"
+            ),
+            # Measure the imports only, not restaurant.warmup.
+            "WARMUP": "0",
+        }
+        start = time.perf_counter()
+        process = subprocess.run(
+            command + TARGETS[target],
+            cwd=settings.BASE_DIR,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        wall_ms = (time.perf_counter() - start) * 1000
+        if process.returncode:
+            raise CommandError(
+                f"{target} failed:\n{process.stderr[-2000:]}"
+            )
+        return wall_ms, process.stderr
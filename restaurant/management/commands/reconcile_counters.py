@@ -0,0 +1,24 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from restaurant import counters
+
+
+class Command(BaseCommand):
+    help = "Recount cooks, dish types and dishes and fix the stored totals."
+    # Run on a schedule, like repair_assignment_counts.
+    requires_system_checks = []
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        changes = counters.reconcile()
+
+        if not changes:
+            self.stdout.write(self.style.SUCCESS("Counters are in sync."))
+            return
+
+        for name, (stored, actual) in changes.items():
+            self.stdout.write(f"{name}: {stored} -> {actual}")
+        self.stdout.write(
+            self.style.SUCCESS(f"Reconciled {len(changes)} counter(s).")
+        )
@@ -0,0 +1,23 @@
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from restaurant import reports
+
+
+class Command(BaseCommand):
+    help = "Recompute the summary rows behind the reports page."
+    # Run on a schedule, like reconcile_counters.
+    requires_system_checks = []
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        start = time.perf_counter()
+        rows = reports.refresh()
+        ms = (time.perf_counter() - start) * 1000
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Refreshed {rows} report row(s) in {ms:.0f} ms."
+            )
+        )
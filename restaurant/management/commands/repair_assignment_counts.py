@@ -0,0 +1,27 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from restaurant.assignments import recount
+from restaurant.models import Cook, Dish
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount the cooks of every dish and the dishes of every cook from "
+        "the assignments table and fix the stored counts that drifted."
+    )
+    # Run on a schedule, like reconcile_counters.
+    requires_system_checks = []
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        fixed = {
+            model._meta.verbose_name_plural: recount(model)
+            for model in (Dish, Cook)
+        }
+
+        for name, count in fixed.items():
+            self.stdout.write(f"{name}: {count} fixed")
+        self.stdout.write(
+            self.style.SUCCESS(f"Repaired {sum(fixed.values())} count(s).")
+        )
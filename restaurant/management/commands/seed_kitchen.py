@@ -0,0 +1,38 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from restaurant import menu
+from restaurant.benchmarks import seed_kitchen
+
+
+class Command(BaseCommand):
+    help = (
+        "Fill the database with a deterministic synthetic kitchen: dish "
+        "types, cooks, dishes and dish/cook assignments, inserted in bulk."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--dishes", type=int, default=1_000)
+        parser.add_argument("--cooks", type=int, default=100)
+        parser.add_argument("--assignments", type=int, default=3_000)
+        parser.add_argument("--dish-types", type=int, default=20)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--batch-size", type=int, default=menu.BATCH_SIZE)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        created = seed_kitchen(
+            options["dishes"],
+            options["cooks"],
+            options["assignments"],
+            options["dish_types"],
+            options["seed"],
+            options["batch_size"],
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Seeded {created[menu.DISH_TYPE]} dish type(s), "
+                f"{created[menu.COOK]} cook(s) and "
+                f"{created[menu.DISH]} dish(es)."
+            )
+        )
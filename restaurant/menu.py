@@ -0,0 +1,247 @@
+from collections import defaultdict
+from itertools import islice
+from typing import Any, Iterable, Iterator
+
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import QuerySet
+
+from restaurant import assignments, caching, counters, reports
+from restaurant.models import Cook, Dish, DishType
+from restaurant.search import get_search_backend
+
+CHUNK_SIZE = 2_000
+BATCH_SIZE = 1_000
+
+DISH_TYPE = "dish_type"
+COOK = "cook"
+DISH = "dish"
+
+FIELDS = {
+    DISH_TYPE: ("name",),
+    COOK: ("username", "first_name", "last_name", "years_of_experience"),
+    DISH: ("name", "description", "price", "dish_type", "cooks"),
+}
+
+# Separates usernames in the ``cooks`` column of flat (CSV) exports.
+COOKS_SEPARATOR = "|"
+
+# The model field behind each imported value, and whether it is required.
+RECORD_FIELDS = {
+    DISH_TYPE: (("name", DishType, "name", True),),
+    COOK: (
+        ("username", Cook, "username", True),
+        ("first_name", Cook, "first_name", False),
+        ("last_name", Cook, "last_name", False),
+        ("years_of_experience", Cook, "years_of_experience", False),
+    ),
+    DISH: (
+        ("name", Dish, "name", True),
+        ("description", Dish, "description", False),
+        ("price", Dish, "price", True),
+        ("dish_type", DishType, "name", True),
+    ),
+}
+
+
+def export_dish_types(
+        queryset: QuerySet[DishType] | None = None,
+) -> Iterator[dict[str, Any]]:
+    queryset = DishType.objects.all() if queryset is None else queryset
+    for (name,) in queryset.values_list("name").iterator(CHUNK_SIZE):
+        yield {"name": name}
+
+
+def export_cooks(
+        queryset: QuerySet[Cook] | None = None,
+) -> Iterator[dict[str, Any]]:
+    queryset = Cook.objects.all() if queryset is None else queryset
+    rows = queryset.order_by("pk").values_list(*FIELDS[COOK])
+    for row in rows.iterator(CHUNK_SIZE):
+        yield dict(zip(FIELDS[COOK], row))
+
+
+def export_dishes(
+        queryset: QuerySet[Dish] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Dishes with their cooks' usernames, in primary-key order.
+
+    Dishes are read ``CHUNK_SIZE`` rows at a time and each chunk's
+    assignments are fetched with one ``IN`` query, so memory stays flat
+    whatever the size of the menu or of the filtered ``queryset``.
+    """
+    queryset = Dish.objects.all() if queryset is None else queryset
+    rows = queryset.order_by("pk").values_list(
+        "pk", "name", "description", "price", "dish_type__name",
+    ).iterator(CHUNK_SIZE)
+
+    while chunk := list(islice(rows, CHUNK_SIZE)):
+        cooks = defaultdict(list)
+        assignments = Dish.cooks.through.objects.filter(
+            dish_id__in=[row[0] for row in chunk]
+        ).order_by("cook_id").values_list("dish_id", "cook__username")
+        for dish_id, username in assignments:
+            cooks[dish_id].append(username)
+
+        for pk, name, description, price, dish_type in chunk:
+            yield {
+                "name": name,
+                "description": description,
+                "price": str(price),
+                "dish_type": dish_type,
+                "cooks": cooks[pk],
+            }
+
+
+def refresh_derived_state() -> None:
+    """Bring counters, search indexes, change stamps and page versions up
+    to date after writes that bypassed model signals (``bulk_create``, raw
+    SQL).
+
+    All of them are database rows, so inside a transaction they commit or
+    roll back with the writes.
+    """
+    counters.reconcile()
+    for model in (Cook, Dish):
+        assignments.recount(model)
+    reports.refresh()
+    for model in (Cook, Dish, DishType):
+        get_search_backend(model).rebuild(model)
+    caching.touch(Cook, Dish, DishType)
+    # New assignments show on existing pages too.
+    caching.bump(Cook.objects.all())
+    caching.bump(Dish.objects.all())
+
+
+class MenuImporter:
+    """Buffered bulk loader for dish types, cooks and dishes.
+
+    Rows are inserted ``batch_size`` at a time. Dish types and cooks are
+    resolved through name -> id maps loaded once up front, and dish
+    assignments go straight into the through table.
+    """
+
+    def __init__(self, batch_size: int = BATCH_SIZE) -> None:
+        self.batch_size = batch_size
+        self.dish_type_ids = dict(DishType.objects.values_list("name", "pk"))
+        self.cook_ids = dict(Cook.objects.values_list("username", "pk"))
+        self.pending = {DISH_TYPE: [], COOK: [], DISH: []}
+        self.created = {DISH_TYPE: 0, COOK: 0, DISH: 0}
+        self.creators = {
+            DISH_TYPE: self._create_dish_types,
+            COOK: self._create_cooks,
+            DISH: self._create_dishes,
+        }
+
+    def add(self, kind: str, record: dict[str, Any]) -> None:
+        """Buffer ``record``; raise ``ValidationError`` if one of its values
+        does not fit the model, before any batch containing it is sent."""
+        if kind not in self.pending:
+            raise ValueError(f"Unknown record type: {kind!r}.")
+
+        for key, model, name, required in RECORD_FIELDS[kind]:
+            value = record.get(key)
+            if value is None or value == "":
+                if required:
+                    raise ValidationError(f"{key}: this field is required.")
+                continue
+            try:
+                record[key] = model._meta.get_field(name).clean(value, None)
+            except ValidationError as error:
+                raise ValidationError(
+                    [f"{key}: {message}" for message in error.messages]
+                )
+
+        self.pending[kind].append(record)
+        if len(self.pending[kind]) >= self.batch_size:
+            self.flush(kind)
+
+    def flush(self, kind: str | None = None) -> None:
+        kinds = (DISH_TYPE, COOK, DISH) if kind is None else (kind,)
+        for kind in kinds:
+            records, self.pending[kind] = self.pending[kind], []
+            if records:
+                self.creators[kind](records)
+
+    def finish(self) -> dict[str, int]:
+        self.flush()
+        refresh_derived_state()
+        return self.created
+
+    def _create_dish_types(self, records: list[dict[str, Any]]) -> None:
+        names = {
+            record["name"] for record in records
+            if record["name"] not in self.dish_type_ids
+        }
+        created = DishType.objects.bulk_create(
+            DishType(name=name) for name in names
+        )
+        self.dish_type_ids.update((obj.name, obj.pk) for obj in created)
+        self.created[DISH_TYPE] += len(created)
+
+    def _create_cooks(self, records: list[dict[str, Any]]) -> None:
+        new_cooks = {}
+        for record in records:
+            username = record["username"]
+            if username in self.cook_ids or username in new_cooks:
+                continue
+            new_cooks[username] = Cook(
+                username=username,
+                first_name=record.get("first_name") or "",
+                last_name=record.get("last_name") or "",
+                years_of_experience=record.get("years_of_experience") or 0,
+                # Imported cooks must reset their password to log in.
+                password=make_password(None),
+            )
+
+        created = Cook.objects.bulk_create(new_cooks.values())
+        self.cook_ids.update((obj.username, obj.pk) for obj in created)
+        self.created[COOK] += len(created)
+
+    def _create_dishes(self, records: list[dict[str, Any]]) -> None:
+        # Dishes may reference dish types and cooks still in the buffers.
+        self.flush(DISH_TYPE)
+        self.flush(COOK)
+        self._create_dish_types(
+            [{"name": record["dish_type"]} for record in records]
+        )
+
+        dishes = Dish.objects.bulk_create(
+            Dish(
+                name=record["name"],
+                description=record.get("description") or "",
+                price=record["price"],
+                dish_type_id=self.dish_type_ids[record["dish_type"]],
+            )
+            for record in records
+        )
+
+        through = Dish.cooks.through
+        assignments = []
+        for dish, record in zip(dishes, records):
+            for username in record.get("cooks") or ():
+                try:
+                    cook_id = self.cook_ids[username]
+                except KeyError:
+                    raise ValueError(
+                        f"Dish {record['name']!r} refers to unknown cook "
+                        f"{username!r}."
+                    )
+                assignments.append(through(dish_id=dish.pk, cook_id=cook_id))
+
+        through.objects.bulk_create(
+            assignments, batch_size=self.batch_size, ignore_conflicts=True,
+        )
+        self.created[DISH] += len(dishes)
+
+
+def import_menu(
+        records: Iterable[tuple[str, dict[str, Any]]],
+        batch_size: int = BATCH_SIZE,
+) -> dict[str, int]:
+    with transaction.atomic():
+        importer = MenuImporter(batch_size)
+        for kind, record in records:
+            importer.add(kind, record)
+        return importer.finish()
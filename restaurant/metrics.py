@@ -0,0 +1,50 @@
+import statistics
+from collections import defaultdict, deque
+from typing import Iterable
+
+# Most recent samples kept per URL name and measure. Appending to a bounded
+# deque is O(1) and thread-safe; percentiles are only computed on read.
+SAMPLE_SIZE = 1_000
+
+MEASURES = ("wall_ms", "db_ms", "queries", "render_ms", "bytes")
+PERCENTILES = (50, 95, 99)
+
+_samples: defaultdict[str, dict[str, deque]] = defaultdict(
+    lambda: {measure: deque(maxlen=SAMPLE_SIZE) for measure in MEASURES}
+)
+
+
+def record(url_name: str, **values: float) -> None:
+    samples = _samples[url_name]
+    for measure, value in values.items():
+        samples[measure].append(value)
+
+
+def percentiles(values: Iterable[float]) -> dict[str, float]:
+    values = list(values)
+    if len(values) < 2:
+        value = values[0] if values else 0.0
+        return {f"p{percentile}": value for percentile in PERCENTILES}
+
+    cut_points = statistics.quantiles(values, n=100, method="inclusive")
+    return {
+        f"p{percentile}": round(cut_points[percentile - 1], 2)
+        for percentile in PERCENTILES
+    }
+
+
+def summary() -> dict[str, dict]:
+    return {
+        url_name: {
+            "count": len(samples["wall_ms"]),
+            **{
+                measure: percentiles(values)
+                for measure, values in samples.items()
+            },
+        }
+        for url_name, samples in sorted(_samples.copy().items())
+    }
+
+
+def reset() -> None:
+    _samples.clear()
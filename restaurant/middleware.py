@@ -0,0 +1,140 @@
+import random
+import time
+from typing import Any, Callable
+
+from django.conf import settings
+from django.db import connection
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.template.response import SimpleTemplateResponse
+
+from restaurant import health, metrics
+from restaurant.query_detector import QueryDetector
+
+
+class HealthCheckMiddleware:
+    """Answer load balancer probes before the rest of the stack runs: no
+    session, authentication, host validation or metrics.
+
+    ``/healthz`` only shows that the process serves requests; ``/readyz``
+    also checks the database, a shared cache and the migrations (see
+    ``restaurant.health``) and returns 503 when one of them fails.
+    """
+
+    def __init__(self, get_response: Callable) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        path = request.path_info.rstrip("/")
+        if path == "/healthz":
+            return HttpResponse("ok", content_type="text/plain")
+        if path == "/readyz":
+            checks = health.readiness()
+            ready = all(result == "ok" for result in checks.values())
+            return JsonResponse(checks, status=200 if ready else 503)
+        return self.get_response(request)
+
+
+class QueryTimer:
+    """``connection.execute_wrapper`` hook counting queries and their time."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(
+            self,
+            execute: Callable,
+            sql: str,
+            params: Any,
+            many: bool,
+            context: dict,
+    ) -> Any:
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - start
+            self.count += 1
+
+
+class PerformanceMiddleware:
+    """Time each request and report it in ``Server-Timing`` and metrics.
+
+    Records wall time, database time and query count, template render time
+    and response size per URL name; see ``restaurant.metrics``.
+    """
+
+    def __init__(self, get_response: Callable) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        start = time.perf_counter()
+        request._render_seconds = 0.0
+        timer = QueryTimer()
+        with connection.execute_wrapper(timer):
+            response = self.get_response(request)
+        wall_ms = (time.perf_counter() - start) * 1000
+        db_ms = timer.seconds * 1000
+        render_ms = request._render_seconds * 1000
+
+        response["Server-Timing"] = ", ".join(
+            (
+                f"app;dur={wall_ms:.1f}",
+                f'db;dur={db_ms:.1f};desc="{timer.count} queries"',
+                f"render;dur={render_ms:.1f}",
+            )
+        )
+
+        match = request.resolver_match
+        if match is not None:
+            metrics.record(
+                match.view_name,
+                wall_ms=wall_ms,
+                db_ms=db_ms,
+                queries=timer.count,
+                render_ms=render_ms,
+                bytes=(
+                    0 if response.streaming else len(response.content)
+                ),
+            )
+        return response
+
+    def process_template_response(
+            self, request: HttpRequest, response: SimpleTemplateResponse
+    ) -> SimpleTemplateResponse:
+        start = time.perf_counter()
+
+        def rendered(response: SimpleTemplateResponse) -> None:
+            request._render_seconds += time.perf_counter() - start
+
+        response.add_post_render_callback(rendered)
+        return response
+
+
+class QueryDetectorMiddleware:
+    """Check requests for N+1 patterns and slow queries.
+
+    Raises ``QueryProblem`` when ``RESTAURANT_QUERY_DETECTOR_RAISE`` is set
+    (under ``manage.py test``); otherwise logs the problems of a
+    ``RESTAURANT_QUERY_DETECTOR_SAMPLE_RATE`` share of requests.
+    """
+
+    def __init__(self, get_response: Callable) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        raise_problems = settings.RESTAURANT_QUERY_DETECTOR_RAISE
+        if not raise_problems and (
+            random.random() >= settings.RESTAURANT_QUERY_DETECTOR_SAMPLE_RATE
+        ):
+            return self.get_response(request)
+
+        with QueryDetector() as detector:
+            response = self.get_response(request)
+
+        label = f"{request.method} {request.path}"
+        if raise_problems:
+            detector.check(label)
+        else:
+            detector.log(label)
+        return response
@@ -0,0 +1,51 @@
+from django.db import migrations
+
+SEARCH_COLUMNS = (
+    ("restaurant_cook", "username"),
+    ("restaurant_dish", "name"),
+    ("restaurant_dishtype", "name"),
+)
+
+
+def create_search_indexes(apps, schema_editor) -> None:
+    vendor = schema_editor.connection.vendor
+
+    if vendor == "postgresql":
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for table, column in SEARCH_COLUMNS:
+            schema_editor.execute(
+                f"CREATE INDEX IF NOT EXISTS {table}_{column}_trgm "
+                f"ON {table} USING gin "
+                f'(UPPER("{column}"::text) gin_trgm_ops)'
+            )
+    elif vendor == "sqlite":
+        for table, column in SEARCH_COLUMNS:
+            schema_editor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {table}_fts "
+                f"USING fts5(body, tokenize='trigram')"
+            )
+            schema_editor.execute(
+                f"INSERT INTO {table}_fts (rowid, body) "
+                f"SELECT id, {column} FROM {table}"
+            )
+
+
+def drop_search_indexes(apps, schema_editor) -> None:
+    vendor = schema_editor.connection.vendor
+
+    for table, column in SEARCH_COLUMNS:
+        if vendor == "postgresql":
+            schema_editor.execute(f"DROP INDEX IF EXISTS {table}_{column}_trgm")
+        elif vendor == "sqlite":
+            schema_editor.execute(f"DROP TABLE IF EXISTS {table}_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("restaurant", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.1.3 on 2026-10-18 18:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('restaurant', '0002_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='cook',
+            index=models.Index(fields=['years_of_experience', 'id'], name='cook_experience_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dish',
+            index=models.Index(fields=['name', 'id'], name='dish_name_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dishtype',
+            index=models.Index(fields=['name', 'id'], name='dishtype_name_id_idx'),
+        ),
+    ]
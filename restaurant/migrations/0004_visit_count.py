@@ -0,0 +1,22 @@
+# Generated by Django 4.1.3 on 2026-10-18 18:17
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('restaurant', '0003_hot_lookup_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VisitCount',
+            fields=[
+                ('cook', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='visit_count', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('count', models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+    ]
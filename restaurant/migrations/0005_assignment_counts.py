@@ -0,0 +1,43 @@
+# Generated by Django 4.1.3 on 2026-10-18 18:50
+
+from django.db import migrations, models
+
+
+def count_assignments(apps, schema_editor) -> None:
+    for table, count, column in (
+        ("restaurant_dish", "cook_count", "dish_id"),
+        ("restaurant_cook", "dish_count", "cook_id"),
+    ):
+        schema_editor.execute(
+            f"UPDATE {table} SET {count} = (SELECT COUNT(*) "
+            f"FROM restaurant_dish_cooks WHERE {column} = {table}.id)"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('restaurant', '0004_visit_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cook',
+            name='dish_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='dish',
+            name='cook_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(count_assignments, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='cook',
+            index=models.Index(fields=['dish_count', 'id'], name='cook_dish_count_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dish',
+            index=models.Index(fields=['cook_count', 'id'], name='dish_cook_count_id_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.1.3 on 2026-10-18 18:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('restaurant', '0005_assignment_counts'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReportRow',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('report', models.CharField(max_length=32)),
+                ('position', models.PositiveSmallIntegerField()),
+                ('label', models.CharField(max_length=255)),
+                ('data', models.JSONField()),
+                ('refreshed_at', models.DateTimeField()),
+            ],
+            options={
+                'ordering': ('report', 'position'),
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='reportrow',
+            constraint=models.UniqueConstraint(fields=('report', 'position'), name='reportrow_report_position_uniq'),
+        ),
+    ]
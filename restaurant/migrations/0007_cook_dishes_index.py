@@ -0,0 +1,18 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("restaurant", "0006_report_rows"),
+    ]
+
+    # The auto-created through model takes no Meta.indexes. This one lets a
+    # cook's dishes be paged in (dish_id, id) order without a sort.
+    operations = [
+        migrations.RunSQL(
+            "CREATE INDEX restaurant_dish_cooks_cook_dish_idx "
+            "ON restaurant_dish_cooks (cook_id, dish_id, id)",
+            "DROP INDEX restaurant_dish_cooks_cook_dish_idx",
+        ),
+    ]
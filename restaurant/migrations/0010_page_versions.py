@@ -0,0 +1,23 @@
+# Generated by Django 4.1.3 on 2026-10-18 19:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('restaurant', '0009_change_stamps'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cook',
+            name='version',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='dish',
+            name='version',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.1.3 on 2026-10-18 20:05
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('restaurant', '0010_page_versions'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='cook',
+            name='cook_experience_id_idx',
+        ),
+    ]
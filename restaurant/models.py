@@ -1,24 +1,69 @@
+from typing import Any
+
 from django.contrib.auth.models import AbstractUser
 from django.db import models
 from django.urls import reverse
 
 
+class AssignmentCountMixin:
+    """Leaves ``assignment_count_field`` and ``version`` out of saves of
+    existing rows.
+
+    Both are only changed with ``F()`` updates (see
+    ``restaurant.assignments`` and ``restaurant.caching``), and a full save
+    would write back whatever value the instance was loaded with, undoing
+    concurrent assignments or bringing back the version of a stale page.
+    """
+
+    assignment_count_field: str
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        if (
+            not self._state.adding
+            and not args
+            and kwargs.get("update_fields") is None
+            and not kwargs.get("force_insert")
+        ):
+            kwargs["update_fields"] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name not in (
+                    self.assignment_count_field, "version"
+                )
+            ]
+        super().save(*args, **kwargs)
+
+
 class DishType(models.Model):
     name = models.CharField(max_length=255)
 
     class Meta:
         ordering = ("name",)
+        indexes = [
+            # Matches the keyset order of the list view: (name, pk).
+            models.Index(fields=("name", "id"), name="dishtype_name_id_idx"),
+        ]
 
     def __str__(self) -> str:
         return self.name
 
 
-class Cook(AbstractUser):
+class Cook(AssignmentCountMixin, AbstractUser):
     years_of_experience = models.IntegerField(default=0, null=True)
+    dish_count = models.PositiveIntegerField(default=0, editable=False)
+    # Bumped by every change shown on the cook's page.
+    version = models.PositiveIntegerField(default=0, editable=False)
+
+    assignment_count_field = "dish_count"
 
     class Meta:
         verbose_name = "cook"
         verbose_name_plural = "cooks"
+        indexes = [
+            models.Index(
+                fields=("dish_count", "id"), name="cook_dish_count_id_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.username} ({self.first_name} {self.last_name})"
@@ -27,12 +72,81 @@ class Cook(AbstractUser):
         return reverse("restaurant:cook-detail", kwargs={"pk": self.pk})
 
 
-class Dish(models.Model):
+class Dish(AssignmentCountMixin, models.Model):
     name = models.CharField(max_length=255)
     description = models.TextField()
     price = models.DecimalField(max_digits=6, decimal_places=2)
     dish_type = models.ForeignKey(DishType, on_delete=models.CASCADE)
     cooks = models.ManyToManyField(Cook, related_name="dishes")
+    cook_count = models.PositiveIntegerField(default=0, editable=False)
+    # Bumped by every change shown on the dish's page.
+    version = models.PositiveIntegerField(default=0, editable=False)
+
+    assignment_count_field = "cook_count"
+
+    class Meta:
+        indexes = [
+            models.Index(fields=("name", "id"), name="dish_name_id_idx"),
+            models.Index(
+                fields=("cook_count", "id"), name="dish_cook_count_id_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.name
+
+
+class Counter(models.Model):
+    """Row count of a table shown on the index page.
+
+    Kept in the database, so every worker reads and adjusts the same total
+    (see ``restaurant.counters``).
+    """
+
+    name = models.CharField(max_length=32, primary_key=True)
+    value = models.BigIntegerField()
+
+
+class ChangeStamp(models.Model):
+    """When a model's rows last changed, keyed by its label.
+
+    The API list validators are derived from these rows (see
+    ``restaurant.caching``), so a write in one worker is seen by all.
+    """
+
+    label = models.CharField(max_length=100, primary_key=True)
+    stamp = models.FloatField()
+
+
+class VisitCount(models.Model):
+    """Visits per cook; each worker adds its own in batches (see
+    ``restaurant.visits``)."""
+
+    cook = models.OneToOneField(
+        Cook, on_delete=models.CASCADE, primary_key=True,
+        related_name="visit_count",
+    )
+    count = models.PositiveBigIntegerField(default=0)
+
+
+class ReportRow(models.Model):
+    """One precomputed line of the reports page.
+
+    The table is rebuilt by ``restaurant.reports.refresh``, so the page
+    reads a few rows whatever the size of the menu.
+    """
+
+    report = models.CharField(max_length=32)
+    position = models.PositiveSmallIntegerField()
+    label = models.CharField(max_length=255)
+    data = models.JSONField()
+    refreshed_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ("report", "position")
+        constraints = [
+            models.UniqueConstraint(
+                fields=("report", "position"),
+                name="reportrow_report_position_uniq",
+            ),
+        ]
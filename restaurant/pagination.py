@@ -0,0 +1,228 @@
+from functools import cached_property
+from typing import Any, Sequence
+
+from django.core import signing
+from django.db.models import Model, Q, QuerySet
+from django.http import Http404
+
+CURSOR_PARAM = "cursor"
+SORT_PARAM = "sort"
+CURSOR_SALT = "restaurant.pagination.cursor"
+
+NEXT = "n"
+PREVIOUS = "p"
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+def encode_cursor(direction: str, values: Sequence[Any]) -> str:
+    return signing.dumps([direction, list(values)], salt=CURSOR_SALT)
+
+
+def decode_cursor(cursor: str) -> tuple[str, list[Any]]:
+    try:
+        direction, values = signing.loads(cursor, salt=CURSOR_SALT)
+    except (signing.BadSignature, TypeError, ValueError):
+        raise InvalidCursor(cursor)
+
+    if direction not in (NEXT, PREVIOUS) or not isinstance(values, list):
+        raise InvalidCursor(cursor)
+
+    return direction, values
+
+
+def _flip(field: str) -> str:
+    return field[1:] if field.startswith("-") else f"-{field}"
+
+
+def keyset_filter(ordering: Sequence[str], values: Sequence[Any]) -> Q:
+    """Rows strictly after ``values`` in ``ordering``.
+
+    ``(a, b) > (x, y)`` expands to ``a > x OR (a = x AND b > y)``, with the
+    comparison flipped for descending fields.
+    """
+    condition = Q()
+    equal = {}
+    for field, value in zip(ordering, values):
+        name = field.lstrip("-")
+        lookup = "lt" if field.startswith("-") else "gt"
+        condition |= Q(**equal, **{f"{name}__{lookup}": value})
+        equal[name] = value
+
+    return condition
+
+
+class KeysetPage:
+    def __init__(
+            self,
+            paginator: "KeysetPaginator",
+            object_list: QuerySet,
+            window: QuerySet,
+            direction: str,
+            has_cursor: bool,
+    ) -> None:
+        self.paginator = paginator
+        self.object_list = object_list
+        self._window = window
+        self._direction = direction
+        self._has_cursor = has_cursor
+
+    is_keyset = True
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+    @cached_property
+    def _has_more(self) -> bool:
+        # One row past the page, read from the cursor position: as cheap on
+        # the last page as on the first.
+        per_page = self.paginator.per_page
+        return self._window[per_page:per_page + 1].exists()
+
+    async def aevaluate(self) -> None:
+        """Load the page rows and look-ahead with the async ORM, so the page
+        can be rendered from an async view without further queries."""
+        per_page = self.paginator.per_page
+        self.object_list = [obj async for obj in self.object_list]
+        self._has_more = await self._window[per_page:per_page + 1].aexists()
+
+    def has_next(self) -> bool:
+        return self._has_more if self._direction == NEXT else True
+
+    def has_previous(self) -> bool:
+        if self._direction == PREVIOUS:
+            return self._has_more
+        return self._has_cursor
+
+    def has_other_pages(self) -> bool:
+        return self.has_previous() or self.has_next()
+
+    @property
+    def next_cursor(self) -> str | None:
+        if not self.has_next() or not self.object_list:
+            return None
+        return self.paginator.cursor_for(NEXT, list(self.object_list)[-1])
+
+    @property
+    def previous_cursor(self) -> str | None:
+        if not self.has_previous() or not self.object_list:
+            return None
+        return self.paginator.cursor_for(PREVIOUS, list(self.object_list)[0])
+
+
+class KeysetPaginator:
+    """Cursor pagination over ``(ordering..., pk)`` without COUNT or OFFSET.
+
+    Every page is a range read starting at the cursor, so deep pages cost
+    the same as the first one.
+    """
+
+    def __init__(
+            self, queryset: QuerySet, per_page: int, ordering: Sequence[str]
+    ) -> None:
+        ordering = tuple(ordering)
+        if not ordering or ordering[-1].lstrip("-") != "pk":
+            descending = bool(ordering) and ordering[-1].startswith("-")
+            ordering += ("-pk" if descending else "pk",)
+
+        self.queryset = queryset
+        self.per_page = per_page
+        self.ordering = ordering
+
+    def cursor_for(self, direction: str, obj: Model | dict) -> str:
+        if isinstance(obj, dict):
+            # Rows from ``values()`` carry the primary key under its name.
+            pk_name = self.queryset.model._meta.pk.name
+            values = [
+                obj[pk_name if name == "pk" else name]
+                for name in (field.lstrip("-") for field in self.ordering)
+            ]
+        else:
+            values = [
+                getattr(obj, field.lstrip("-")) for field in self.ordering
+            ]
+        return encode_cursor(direction, values)
+
+    def page(self, cursor: str | None) -> KeysetPage:
+        direction, values = decode_cursor(cursor) if cursor else (NEXT, None)
+        if values is not None and len(values) != len(self.ordering):
+            raise InvalidCursor(cursor)
+
+        forward = self.queryset.order_by(*self.ordering)
+        if direction == NEXT:
+            window = forward
+            if values is not None:
+                window = window.filter(keyset_filter(self.ordering, values))
+            object_list = window[:self.per_page]
+        else:
+            backward_ordering = [_flip(field) for field in self.ordering]
+            window = self.queryset.order_by(*backward_ordering).filter(
+                keyset_filter(backward_ordering, values)
+            )
+            object_list = forward.filter(
+                pk__in=window.values("pk")[:self.per_page]
+            )
+
+        return KeysetPage(
+            self, object_list, window, direction, values is not None
+        )
+
+
+class KeysetPaginationMixin:
+    """ListView mixin switching to keyset pagination.
+
+    The keyset follows ``keyset_ordering`` (the model's default ordering
+    when unset) plus ``pk``. ``?sort=<key>`` picks one of
+    ``sort_orderings`` instead, and ``?sort=-<key>`` reverses it; each
+    needs an index on its fields plus ``id`` to stay a range read.
+    Querysets that were explicitly ordered, such as ranked search results,
+    keep Django's numbered pages in their own order, unless a sort was
+    picked: it replaces the ranking.
+    """
+
+    keyset_ordering: Sequence[str] | None = None
+    sort_orderings: dict[str, Sequence[str]] = {}
+
+    def get_sort(self) -> str | None:
+        sort = self.request.GET.get(SORT_PARAM, "")
+        return sort if sort.lstrip("-") in self.sort_orderings else None
+
+    def get_keyset_ordering(self, queryset: QuerySet) -> Sequence[str]:
+        sort = self.get_sort()
+        if sort is not None:
+            ordering = self.sort_orderings[sort.lstrip("-")]
+            if sort.startswith("-"):
+                return [_flip(field) for field in ordering]
+            return ordering
+        if self.keyset_ordering is not None:
+            return self.keyset_ordering
+        return queryset.model._meta.ordering
+
+    def is_ranked(self, queryset: QuerySet) -> bool:
+        if self.get_sort() is not None:
+            return False
+        return bool(queryset.query.order_by or queryset.query.extra_order_by)
+
+    def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        context["sort"] = self.get_sort()
+        return context
+
+    def paginate_queryset(self, queryset: QuerySet, page_size: int) -> tuple:
+        if self.is_ranked(queryset):
+            return super().paginate_queryset(queryset, page_size)
+
+        paginator = KeysetPaginator(
+            queryset, page_size, self.get_keyset_ordering(queryset)
+        )
+        try:
+            page = paginator.page(self.request.GET.get(CURSOR_PARAM))
+        except InvalidCursor:
+            raise Http404("Invalid cursor.")
+
+        return paginator, page, page.object_list, page.has_other_pages()
@@ -0,0 +1,120 @@
+import logging
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+# A statement shape run this many times in one request is an N+1 suspect.
+REPEAT_THRESHOLD = 3
+SLOW_QUERY_MS = 200
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAM = re.compile(r"%s|\?")
+_IN_LIST = re.compile(r"\(\?(?:\s*,\s*\?)+\)")
+_SPACE = re.compile(r"\s+")
+
+# Transaction bookkeeping repeats by design.
+_IGNORED = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+def fingerprint(sql: str) -> str:
+    """``sql`` with literals, parameters and ``IN`` lists collapsed, so
+    queries that differ only in their values share a fingerprint."""
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _PARAM.sub("?", sql)
+    sql = _IN_LIST.sub("(...)", sql)
+    return _SPACE.sub(" ", sql).strip()
+
+
+class QueryProblem(Exception):
+    pass
+
+
+@dataclass
+class Problem:
+    kind: str
+    sql: str
+    count: int
+    ms: float
+
+    def __str__(self) -> str:
+        if self.kind == "repeated":
+            return f"{self.count} x {self.sql}"
+        return f"{self.ms:.0f} ms: {self.sql}"
+
+
+class QueryDetector:
+    """Execute wrapper that flags repeated query shapes and slow queries.
+
+    Use as a context manager around the code to check, then read
+    ``problems``.
+    """
+
+    def __init__(self) -> None:
+        self.repeat_threshold = getattr(
+            settings, "RESTAURANT_QUERY_REPEAT_THRESHOLD", REPEAT_THRESHOLD
+        )
+        self.slow_query_ms = getattr(
+            settings, "RESTAURANT_SLOW_QUERY_MS", SLOW_QUERY_MS
+        )
+        self.counts = Counter()
+        self.slow = []
+        self._wrapper = None
+
+    def __enter__(self) -> "QueryDetector":
+        self._wrapper = connection.execute_wrapper(self)
+        self._wrapper.__enter__()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._wrapper.__exit__(*exc_info)
+
+    def __call__(
+            self,
+            execute: Callable,
+            sql: str,
+            params: Any,
+            many: bool,
+            context: dict,
+    ) -> Any:
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            ms = (time.perf_counter() - start) * 1000
+            if not sql.startswith(_IGNORED):
+                shape = fingerprint(sql)
+                self.counts[shape] += 1
+                if ms >= self.slow_query_ms:
+                    self.slow.append(Problem("slow", shape, 1, ms))
+
+    @property
+    def problems(self) -> list[Problem]:
+        repeated = [
+            Problem("repeated", shape, count, 0.0)
+            for shape, count in self.counts.most_common()
+            if count >= self.repeat_threshold
+        ]
+        return repeated + self.slow
+
+    def check(self, label: str) -> None:
+        """Raise ``QueryProblem`` listing the problems found, if any."""
+        if problems := self.problems:
+            raise QueryProblem(
+                f"Query problems in {label}:\n"
+                + "\n".join(f"  {problem}" for problem in problems)
+            )
+
+    def log(self, label: str) -> None:
+        for problem in self.problems:
+            logger.warning(
+                "%s query in %s: %s", problem.kind, label, problem
+            )
@@ -0,0 +1,165 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Iterator
+
+from django.db import transaction
+from django.db.models import Avg, Count, Max, Min, Q
+from django.utils import timezone
+
+from restaurant.models import Cook, DishType, ReportRow
+
+Row = tuple[str, dict[str, Any]]
+
+# Upper bounds (UAH) of the price bands; the last band is open-ended.
+PRICE_BANDS = (50, 100, 200)
+# Inclusive ranges; ``None`` leaves a range open-ended.
+DISH_COUNT_BUCKETS = ((0, 0), (1, 4), (5, 19), (20, 99), (100, None))
+EXPERIENCE_BUCKETS = ((0, 1), (2, 4), (5, 9), (10, 19), (20, None))
+BUSIEST_COOKS = 10
+
+
+def price_band_labels() -> list[str]:
+    middle = zip(PRICE_BANDS, PRICE_BANDS[1:])
+    return [
+        f"under {PRICE_BANDS[0]}",
+        *(f"{low}–{high}" for low, high in middle),
+        f"{PRICE_BANDS[-1]}+",
+    ]
+
+
+def _bucket_label(low: int, high: int | None) -> str:
+    if high is None:
+        return f"{low}+"
+    return str(low) if low == high else f"{low}–{high}"
+
+
+def _in_bucket(field: str, low: int, high: int | None) -> Q:
+    condition = Q(**{f"{field}__gte": low})
+    if high is not None:
+        condition &= Q(**{f"{field}__lte": high})
+    return condition
+
+
+def _price(value: Decimal | None) -> str | None:
+    return None if value is None else f"{value:.2f}"
+
+
+def price_by_dish_type() -> Iterator[Row]:
+    bounds = (None, *PRICE_BANDS, None)
+    bands = {}
+    for number, (low, high) in enumerate(zip(bounds, bounds[1:])):
+        condition = Q()
+        if low is not None:
+            condition &= Q(dish__price__gte=low)
+        if high is not None:
+            condition &= Q(dish__price__lt=high)
+        bands[f"band_{number}"] = Count("dish", filter=condition)
+
+    dish_types = DishType.objects.annotate(
+        dishes=Count("dish"),
+        min_price=Min("dish__price"),
+        avg_price=Avg("dish__price"),
+        max_price=Max("dish__price"),
+        **bands,
+    ).order_by("name", "pk")
+    for dish_type in dish_types:
+        yield dish_type.name, {
+            "dishes": dish_type.dishes,
+            "min": _price(dish_type.min_price),
+            "avg": _price(dish_type.avg_price),
+            "max": _price(dish_type.max_price),
+            "bands": [getattr(dish_type, band) for band in bands],
+        }
+
+
+def cooks_per_dish_type() -> Iterator[Row]:
+    # Separate from the price report: joining the cooks would repeat every
+    # dish once per cook in the price aggregates.
+    dish_types = DishType.objects.annotate(
+        cooks=Count("dish__cooks", distinct=True),
+        assignments=Count("dish__cooks"),
+    ).order_by("name", "pk").values_list("name", "cooks", "assignments")
+    for name, cooks, assignments in dish_types:
+        yield name, {"cooks": cooks, "assignments": assignments}
+
+
+def _histogram(
+        field: str, buckets: tuple, unknown: bool = False
+) -> list[tuple[str, int]]:
+    """Cooks per bucket of ``field`` (and with no value, when ``unknown``),
+    counted in one pass over the table."""
+    counts = {
+        f"bucket_{number}": Count("pk", filter=_in_bucket(field, low, high))
+        for number, (low, high) in enumerate(buckets)
+    }
+    labels = [_bucket_label(low, high) for low, high in buckets]
+    if unknown:
+        counts["unknown"] = Count("pk", filter=Q(**{f"{field}__isnull": True}))
+        labels.append("unknown")
+
+    return list(zip(labels, Cook.objects.aggregate(**counts).values()))
+
+
+def dishes_per_cook() -> Iterator[Row]:
+    for label, cooks in _histogram("dish_count", DISH_COUNT_BUCKETS):
+        yield label, {"cooks": cooks}
+
+
+def busiest_cooks() -> Iterator[Row]:
+    # A range read of cook_dish_count_id_idx.
+    cooks = Cook.objects.filter(dish_count__gt=0).order_by(
+        "-dish_count", "-pk"
+    ).values_list("pk", "username", "dish_count")[:BUSIEST_COOKS]
+    for pk, username, dishes in cooks:
+        yield username, {"id": pk, "dishes": dishes}
+
+
+def experience_mix() -> Iterator[Row]:
+    histogram = _histogram(
+        "years_of_experience", EXPERIENCE_BUCKETS, unknown=True
+    )
+    for label, cooks in histogram:
+        yield label, {"cooks": cooks}
+
+
+REPORTS = {
+    "price_by_dish_type": price_by_dish_type,
+    "cooks_per_dish_type": cooks_per_dish_type,
+    "dishes_per_cook": dishes_per_cook,
+    "busiest_cooks": busiest_cooks,
+    "experience_mix": experience_mix,
+}
+
+
+def refresh() -> int:
+    """Recompute every report into ``ReportRow``; return the row count."""
+    refreshed_at = timezone.now()
+    rows = [
+        ReportRow(
+            report=name,
+            position=position,
+            label=label,
+            data=data,
+            refreshed_at=refreshed_at,
+        )
+        for name, build in REPORTS.items()
+        for position, (label, data) in enumerate(build())
+    ]
+
+    # Readers see the old reports or the new ones, never a mix.
+    with transaction.atomic():
+        ReportRow.objects.all().delete()
+        ReportRow.objects.bulk_create(rows)
+
+    return len(rows)
+
+
+def load() -> tuple[dict[str, list[ReportRow]], datetime | None]:
+    """The stored reports by name, and when they were computed."""
+    reports = {name: [] for name in REPORTS}
+    refreshed_at = None
+    for row in ReportRow.objects.all():
+        reports.setdefault(row.report, []).append(row)
+        refreshed_at = row.refreshed_at
+
+    return reports, refreshed_at
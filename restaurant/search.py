@@ -0,0 +1,161 @@
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import connections, router
+from django.db.models import Model, QuerySet
+from django.utils.module_loading import import_string
+
+from restaurant.models import Cook, Dish, DishType
+
+SEARCH_FIELDS = {
+    Cook: "username",
+    Dish: "name",
+    DishType: "name",
+}
+
+# Trigram indexes cannot answer anything shorter than one trigram.
+MIN_INDEXED_TERM_LENGTH = 3
+
+
+class SearchBackend:
+    """Filters a model's queryset by its search field.
+
+    ``search`` keeps the ``icontains`` semantics the list views always had;
+    backends only change how the match is found and whether results are
+    ranked (``search_rank`` annotation, best first).
+    """
+
+    def search(self, queryset: QuerySet, term: str) -> QuerySet:
+        if not term:
+            return queryset
+
+        field = SEARCH_FIELDS[queryset.model]
+        return queryset.filter(**{f"{field}__icontains": term})
+
+    def update(self, instance: Model) -> None:
+        pass
+
+    def remove(self, instance: Model) -> None:
+        pass
+
+    def remove_many(self, queryset: QuerySet) -> None:
+        pass
+
+    def rebuild(self, model: type[Model]) -> None:
+        pass
+
+
+class TrigramSearchBackend(SearchBackend):
+    """PostgreSQL backend answered by ``pg_trgm`` GIN indexes.
+
+    The indexes are built on ``UPPER(field::text)``, which is exactly the
+    expression Django emits for ``icontains``, so the plain filter is
+    index-backed and only the ranking is added here.
+    """
+
+    def search(self, queryset: QuerySet, term: str) -> QuerySet:
+        from django.contrib.postgres.search import TrigramSimilarity
+
+        queryset = super().search(queryset, term)
+        if not term:
+            return queryset
+
+        field = SEARCH_FIELDS[queryset.model]
+        return queryset.annotate(
+            search_rank=TrigramSimilarity(field, term)
+        ).order_by("-search_rank", "pk")
+
+
+class FTS5SearchBackend(SearchBackend):
+    """SQLite backend using one FTS5 trigram table per searchable model.
+
+    Each ``<db_table>_fts`` table stores the search field under the
+    object's primary key as rowid and is kept in sync by the signal
+    handlers in ``restaurant.signals``.
+    """
+
+    @staticmethod
+    def table_for(model: type[Model]) -> str:
+        return f"{model._meta.db_table}_fts"
+
+    def search(self, queryset: QuerySet, term: str) -> QuerySet:
+        if len(term) < MIN_INDEXED_TERM_LENGTH:
+            return super().search(queryset, term)
+
+        model = queryset.model
+        table = self.table_for(model)
+        # Joined once against the full-text table, so ``rank`` is computed
+        # in the same pass that finds the matches.
+        return queryset.extra(
+            select={"search_rank": f"{table}.rank"},
+            tables=[table],
+            where=[
+                f"{table} MATCH %s",
+                f'{table}.rowid = "{model._meta.db_table}".'
+                f'"{model._meta.pk.column}"',
+            ],
+            params=['"{}"'.format(term.replace('"', '""'))],
+        ).order_by("search_rank", "pk")
+
+    def update(self, instance: Model) -> None:
+        table = self.table_for(type(instance))
+        value = getattr(instance, SEARCH_FIELDS[type(instance)])
+        with connections[self._db_for(instance)].cursor() as cursor:
+            cursor.execute(
+                f"INSERT OR REPLACE INTO {table} (rowid, body) "
+                f"VALUES (%s, %s)",
+                (instance.pk, value),
+            )
+
+    def remove(self, instance: Model) -> None:
+        table = self.table_for(type(instance))
+        with connections[self._db_for(instance)].cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {table} WHERE rowid = %s", (instance.pk,)
+            )
+
+    def remove_many(self, queryset: QuerySet) -> None:
+        table = self.table_for(queryset.model)
+        sql, params = queryset.values("pk").query.sql_with_params()
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {table} WHERE rowid IN ({sql})", params
+            )
+
+    def rebuild(self, model: type[Model]) -> None:
+        table = self.table_for(model)
+        column = model._meta.get_field(SEARCH_FIELDS[model]).column
+        with connections[router.db_for_write(model)].cursor() as cursor:
+            cursor.execute(f"DELETE FROM {table}")
+            cursor.execute(
+                f"INSERT INTO {table} (rowid, body) "
+                f"SELECT {model._meta.pk.column}, {column} "
+                f"FROM {model._meta.db_table}"
+            )
+
+    @staticmethod
+    def _db_for(instance: Model) -> str:
+        return instance._state.db or router.db_for_write(type(instance))
+
+
+VENDOR_BACKENDS = {
+    "postgresql": TrigramSearchBackend,
+    "sqlite": FTS5SearchBackend,
+}
+
+
+@lru_cache
+def _backend_for(vendor: str) -> SearchBackend:
+    backend_path = getattr(settings, "RESTAURANT_SEARCH_BACKEND", None)
+    if backend_path:
+        return import_string(backend_path)()
+
+    return VENDOR_BACKENDS.get(vendor, SearchBackend)()
+
+
+def get_search_backend(model: type[Model] = Dish) -> SearchBackend:
+    return _backend_for(connections[router.db_for_read(model)].vendor)
+
+
+def search(queryset: QuerySet, term: str) -> QuerySet:
+    return get_search_backend(queryset.model).search(queryset, term)
@@ -0,0 +1,157 @@
+from typing import Any
+
+from django.db.models import Model, QuerySet
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+)
+from django.dispatch import receiver
+
+from restaurant import assignments, caching, counters
+from restaurant.models import Cook, Dish, DishType
+from restaurant.search import SEARCH_FIELDS, get_search_backend
+
+
+def _deleted_with_dish_type(origin: Model | QuerySet | None) -> bool:
+    # Dishes cascaded from a dish type are handled in bulk by
+    # ``delete_dish_type_dishes``, instead of one by one here.
+    if isinstance(origin, QuerySet):
+        return origin.model is DishType
+    return isinstance(origin, DishType)
+
+
+@receiver(post_save, sender=Cook)
+@receiver(post_save, sender=DishType)
+@receiver(post_save, sender=Dish)
+def count_created(
+        sender: type[Model], created: bool, raw: bool = False, **kwargs: Any
+) -> None:
+    if created and not raw:
+        counters.adjust(sender, 1)
+
+
+@receiver(post_delete, sender=Cook)
+@receiver(post_delete, sender=DishType)
+@receiver(post_delete, sender=Dish)
+def count_deleted(
+        sender: type[Model], origin: Any = None, **kwargs: Any
+) -> None:
+    if sender is Dish and _deleted_with_dish_type(origin):
+        return
+
+    counters.adjust(sender, -1)
+
+
+@receiver(post_save, sender=Cook)
+@receiver(post_save, sender=DishType)
+@receiver(post_save, sender=Dish)
+def update_search_index(
+        sender: type[Model],
+        instance: Model,
+        update_fields: frozenset[str] | None = None,
+        **kwargs: Any,
+) -> None:
+    if update_fields is not None and SEARCH_FIELDS[sender] not in update_fields:
+        return
+
+    get_search_backend(sender).update(instance)
+
+
+@receiver(post_delete, sender=Cook)
+@receiver(post_delete, sender=DishType)
+@receiver(post_delete, sender=Dish)
+def remove_from_search_index(
+        sender: type[Model],
+        instance: Model,
+        origin: Any = None,
+        **kwargs: Any,
+) -> None:
+    if sender is Dish and _deleted_with_dish_type(origin):
+        return
+
+    get_search_backend(sender).remove(instance)
+
+
+@receiver(post_save, sender=Cook)
+@receiver(post_save, sender=DishType)
+@receiver(post_save, sender=Dish)
+@receiver(post_delete, sender=Cook)
+@receiver(post_delete, sender=DishType)
+@receiver(post_delete, sender=Dish)
+def touch_changed_model(
+        sender: type[Model],
+        update_fields: frozenset[str] | None = None,
+        origin: Any = None,
+        **kwargs: Any,
+) -> None:
+    # Logging in only stamps ``last_login``, which no page renders.
+    if update_fields == {"last_login"}:
+        return
+    if sender is Dish and _deleted_with_dish_type(origin):
+        return
+
+    caching.touch(sender)
+
+
+@receiver(post_save, sender=Cook)
+@receiver(post_save, sender=DishType)
+@receiver(post_save, sender=Dish)
+def bump_page_versions(
+        instance: Cook | Dish | DishType,
+        created: bool,
+        raw: bool = False,
+        update_fields: frozenset[str] | None = None,
+        **kwargs: Any,
+) -> None:
+    # Nothing shows a new row yet, and no page renders ``last_login``.
+    if created or raw or update_fields == {"last_login"}:
+        return
+
+    caching.bump_pages(instance)
+
+
+@receiver(m2m_changed, sender=Dish.cooks.through)
+def count_assignments(
+        action: str,
+        instance: Cook | Dish,
+        pk_set: set[int] | None,
+        **kwargs: Any,
+) -> None:
+    if action == "post_add" and pk_set:
+        assignments.count_added(instance, pk_set)
+    elif action == "pre_remove" and pk_set:
+        assignments.count_removed(instance, pk_set)
+    elif action == "pre_clear":
+        assignments.count_removed(instance)
+
+
+# On the dish and cook, not the through model: a delete receiver there
+# would make the collector fetch and delete assignments one by one.
+@receiver(pre_delete, sender=Cook)
+@receiver(pre_delete, sender=Dish)
+def uncount_deleted_assignments(
+        instance: Cook | Dish, origin: Any = None, **kwargs: Any
+) -> None:
+    if isinstance(instance, Dish) and _deleted_with_dish_type(origin):
+        return
+
+    assignments.count_removed(instance)
+
+
+@receiver(pre_delete, sender=DishType)
+def delete_dish_type_dishes(instance: DishType, **kwargs: Any) -> None:
+    """Everything the dish receivers do for a deleted dish, done for all
+    the dishes of ``instance`` at once: a cascade costs the same few
+    queries whether the type has one dish or thousands."""
+    dishes = Dish.objects.filter(dish_type=instance)
+    deleted = dishes.count()
+    if not deleted:
+        return
+
+    counters.adjust(Dish, -deleted)
+    assignments.uncount_dishes(dishes)
+    get_search_backend(Dish).remove_many(dishes)
+    caching.touch(Dish)
+
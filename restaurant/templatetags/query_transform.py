@@ -1,18 +1,36 @@
-from pickle import GET
 from typing import Any
 
 from django import template
+from django.http import HttpRequest
 
 register = template.Library()
 
+# Numbered pages and keyset cursors are alternative positions in a list, so
+# setting one of them drops the other. A new sort order drops both, as a
+# position in one order means nothing in another.
+PAGINATION_PARAMS = ("page", "cursor")
+SORT_PARAM = "sort"
+
 
 @register.simple_tag
-def query_transform(request: {GET}, **kwargs: Any) -> Any:
+def query_transform(request: HttpRequest, **kwargs: Any) -> str:
     update = request.GET.copy()
     for key, value in kwargs.items():
+        if key in PAGINATION_PARAMS or key == SORT_PARAM:
+            for param in PAGINATION_PARAMS:
+                update.pop(param, 0)
         if value is not None:
             update[key] = value
         else:
             update.pop(key, 0)
 
     return update.urlencode()
+
+
+@register.simple_tag
+def sort_transform(request: HttpRequest, key: str) -> str:
+    """Query string sorting by ``key``, or by ``-key`` when the list is
+    already sorted by ``key``."""
+    if request.GET.get(SORT_PARAM) == key:
+        key = f"-{key}"
+    return query_transform(request, sort=key)
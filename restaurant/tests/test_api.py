@@ -0,0 +1,195 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from restaurant.models import DishType, Dish
+
+DISH_LIST_URL = reverse("restaurant:api-dish-list")
+
+
+class ApiTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.cook = get_user_model().objects.create_user(
+            username="rick.stein",
+            password="seafood12345",
+        )
+        self.client.force_login(self.cook)
+        self.dish_type = DishType.objects.create(
+            name="Seafood",
+        )
+        self.dishes = [
+            Dish.objects.create(
+                name=f"FISH PIE {number}",
+                description="",
+                price=40,
+                dish_type=self.dish_type,
+            )
+            for number in range(3)
+        ]
+        self.dishes[0].cooks.add(self.cook)
+
+    def test_login_required(self) -> None:
+        self.client.logout()
+
+        response = self.client.get(DISH_LIST_URL)
+
+        self.assertNotEqual(response.status_code, 200)
+
+    def test_dish_list_pages_with_cursor(self) -> None:
+        first = self.client.get(DISH_LIST_URL, {"limit": 2}).json()
+        second = self.client.get(
+            DISH_LIST_URL, {"limit": 2, "cursor": first["next"]},
+        ).json()
+
+        self.assertEqual(
+            first["results"][0],
+            {
+                "id": self.dishes[0].pk,
+                "name": "FISH PIE 0",
+                "price": "40.00",
+                "dish_type": self.dish_type.pk,
+            },
+        )
+        self.assertEqual(
+            [dish["name"] for dish in second["results"]], ["FISH PIE 2"],
+        )
+        self.assertIsNone(second["next"])
+
+    def test_dish_list_search(self) -> None:
+        response = self.client.get(DISH_LIST_URL, {"name": "pie 1"})
+
+        self.assertEqual(
+            [dish["id"] for dish in response.json()["results"]],
+            [self.dishes[1].pk],
+        )
+
+    def test_cook_autocomplete(self) -> None:
+        get_user_model().objects.create_user(username="rick.astley")
+
+        response = self.client.get(
+            reverse("restaurant:api-cook-autocomplete"),
+            {"username": "rick", "limit": 1},
+        )
+
+        self.assertEqual(
+            response.json()["results"],
+            [
+                {
+                    "id": self.cook.pk,
+                    "username": "rick.stein",
+                    "first_name": "",
+                    "last_name": "",
+                }
+            ],
+        )
+        self.assertIsNotNone(response.json()["next"])
+
+    def test_cook_dishes(self) -> None:
+        url = reverse("restaurant:api-cook-dishes", args=[self.cook.pk])
+        self.dishes[2].cooks.add(self.cook)
+
+        first = self.client.get(url, {"limit": 1}).json()
+        second = self.client.get(
+            url, {"limit": 1, "cursor": first["next"]}
+        ).json()
+
+        self.assertEqual(
+            first["results"],
+            [{"id": self.dishes[0].pk, "name": "FISH PIE 0",
+              "dish_type": "Seafood"}],
+        )
+        self.assertEqual(
+            [dish["id"] for dish in second["results"]], [self.dishes[2].pk]
+        )
+        self.assertIsNone(second["next"])
+        self.assertEqual(
+            self.client.get(url, {"cursor": "forged"}).status_code, 400
+        )
+
+    def test_invalid_cursor(self) -> None:
+        response = self.client.get(DISH_LIST_URL, {"cursor": "forged"})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_detail_payloads(self) -> None:
+        dish = self.client.get(
+            reverse("restaurant:api-dish-detail", args=[self.dishes[0].pk])
+        ).json()
+        cook = self.client.get(
+            reverse("restaurant:api-cook-detail", args=[self.cook.pk])
+        ).json()
+
+        self.assertEqual(dish["cooks"], [self.cook.pk])
+        self.assertEqual(cook["dishes"], [self.dishes[0].pk])
+        self.assertEqual(
+            self.client.get(
+                reverse("restaurant:api-dish-type-detail", args=[404])
+            ).status_code,
+            404,
+        )
+
+    def test_unchanged_poll_is_not_modified_without_queries(self) -> None:
+        response = self.client.get(DISH_LIST_URL)
+        etag = response["ETag"]
+
+        # The logged-in user and the change stamps; the session is cached.
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                DISH_LIST_URL, HTTP_IF_NONE_MATCH=etag,
+            )
+
+        self.assertEqual(response.status_code, 304)
+        self.assertIn("Last-Modified", response)
+
+    def test_change_invalidates_etag(self) -> None:
+        etag = self.client.get(DISH_LIST_URL)["ETag"]
+
+        self.dishes[1].name = "COD AND CHIPS"
+        self.dishes[1].save()
+        response = self.client.get(DISH_LIST_URL, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_change_in_another_worker_invalidates_etag(self) -> None:
+        etag = self.client.get(DISH_LIST_URL)["ETag"]
+
+        # Another worker, with an empty cache of its own, saves the dish.
+        cache.clear()
+        self.dishes[1].name = "COD AND CHIPS"
+        self.dishes[1].save()
+        response = self.client.get(DISH_LIST_URL, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "COD AND CHIPS")
+
+    def test_detail_etags_follow_their_own_rows(self) -> None:
+        def etag(dish: Dish) -> str:
+            return self.client.get(
+                reverse("restaurant:api-dish-detail", args=[dish.pk])
+            )["ETag"]
+
+        etags = [etag(dish) for dish in self.dishes]
+        list_etag = self.client.get(DISH_LIST_URL)["ETag"]
+
+        self.dishes[1].cooks.add(self.cook)
+
+        self.assertEqual(etag(self.dishes[0]), etags[0])
+        self.assertNotEqual(etag(self.dishes[1]), etags[1])
+        # Assignments are not part of the list.
+        self.assertEqual(self.client.get(DISH_LIST_URL)["ETag"], list_etag)
+
+    def test_last_modified_alone_is_not_trusted(self) -> None:
+        last_modified = self.client.get(DISH_LIST_URL)["Last-Modified"]
+
+        # A change within the same second has the same Last-Modified.
+        self.dishes[1].name = "COD AND CHIPS"
+        self.dishes[1].save()
+        response = self.client.get(
+            DISH_LIST_URL, HTTP_IF_MODIFIED_SINCE=last_modified,
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "COD AND CHIPS")
@@ -0,0 +1,204 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.db.models.signals import m2m_changed
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from restaurant.assignments import count_added, set_dish_cooks
+from restaurant.models import Dish, DishType
+
+
+class SetDishCooksTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.cooks = get_user_model().objects.bulk_create(
+            get_user_model()(username=f"cook.{number}") for number in range(6)
+        )
+        cls.dish = Dish.objects.create(
+            name="BEEF WELLINGTON",
+            description="",
+            price=45,
+            dish_type=DishType.objects.create(name="Mains"),
+        )
+
+    def setUp(self) -> None:
+        self.dish.cooks.set(self.cooks[:3])
+        self.signals = []
+        m2m_changed.connect(self.record, sender=Dish.cooks.through)
+        self.addCleanup(
+            m2m_changed.disconnect, self.record, sender=Dish.cooks.through
+        )
+
+    def record(self, action: str, pk_set: set[int], **kwargs) -> None:
+        self.signals.append((action, pk_set))
+
+    def pks(self, *numbers: int) -> set[int]:
+        return {self.cooks[number].pk for number in numbers}
+
+    def test_only_the_difference_is_written(self) -> None:
+        # The diff, then per write: the write and an UPDATE of each side's
+        # counts and page versions.
+        with self.assertNumQueries(8):
+            added, removed = set_dish_cooks(
+                self.dish, self.pks(1, 2, 3, 4) | {0},
+            )
+
+        self.assertEqual(added, self.pks(3, 4))
+        self.assertEqual(removed, self.pks(0))
+        self.assertEqual(
+            set(self.dish.cooks.values_list("pk", flat=True)),
+            self.pks(1, 2, 3, 4),
+        )
+        self.assertEqual(
+            self.signals,
+            [
+                ("pre_remove", self.pks(0)),
+                ("post_remove", self.pks(0)),
+                ("pre_add", self.pks(3, 4)),
+                ("post_add", self.pks(3, 4)),
+            ],
+        )
+
+    def test_unchanged_cooks_write_nothing(self) -> None:
+        with self.assertNumQueries(2):
+            self.assertEqual(
+                set_dish_cooks(self.dish, self.pks(0, 1, 2)), (set(), set())
+            )
+        self.assertEqual(self.signals, [])
+
+    def test_clear(self) -> None:
+        added, removed = set_dish_cooks(self.dish, [])
+
+        self.assertEqual((added, removed), (set(), self.pks(0, 1, 2)))
+        self.assertFalse(self.dish.cooks.exists())
+
+    def test_deletes_do_not_fetch_assignments(self) -> None:
+        # The collector deletes through rows in one statement as long as
+        # nothing listens to their deletion; otherwise it fetches them.
+        for instance in (self.dish, self.cooks[1]):
+            with self.subTest(instance=instance):
+                with CaptureQueriesContext(connection) as queries:
+                    instance.delete()
+
+                self.assertFalse(
+                    [
+                        query["sql"] for query in queries
+                        if query["sql"].startswith("SELECT")
+                        and "restaurant_dish_cooks" in query["sql"]
+                    ]
+                )
+
+
+class AssignmentCountTests(TestCase):
+    def setUp(self) -> None:
+        self.cooks = get_user_model().objects.bulk_create(
+            get_user_model()(username=f"cook.{number}") for number in range(3)
+        )
+        dish_type = DishType.objects.create(name="Desserts")
+        self.dishes = Dish.objects.bulk_create(
+            Dish(
+                name=f"TART {number}",
+                description="",
+                price=10,
+                dish_type=dish_type,
+            )
+            for number in range(3)
+        )
+
+    def assert_counts(self, cooks: list[int], dishes: list[int]) -> None:
+        self.assertEqual(
+            list(
+                get_user_model().objects.order_by("pk")
+                .values_list("dish_count", flat=True)
+            ),
+            cooks,
+        )
+        self.assertEqual(
+            list(
+                Dish.objects.order_by("pk")
+                .values_list("cook_count", flat=True)
+            ),
+            dishes,
+        )
+
+    def test_counts_follow_related_managers(self) -> None:
+        first, second, third = self.dishes
+        first.cooks.add(*self.cooks)
+        second.cooks.set(self.cooks[:2])
+        self.cooks[2].dishes.add(third)
+        self.assert_counts([2, 2, 2], [3, 2, 1])
+
+        # Removing a cook who is not assigned changes nothing.
+        third.cooks.remove(self.cooks[0], self.cooks[2])
+        self.assert_counts([2, 2, 1], [3, 2, 0])
+
+        self.cooks[0].dishes.clear()
+        self.assert_counts([0, 2, 1], [2, 1, 0])
+
+    def test_counts_follow_set_dish_cooks(self) -> None:
+        set_dish_cooks(self.dishes[0], [cook.pk for cook in self.cooks[:2]])
+        set_dish_cooks(self.dishes[0], [cook.pk for cook in self.cooks[1:]])
+
+        self.assert_counts([0, 1, 1], [2, 0, 0])
+
+    def test_concurrent_adds_are_counted_once(self) -> None:
+        dish, cook = self.dishes[0], self.cooks[0]
+
+        def add_first(action: str, **kwargs) -> None:
+            if action == "pre_add":
+                # Committed by another request between the diff and INSERT.
+                Dish.cooks.through.objects.create(dish=dish, cook=cook)
+                count_added(dish, {cook.pk})
+
+        m2m_changed.connect(add_first, sender=Dish.cooks.through)
+        self.addCleanup(
+            m2m_changed.disconnect, add_first, sender=Dish.cooks.through
+        )
+
+        added, removed = set_dish_cooks(dish, [cook.pk, self.cooks[1].pk])
+
+        self.assertEqual((added, removed), ({self.cooks[1].pk}, set()))
+        self.assert_counts([1, 1, 0], [2, 0, 0])
+
+    def test_deletes_uncount_assignments(self) -> None:
+        for dish in self.dishes:
+            dish.cooks.set(self.cooks)
+
+        self.dishes[0].delete()
+        self.cooks[0].delete()
+
+        self.assertEqual(
+            list(
+                get_user_model().objects.order_by("pk")
+                .values_list("dish_count", flat=True)
+            ),
+            [2, 2],
+        )
+        self.assertEqual(
+            list(Dish.objects.values_list("cook_count", flat=True)), [2, 2]
+        )
+
+    def test_full_save_keeps_stored_count(self) -> None:
+        stale = Dish.objects.get(pk=self.dishes[0].pk)
+        self.dishes[0].cooks.add(self.cooks[0])
+
+        stale.name = "LEMON TART"
+        stale.save()
+
+        stale.refresh_from_db()
+        self.assertEqual((stale.name, stale.cook_count), ("LEMON TART", 1))
+
+    def test_repair_command(self) -> None:
+        self.dishes[0].cooks.add(*self.cooks)
+        Dish.objects.filter(pk=self.dishes[0].pk).update(cook_count=7)
+        # Removing through rows directly bypasses the receivers.
+        Dish.cooks.through.objects.filter(cook_id=self.cooks[0].pk).delete()
+        out = StringIO()
+
+        call_command("repair_assignment_counts", stdout=out)
+
+        self.assert_counts([0, 1, 1], [2, 0, 0])
+        self.assertIn("Repaired 2 count(s).", out.getvalue())
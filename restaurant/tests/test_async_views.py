@@ -0,0 +1,140 @@
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.sessions.backends.cache import SessionStore
+from django.core.cache import cache
+from django.http import Http404
+from django.test import AsyncRequestFactory, TestCase
+
+from restaurant import async_views
+from restaurant.models import DishType, Dish
+
+CSRF_SECRET = "a" * 32
+
+
+class AsyncViewsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.cook = get_user_model().objects.create_user(
+            username="yotam.ottolenghi",
+            password="plenty123456",
+        )
+        cls.dish_type = DishType.objects.create(
+            name="Salads",
+        )
+        cls.dishes = [
+            Dish.objects.create(
+                name=f"SALAD {number}",
+                description="",
+                price=30,
+                dish_type=cls.dish_type,
+            )
+            for number in range(7)
+        ]
+        cls.dishes[0].cooks.add(cls.cook)
+
+    def setUp(self) -> None:
+        cache.clear()
+
+    def get(self, path: str, data: dict | None = None, user=None):
+        request = AsyncRequestFactory().get(path, data)
+        request.user = self.cook if user is None else user
+        request.session = SessionStore()
+        # Set by CsrfViewMiddleware from the client's cookie.
+        request.META["CSRF_COOKIE"] = CSRF_SECRET
+        return request
+
+    async def render(self, response):
+        return await sync_to_async(response.render)()
+
+    async def test_login_required(self) -> None:
+        response = await async_views.index(
+            self.get("/", user=AnonymousUser())
+        )
+
+        self.assertEqual(response.status_code, 302)
+
+    async def test_index_counts_and_visits(self) -> None:
+        request = self.get("/")
+
+        response = await async_views.index(request)
+        response = await async_views.index(request)
+
+        self.assertEqual(response.context_data["num_dishes"], 7)
+        self.assertEqual(response.context_data["num_cooks"], 1)
+        self.assertEqual(response.context_data["num_dish_types"], 1)
+        self.assertEqual(response.context_data["num_visits"], 2)
+
+    async def test_dish_list_pages(self) -> None:
+        response = await async_views.dish_list(self.get("/dishes/"))
+        page = response.context_data["page_obj"]
+        response = await async_views.dish_list(
+            self.get("/dishes/", {"cursor": page.next_cursor})
+        )
+
+        await self.render(response)
+        self.assertEqual(
+            [dish.name for dish in response.context_data["dish_list"]],
+            ["SALAD 5", "SALAD 6"],
+        )
+        self.assertContains(response, "SALAD 6")
+
+    async def test_dish_list_sort(self) -> None:
+        response = await async_views.dish_list(
+            self.get("/dishes/", {"sort": "-cooks"})
+        )
+
+        self.assertEqual(response.context_data["sort"], "-cooks")
+        self.assertEqual(
+            [dish.name for dish in response.context_data["dish_list"]],
+            ["SALAD 0", "SALAD 6", "SALAD 5", "SALAD 4", "SALAD 3"],
+        )
+        await self.render(response)
+        self.assertContains(response, "&#9660;")
+
+    async def test_dish_list_search_sort(self) -> None:
+        response = await async_views.dish_list(
+            self.get("/dishes/", {"name": "salad", "sort": "-cooks"})
+        )
+
+        self.assertEqual(response.context_data["sort"], "-cooks")
+        self.assertEqual(
+            [dish.name for dish in response.context_data["dish_list"]],
+            ["SALAD 0", "SALAD 6", "SALAD 5", "SALAD 4", "SALAD 3"],
+        )
+
+    async def test_dish_list_search(self) -> None:
+        response = await async_views.dish_list(
+            self.get("/dishes/", {"name": "salad 3"})
+        )
+
+        self.assertEqual(
+            [dish.name for dish in response.context_data["dish_list"]],
+            ["SALAD 3"],
+        )
+
+    async def test_dish_detail(self) -> None:
+        response = await async_views.dish_detail(
+            self.get(f"/dishes/{self.dishes[0].pk}/"), pk=self.dishes[0].pk,
+        )
+
+        await self.render(response)
+        self.assertContains(response, "Delete me from this dish")
+        self.assertContains(response, "yotam.ottolenghi")
+
+    async def test_cook_detail_is_cached(self) -> None:
+        path = f"/cooks/{self.cook.pk}/"
+        response = await async_views.cook_detail(
+            self.get(path), pk=self.cook.pk,
+        )
+        await self.render(response)
+
+        cached = await async_views.cook_detail(
+            self.get(path), pk=self.cook.pk,
+        )
+
+        self.assertEqual(cached.content, response.content)
+
+    async def test_missing_detail(self) -> None:
+        with self.assertRaises(Http404):
+            await async_views.dish_detail(self.get("/dishes/404/"), pk=404)
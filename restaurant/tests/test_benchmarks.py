@@ -0,0 +1,135 @@
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+
+from restaurant import counters
+from restaurant.benchmarks import (
+    WRITE_ROUTES,
+    benchmark_assignments,
+    benchmark_reports,
+    benchmark_routes,
+    compare_to_baseline,
+    kitchen_records,
+)
+from restaurant.models import Dish
+from restaurant.urls import urlpatterns
+
+
+class SeedKitchenTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+
+    def test_records_are_deterministic(self) -> None:
+        self.assertEqual(
+            list(kitchen_records(50, 10, 120, seed=7)),
+            list(kitchen_records(50, 10, 120, seed=7)),
+        )
+        self.assertNotEqual(
+            list(kitchen_records(50, 10, 120, seed=7)),
+            list(kitchen_records(50, 10, 120, seed=8)),
+        )
+
+    def test_seed_kitchen_command(self) -> None:
+        out = StringIO()
+
+        call_command(
+            "seed_kitchen",
+            "--dishes=40",
+            "--cooks=6",
+            "--assignments=100",
+            "--dish-types=4",
+            stdout=out,
+        )
+
+        self.assertIn(
+            "4 dish type(s), 6 cook(s) and 40 dish(es)", out.getvalue()
+        )
+        self.assertEqual(Dish.cooks.through.objects.count(), 100)
+        self.assertEqual(
+            counters.get_counts(),
+            {"num_cooks": 6, "num_dish_types": 4, "num_dishes": 40},
+        )
+
+    def test_assignments_are_capped_by_pairs(self) -> None:
+        call_command(
+            "seed_kitchen", "--dishes=3", "--cooks=2", "--assignments=100",
+            stdout=StringIO(),
+        )
+
+        self.assertEqual(Dish.cooks.through.objects.count(), 6)
+
+
+class BenchmarkRoutesTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+
+    def test_every_route_is_measured(self) -> None:
+        call_command(
+            "seed_kitchen", "--dishes=20", "--cooks=4", "--assignments=30",
+            stdout=StringIO(),
+        )
+
+        results = benchmark_routes(repeat=1)
+
+        self.assertEqual(
+            list(results),
+            [
+                pattern.name for pattern in urlpatterns
+                if pattern.name not in WRITE_ROUTES
+            ],
+        )
+        for name, result in results.items():
+            with self.subTest(name=name):
+                self.assertLess(result["status"], 400)
+                self.assertGreater(result["queries"], 0)
+
+    def test_assignments(self) -> None:
+        results = benchmark_assignments(assignments=20, repeat=1)
+
+        self.assertEqual(
+            results["clear"]["set_dish_cooks"]["queries"],
+            results["clear"]["set()"]["queries"],
+        )
+        for name in ("delete dish", "delete cook"):
+            with self.subTest(name=name):
+                self.assertGreater(
+                    results[name]["row by row"]["queries"],
+                    results[name]["fast path"]["queries"],
+                )
+
+    def test_reports(self) -> None:
+        call_command(
+            "seed_kitchen", "--dishes=20", "--cooks=4", "--assignments=30",
+            stdout=StringIO(),
+        )
+
+        results = benchmark_reports(repeat=1)
+
+        self.assertEqual(results["page_queries"], 2)
+        self.assertGreater(results["refresh_ms"], 0)
+
+    def test_compare_to_baseline(self) -> None:
+        baseline = {
+            "100": {
+                "dish-list": {"ms": 10.0, "queries": 4, "peak_kb": 100.0},
+                "cook-list": {"ms": 10.0, "queries": 4, "peak_kb": 100.0},
+            }
+        }
+        results = {
+            "100": {
+                "dish-list": {"ms": 30.0, "queries": 5, "peak_kb": 120.0},
+                "cook-list": {"ms": 14.0, "queries": 4, "peak_kb": 500.0},
+                "index": {"ms": 99.0, "queries": 9, "peak_kb": 999.0},
+            }
+        }
+
+        self.assertEqual(
+            compare_to_baseline(results, baseline, tolerance=0.5),
+            [
+                "dish-list @ 100: queries 4 -> 5",
+                "dish-list @ 100: ms 10.0 -> 30.0",
+                "cook-list @ 100: peak_kb 100.0 -> 500.0",
+            ],
+        )
@@ -0,0 +1,125 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from restaurant.caching import get_stamps
+from restaurant.models import DishType, Dish
+
+
+class CachedDetailPageTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.cook = get_user_model().objects.create_user(
+            username="nigella.lawson",
+            password="domesticgoddess123",
+        )
+        self.client.force_login(self.cook)
+        self.dish_type = DishType.objects.create(
+            name="Desserts",
+        )
+        self.dish = Dish.objects.create(
+            name="CHOCOLATE GUINNESS CAKE",
+            description="Dark, damp and luscious.",
+            price=70.0,
+            dish_type=self.dish_type,
+        )
+        self.url = reverse("restaurant:dish-detail", args=[self.dish.pk])
+
+    def test_repeat_view_skips_orm_and_templates(self) -> None:
+        self.client.get(self.url)
+
+        # The logged-in user and the dish's version; the session is cached.
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+
+        self.assertContains(response, "Dark, damp and luscious.")
+        self.assertEqual(response.templates, [])
+
+    def test_dish_change_invalidates_page(self) -> None:
+        self.client.get(self.url)
+
+        self.dish.description = "Made with stout."
+        self.dish.save()
+
+        self.assertContains(self.client.get(self.url), "Made with stout.")
+
+    def test_dish_type_change_invalidates_page(self) -> None:
+        self.client.get(self.url)
+
+        self.dish_type.name = "Cakes"
+        self.dish_type.save()
+
+        self.assertContains(self.client.get(self.url), "Cakes")
+
+    def test_assignment_change_invalidates_page(self) -> None:
+        self.client.get(self.url)
+
+        self.dish.cooks.add(self.cook)
+
+        self.assertContains(
+            self.client.get(self.url), "Delete me from this dish"
+        )
+
+    def test_cook_change_invalidates_page(self) -> None:
+        self.dish.cooks.add(self.cook)
+        self.client.get(self.url)
+
+        self.cook.username = "nigella"
+        self.cook.save()
+
+        self.assertContains(self.client.get(self.url), "nigella</td>")
+
+    def test_other_dishes_keep_their_pages(self) -> None:
+        other_dish = Dish.objects.create(
+            name="NUTELLA CHEESECAKE",
+            description="",
+            price=60.0,
+            dish_type=self.dish_type,
+        )
+        self.client.get(self.url)
+
+        other_dish.cooks.add(self.cook)
+        other_dish.name = "NO-BAKE NUTELLA CHEESECAKE"
+        other_dish.save()
+
+        with self.assertNumQueries(2):
+            self.client.get(self.url)
+
+    def test_stamps_are_shared_through_the_database(self) -> None:
+        self.client.get(self.url)
+        stamps = get_stamps(Dish, DishType)
+        # Another worker starts with an empty cache of its own.
+        cache.clear()
+
+        self.assertEqual(get_stamps(Dish, DishType), stamps)
+
+        self.dish.description = "Made with stout."
+        self.dish.save()
+        self.assertGreater(
+            get_stamps(Dish)["restaurant.dish"], stamps["restaurant.dish"]
+        )
+
+    def test_pages_are_cached_per_user(self) -> None:
+        self.dish.cooks.add(self.cook)
+        self.client.get(self.url)
+        other_cook = get_user_model().objects.create_user(
+            username="mary.berry",
+            password="bakeoff12345",
+        )
+        self.client.force_login(other_cook)
+
+        response = self.client.get(self.url)
+
+        self.assertContains(response, "mary.berry")
+        self.assertContains(response, "Assign me to this dish")
+
+    def test_login_does_not_invalidate_pages(self) -> None:
+        self.client.get(self.url)
+
+        self.client.login(
+            username="nigella.lawson", password="domesticgoddess123",
+        )
+
+        with self.assertNumQueries(2):
+            self.client.get(self.url)
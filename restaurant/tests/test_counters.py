@@ -0,0 +1,93 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import IntegrityError, connection, transaction
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from restaurant import counters
+from restaurant.models import DishType, Dish
+
+INDEX_URL = reverse("restaurant:index")
+
+
+class CountersTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.cook = get_user_model().objects.create_user(
+            username="gordon.ramsay",
+            password="hellskitchen123",
+        )
+        self.dish_type = DishType.objects.create(
+            name="Soups",
+        )
+
+    def test_counts_are_filled_from_tables(self) -> None:
+        self.assertEqual(
+            counters.get_counts(),
+            {"num_cooks": 1, "num_dish_types": 1, "num_dishes": 0},
+        )
+
+    def test_counts_follow_saves_and_deletes(self) -> None:
+        counters.get_counts()
+
+        dish = Dish.objects.create(
+            name="FRENCH ONION SOUP",
+            description="Slowly caramelised onions in beef stock.",
+            price=45.0,
+            dish_type=self.dish_type,
+        )
+        self.assertEqual(counters.get_counts()["num_dishes"], 1)
+
+        dish.delete()
+        self.assertEqual(counters.get_counts()["num_dishes"], 0)
+
+    def test_counts_are_shared_through_the_database(self) -> None:
+        counters.get_counts()
+        DishType.objects.create(name="Salads")
+        # Another worker starts with an empty cache of its own.
+        cache.clear()
+
+        with self.assertNumQueries(1):
+            counts = counters.get_counts()
+
+        self.assertEqual(counts["num_dish_types"], 2)
+
+    def test_rolled_back_writes_are_not_counted(self) -> None:
+        counters.get_counts()
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            DishType.objects.create(name="Salads")
+            Dish.objects.create(
+                name="CAESAR SALAD", description="", price=None,
+                dish_type=self.dish_type,
+            )
+
+        self.assertEqual(counters.get_counts()["num_dish_types"], 1)
+
+    def test_index_does_not_query_counted_tables(self) -> None:
+        self.client.force_login(self.cook)
+        counters.get_counts()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(INDEX_URL)
+
+        for query in queries.captured_queries:
+            self.assertNotIn("COUNT(", query["sql"])
+
+        self.assertEqual(response.context["num_cooks"], 1)
+        self.assertEqual(response.context["num_dish_types"], 1)
+        self.assertEqual(response.context["num_dishes"], 0)
+
+    def test_reconcile_fixes_drift(self) -> None:
+        counters.get_counts()
+        counters.adjust(DishType, 5)
+
+        out = StringIO()
+        call_command("reconcile_counters", stdout=out)
+
+        self.assertIn("num_dish_types: 6 -> 1", out.getvalue())
+        self.assertEqual(counters.get_counts()["num_dish_types"], 1)
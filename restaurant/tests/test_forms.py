@@ -1,9 +1,12 @@
+from django.contrib.auth import get_user_model
 from django.test import TestCase
 
 from restaurant.forms import (
     CookCreationForm,
     CookYearsOfExperienceUpdateForm,
+    DishForm,
 )
+from restaurant.models import Dish, DishType
 
 
 class FormsTests(TestCase):
@@ -38,3 +41,82 @@ class FormsTests(TestCase):
         self.assertEqual(
             form.cleaned_data, self.form_data,
         )
+
+
+class DishFormTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.dish_type = DishType.objects.create(name="Pastry")
+        cls.cooks = get_user_model().objects.bulk_create(
+            get_user_model()(
+                username=f"cook.{number}",
+                first_name="Mary",
+                last_name=f"Berry {number}",
+            )
+            for number in range(5)
+        )
+        cls.dish = Dish.objects.create(
+            name="VICTORIA SPONGE",
+            description="",
+            price=12,
+            dish_type=cls.dish_type,
+        )
+        cls.dish.cooks.add(cls.cooks[0], cls.cooks[1])
+
+    def form_data(self, cooks: list) -> dict:
+        return {
+            "name": "LEMON DRIZZLE",
+            "description": "Tangy.",
+            "price": "9.50",
+            "dish_type": self.dish_type.pk,
+            "cooks": cooks,
+        }
+
+    def test_cooks_are_checked_in_one_query(self) -> None:
+        form = DishForm(
+            data=self.form_data([cook.pk for cook in self.cooks[:3]])
+        )
+
+        # The dish type (by the form field, then by model validation) and
+        # every submitted cook at once.
+        with self.assertNumQueries(3):
+            self.assertTrue(form.is_valid())
+        self.assertEqual(
+            form.cleaned_data["cooks"], [cook.pk for cook in self.cooks[:3]]
+        )
+
+    def test_unknown_and_malformed_cooks_are_rejected(self) -> None:
+        for cooks, code in (
+            ([self.cooks[0].pk, 0], "invalid_choice"),
+            (["nobody"], "invalid_pk_value"),
+        ):
+            with self.subTest(cooks=cooks):
+                form = DishForm(data=self.form_data(cooks))
+
+                self.assertFalse(form.is_valid())
+                self.assertEqual(
+                    form.errors.as_data()["cooks"][0].code, code
+                )
+
+    def test_save_replaces_the_cooks(self) -> None:
+        form = DishForm(
+            data=self.form_data([self.cooks[1].pk, self.cooks[2].pk]),
+            instance=self.dish,
+        )
+
+        self.assertEqual(
+            form.initial["cooks"], [self.cooks[0].pk, self.cooks[1].pk]
+        )
+        self.assertTrue(form.is_valid())
+        form.save()
+        self.assertQuerysetEqual(
+            self.dish.cooks.order_by("pk"),
+            [self.cooks[1], self.cooks[2]],
+        )
+
+    def test_only_selected_cooks_are_rendered(self) -> None:
+        html = str(DishForm(instance=self.dish)["cooks"])
+
+        self.assertIn("cook.0 (Mary Berry 0)", html)
+        self.assertIn("cook.1 (Mary Berry 1)", html)
+        self.assertNotIn("cook.2", html)
@@ -0,0 +1,75 @@
+from unittest import mock
+
+from django.conf import settings
+from django.db import OperationalError
+from django.test import TestCase
+
+from restaurant import health
+
+
+class HealthCheckTests(TestCase):
+    def setUp(self) -> None:
+        patcher = mock.patch.object(
+            health, "_migrations_checked_at", float("-inf")
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_healthz(self) -> None:
+        with self.assertNumQueries(0):
+            response = self.client.get("/healthz")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b"ok")
+
+    def test_probes_skip_sessions_and_host_validation(self) -> None:
+        for path in ("/healthz", "/readyz/"):
+            with self.subTest(path=path):
+                response = self.client.get(path, HTTP_HOST="10.0.0.5")
+
+                self.assertEqual(response.status_code, 200)
+                self.assertNotIn(settings.SESSION_COOKIE_NAME, response.cookies)
+                self.assertNotIn(settings.CSRF_COOKIE_NAME, response.cookies)
+
+    def test_readyz(self) -> None:
+        response = self.client.get("/readyz")
+
+        self.assertEqual(response.status_code, 200)
+        # The test cache is per process, which leaves nothing to check.
+        self.assertEqual(
+            response.json(), {"database": "ok", "migrations": "ok"},
+        )
+
+    def test_readyz_checks_a_shared_cache(self) -> None:
+        with mock.patch.object(health, "cache_is_shared", return_value=True):
+            response = self.client.get("/readyz")
+
+        self.assertEqual(
+            response.json(),
+            {"database": "ok", "cache": "ok", "migrations": "ok"},
+        )
+
+    def test_readyz_fails_when_the_database_is_down(self) -> None:
+        with mock.patch.dict(
+            health.CHECKS,
+            database=mock.Mock(
+                side_effect=OperationalError("refused by db.internal:5432")
+            ),
+        ), self.assertLogs("restaurant.health", "ERROR") as logs:
+            response = self.client.get("/readyz")
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()["database"], "fail")
+        self.assertNotIn(b"db.internal", response.content)
+        self.assertIn("db.internal", logs.output[0])
+
+    def test_migration_state_is_reused(self) -> None:
+        with mock.patch.object(
+            health, "pending_migrations", return_value=2
+        ) as pending_migrations, self.assertLogs("restaurant.health"):
+            first = self.client.get("/readyz")
+            second = self.client.get("/readyz")
+
+        self.assertEqual(first.status_code, 503)
+        self.assertEqual(second.json()["migrations"], "fail")
+        pending_migrations.assert_called_once()
@@ -0,0 +1,139 @@
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from restaurant.models import Dish, DishType
+from restaurant.pagination import CURSOR_PARAM, SORT_PARAM
+
+LIST_URLS = (
+    reverse("restaurant:dish-type-list"),
+    reverse("restaurant:dish-list"),
+    reverse("restaurant:cook-list"),
+)
+SORTED_LISTS = (
+    (reverse("restaurant:dish-list"), "name"),
+    (reverse("restaurant:dish-list"), "cooks"),
+    (reverse("restaurant:dish-list"), "-cooks"),
+    (reverse("restaurant:cook-list"), "-dishes"),
+)
+
+
+@skipUnless(connection.vendor == "sqlite", "EXPLAIN QUERY PLAN is SQLite's")
+class ListQueryPlanTests(TestCase):
+    """Every list page must be an index range read, not a table scan or
+    a sort of the whole table."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        DishType.objects.bulk_create(
+            DishType(name=f"Type {number:02}") for number in range(20)
+        )
+        dish_type = DishType.objects.first()
+        Dish.objects.bulk_create(
+            Dish(
+                name=f"Dish {number:02}",
+                description="",
+                price=1,
+                dish_type=dish_type,
+            )
+            for number in range(20)
+        )
+        get_user_model().objects.bulk_create(
+            get_user_model()(username=f"cook{number:02}")
+            for number in range(20)
+        )
+        cls.user = get_user_model().objects.create_user(
+            username="test", password="test123"
+        )
+        Dish.cooks.through.objects.bulk_create(
+            Dish.cooks.through(dish=dish, cook=cls.user)
+            for dish in Dish.objects.all()
+        )
+
+    def setUp(self) -> None:
+        self.client.force_login(self.user)
+
+    def query_plans(self, url: str, **params: str) -> dict[str, str]:
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+
+        plans = {}
+        with connection.cursor() as cursor:
+            for query in context.captured_queries:
+                sql = query["sql"]
+                if sql.startswith("SELECT") and "restaurant_" in sql:
+                    cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+                    plans[sql] = "\n".join(row[-1] for row in cursor)
+        return plans
+
+    def assert_no_full_scan(self, plans: dict[str, str]) -> None:
+        for sql, plan in plans.items():
+            with self.subTest(sql=sql):
+                # Previous pages re-sort the ``pk IN (... LIMIT n)`` rows,
+                # which is bounded by the page size.
+                if "LIST SUBQUERY" not in plan:
+                    self.assertNotIn("TEMP B-TREE", plan)
+                for line in plan.splitlines():
+                    if line.startswith("SCAN"):
+                        self.assertIn("USING", line)
+
+    def test_first_pages_read_in_index_order(self) -> None:
+        for url in LIST_URLS:
+            with self.subTest(url=url):
+                for sql, plan in self.query_plans(url).items():
+                    self.assertNotIn("TEMP B-TREE", plan, sql)
+
+    def test_cursor_pages_use_indexes(self) -> None:
+        for url in LIST_URLS:
+            with self.subTest(url=url):
+                page = self.client.get(url).context["page_obj"]
+                self.assert_no_full_scan(
+                    self.query_plans(url, **{CURSOR_PARAM: page.next_cursor})
+                )
+
+                page = self.client.get(
+                    url, {CURSOR_PARAM: page.next_cursor}
+                ).context["page_obj"]
+                self.assert_no_full_scan(
+                    self.query_plans(
+                        url, **{CURSOR_PARAM: page.previous_cursor}
+                    )
+                )
+
+    def test_sorted_pages_use_indexes(self) -> None:
+        for url, sort in SORTED_LISTS:
+            with self.subTest(url=url, sort=sort):
+                for sql, plan in self.query_plans(
+                        url, **{SORT_PARAM: sort}
+                ).items():
+                    self.assertNotIn("TEMP B-TREE", plan, sql)
+
+                page = self.client.get(
+                    url, {SORT_PARAM: sort}
+                ).context["page_obj"]
+                self.assert_no_full_scan(
+                    self.query_plans(
+                        url,
+                        **{SORT_PARAM: sort, CURSOR_PARAM: page.next_cursor},
+                    )
+                )
+
+    def test_cook_dishes_pages_need_no_sort(self) -> None:
+        url = reverse("restaurant:api-cook-dishes", args=[self.user.pk])
+        cursor = self.client.get(url, {"limit": 5}).json()["next"]
+
+        for params in ({"limit": 5}, {"limit": 5, CURSOR_PARAM: cursor}):
+            with self.subTest(params=params):
+                plans = self.query_plans(url, **params)
+
+                self.assert_no_full_scan(plans)
+                for sql, plan in plans.items():
+                    if "restaurant_dish_cooks" in sql:
+                        self.assertIn(
+                            "restaurant_dish_cooks_cook_dish_idx", plan
+                        )
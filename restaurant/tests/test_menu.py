@@ -0,0 +1,192 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from restaurant import counters, menu
+from restaurant.management.commands.export_menu import CSV_FILES
+from restaurant.models import DishType, Dish
+from restaurant.search import search
+
+
+class MenuImportExportTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.cook = get_user_model().objects.create_user(
+            username="marco.white",
+            password="enfantterrible1",
+            first_name="Marco",
+            last_name="White",
+            years_of_experience=30,
+        )
+        get_user_model().objects.create_user(
+            username="heston.blumenthal",
+            password="fatduck12345",
+        )
+        self.dish_type = DishType.objects.create(
+            name="Mains",
+        )
+        dish = Dish.objects.create(
+            name="BEEF WELLINGTON",
+            description="Fillet in puff pastry.",
+            price=120.5,
+            dish_type=self.dish_type,
+        )
+        dish.cooks.add(self.cook)
+        Dish.objects.create(
+            name="FISH PIE",
+            description="",
+            price=60,
+            dish_type=self.dish_type,
+        )
+
+    def export_jsonl(self) -> list[dict]:
+        out = StringIO()
+        call_command("export_menu", "-", stdout=out)
+        return [json.loads(line) for line in out.getvalue().splitlines()]
+
+    def test_export_jsonl(self) -> None:
+        records = self.export_jsonl()
+
+        self.assertEqual(records[0], {"model": "dish_type", "name": "Mains"})
+        self.assertIn(
+            {
+                "model": "cook",
+                "username": "marco.white",
+                "first_name": "Marco",
+                "last_name": "White",
+                "years_of_experience": 30,
+            },
+            records,
+        )
+        self.assertEqual(
+            records[-2:],
+            [
+                {
+                    "model": "dish",
+                    "name": "BEEF WELLINGTON",
+                    "description": "Fillet in puff pastry.",
+                    "price": "120.50",
+                    "dish_type": "Mains",
+                    "cooks": ["marco.white"],
+                },
+                {
+                    "model": "dish",
+                    "name": "FISH PIE",
+                    "description": "",
+                    "price": "60.00",
+                    "dish_type": "Mains",
+                    "cooks": [],
+                },
+            ],
+        )
+
+    def test_jsonl_round_trip(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "menu.jsonl"
+            call_command("export_menu", str(path))
+            exported = path.read_text()
+            Dish.objects.all().delete()
+            DishType.objects.all().delete()
+            get_user_model().objects.exclude(pk=self.cook.pk).delete()
+
+            call_command("import_menu", str(path), stdout=StringIO())
+            call_command("export_menu", str(path))
+
+            self.assertEqual(path.read_text(), exported)
+
+    def test_csv_round_trip(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            call_command("export_menu", directory, format="csv")
+            Dish.objects.all().delete()
+
+            call_command(
+                "import_menu", directory, format="csv", stdout=StringIO(),
+            )
+
+        dish = Dish.objects.get(name="BEEF WELLINGTON")
+        self.assertEqual(list(dish.cooks.all()), [self.cook])
+        self.assertEqual(dish.dish_type, self.dish_type)
+        self.assertEqual(DishType.objects.count(), 1)
+
+    def test_import_refreshes_counters_and_search(self) -> None:
+        counters.get_counts()
+        lines = [
+            {"model": "dish", "name": f"SOUP {number}", "price": "9.99",
+             "dish_type": "Soups", "cooks": ["heston.blumenthal"]}
+            for number in range(25)
+        ]
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "menu.jsonl"
+            path.write_text("\n".join(json.dumps(line) for line in lines))
+            call_command(
+                "import_menu", str(path), batch_size=10, stdout=StringIO(),
+            )
+
+        self.assertEqual(counters.get_counts()["num_dishes"], 27)
+        self.assertEqual(search(Dish.objects.all(), "soup").count(), 25)
+        self.assertEqual(
+            Dish.objects.filter(cooks__username="heston.blumenthal").count(),
+            25,
+        )
+        self.assertEqual(
+            get_user_model().objects.get(
+                username="heston.blumenthal"
+            ).dish_count,
+            25,
+        )
+        self.assertEqual(Dish.objects.get(name="SOUP 0").cook_count, 1)
+
+    def test_unknown_cook_rolls_back_import(self) -> None:
+        line = {"model": "dish", "name": "TRIFLE", "price": "5",
+                "dish_type": "Desserts", "cooks": ["nobody"]}
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "menu.jsonl"
+            path.write_text(json.dumps(line))
+
+            with self.assertRaises(CommandError):
+                call_command("import_menu", str(path), stdout=StringIO())
+
+        self.assertFalse(DishType.objects.filter(name="Desserts").exists())
+
+    def test_invalid_value_reports_its_line(self) -> None:
+        lines = [
+            {"model": "dish_type", "name": "Desserts"},
+            {"model": "dish", "name": "TRIFLE", "price": "cheap",
+             "dish_type": "Desserts"},
+        ]
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "menu.jsonl"
+            path.write_text("\n".join(json.dumps(line) for line in lines))
+
+            with self.assertRaisesMessage(
+                CommandError, "Line 2: price: “cheap” value must be"
+            ):
+                call_command("import_menu", str(path), stdout=StringIO())
+
+        self.assertFalse(DishType.objects.filter(name="Desserts").exists())
+
+    def test_missing_value_reports_its_csv_line(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            call_command("export_menu", directory, format="csv")
+            path = Path(directory) / CSV_FILES[menu.COOK]
+            path.write_text(path.read_text() + ",Anna,Berry,3\n")
+            line_number = len(path.read_text().splitlines())
+
+            with self.assertRaisesMessage(
+                CommandError,
+                f"{CSV_FILES[menu.COOK]} line {line_number}: username: this "
+                "field is required.",
+            ):
+                call_command(
+                    "import_menu", directory, format="csv", stdout=StringIO(),
+                )
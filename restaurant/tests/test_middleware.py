@@ -0,0 +1,145 @@
+from django.contrib.auth import get_user_model
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from restaurant import metrics
+from restaurant.middleware import QueryDetectorMiddleware
+from restaurant.models import DishType
+from restaurant.query_detector import QueryDetector, QueryProblem, fingerprint
+
+INDEX_URL = reverse("restaurant:index")
+METRICS_URL = reverse("restaurant:metrics")
+
+
+class PerformanceMiddlewareTests(TestCase):
+    def setUp(self) -> None:
+        metrics.reset()
+        self.user = get_user_model().objects.create_user(
+            username="test",
+            password="test123",
+        )
+        self.client.force_login(self.user)
+
+    def test_server_timing_header(self) -> None:
+        response = self.client.get(INDEX_URL)
+
+        timing = response["Server-Timing"]
+        self.assertRegex(timing, r"^app;dur=[\d.]+, ")
+        self.assertRegex(timing, r'db;dur=[\d.]+;desc="\d+ queries"')
+        self.assertRegex(timing, r"render;dur=[\d.]+$")
+
+    def test_requests_are_recorded_per_url_name(self) -> None:
+        self.client.get(INDEX_URL)
+        self.client.get(INDEX_URL)
+        self.client.get("/no-such-page/")
+
+        summary = metrics.summary()
+
+        self.assertEqual(list(summary), ["restaurant:index"])
+        self.assertEqual(summary["restaurant:index"]["count"], 2)
+        self.assertGreater(summary["restaurant:index"]["queries"]["p50"], 0)
+        self.assertGreater(summary["restaurant:index"]["bytes"]["p99"], 0)
+
+    def test_metrics_endpoint_is_staff_only(self) -> None:
+        response = self.client.get(METRICS_URL)
+
+        self.assertEqual(response.status_code, 302)
+
+    def test_metrics_endpoint(self) -> None:
+        self.user.is_staff = True
+        self.user.save()
+        self.client.get(INDEX_URL)
+
+        response = self.client.get(METRICS_URL)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            set(response.json()["restaurant:index"]),
+            {"count", *metrics.MEASURES},
+        )
+        self.assertEqual(
+            set(response.json()["restaurant:index"]["wall_ms"]),
+            {"p50", "p95", "p99"},
+        )
+
+
+class PercentilesTests(TestCase):
+    def test_percentiles(self) -> None:
+        result = metrics.percentiles(range(1, 101))
+
+        self.assertEqual(result, {"p50": 50.5, "p95": 95.05, "p99": 99.01})
+
+    def test_single_sample(self) -> None:
+        self.assertEqual(
+            metrics.percentiles([7.0]), {"p50": 7.0, "p95": 7.0, "p99": 7.0}
+        )
+
+
+def n_plus_one_view(request: HttpRequest) -> HttpResponse:
+    for dish_type in DishType.objects.all():
+        DishType.objects.filter(pk=dish_type.pk).exists()
+    return HttpResponse()
+
+
+class QueryDetectorTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        DishType.objects.bulk_create(
+            DishType(name=f"Type {number}") for number in range(5)
+        )
+
+    def test_fingerprint_ignores_values(self) -> None:
+        self.assertEqual(
+            fingerprint("SELECT * FROM t WHERE id = 1 AND name = 'it''s'"),
+            fingerprint("SELECT  *  FROM t WHERE id = %s AND name = %s"),
+        )
+        self.assertEqual(
+            fingerprint("SELECT * FROM t WHERE id IN (%s, %s, %s)"),
+            "SELECT * FROM t WHERE id IN (...)",
+        )
+
+    def test_repeated_queries(self) -> None:
+        with QueryDetector() as detector:
+            n_plus_one_view(None)
+
+        [problem] = detector.problems
+        self.assertEqual(problem.kind, "repeated")
+        self.assertEqual(problem.count, 5)
+        self.assertIn('FROM "restaurant_dishtype"', problem.sql)
+
+    @override_settings(RESTAURANT_SLOW_QUERY_MS=0)
+    def test_slow_queries(self) -> None:
+        with QueryDetector() as detector:
+            DishType.objects.count()
+
+        [problem] = detector.problems
+        self.assertEqual(problem.kind, "slow")
+
+    def test_middleware_raises_in_tests(self) -> None:
+        middleware = QueryDetectorMiddleware(n_plus_one_view)
+
+        with self.assertRaisesMessage(QueryProblem, "5 x SELECT"):
+            middleware(RequestFactory().get("/"))
+
+    @override_settings(
+        RESTAURANT_QUERY_DETECTOR_RAISE=False,
+        RESTAURANT_QUERY_DETECTOR_SAMPLE_RATE=1.0,
+    )
+    def test_middleware_logs_sampled_requests(self) -> None:
+        middleware = QueryDetectorMiddleware(n_plus_one_view)
+
+        with self.assertLogs("restaurant.query_detector", "WARNING") as logs:
+            middleware(RequestFactory().get("/"))
+
+        self.assertIn("repeated query in GET /", logs.output[0])
+
+    @override_settings(
+        RESTAURANT_QUERY_DETECTOR_RAISE=False,
+        RESTAURANT_QUERY_DETECTOR_SAMPLE_RATE=0.0,
+    )
+    def test_middleware_skips_unsampled_requests(self) -> None:
+        middleware = QueryDetectorMiddleware(n_plus_one_view)
+
+        with self.assertNoLogs("restaurant.query_detector"):
+            middleware(RequestFactory().get("/"))
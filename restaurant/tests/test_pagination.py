@@ -0,0 +1,206 @@
+from django.contrib.auth import get_user_model
+from django.http import QueryDict
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+
+from restaurant.models import Dish, DishType
+from restaurant.pagination import KeysetPaginator, encode_cursor, NEXT
+from restaurant.templatetags.query_transform import (
+    query_transform,
+    sort_transform,
+)
+
+DISH_TYPE_LIST_URL = reverse("restaurant:dish-type-list")
+DISH_LIST_URL = reverse("restaurant:dish-list")
+
+
+class KeysetPaginatorTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        DishType.objects.bulk_create(
+            DishType(name=f"Type {number:02}") for number in range(12)
+        )
+        # Duplicate names are ordered by pk.
+        DishType.objects.create(name="Type 05")
+
+    def walk_forward(self, paginator: KeysetPaginator) -> list[list[str]]:
+        pages = []
+        page = paginator.page(None)
+        while True:
+            pages.append([dish_type.name for dish_type in page.object_list])
+            if not page.has_next():
+                return pages
+            page = paginator.page(page.next_cursor)
+
+    def test_pages_cover_every_row_once_in_order(self) -> None:
+        paginator = KeysetPaginator(DishType.objects.all(), 5, ("name",))
+
+        pages = self.walk_forward(paginator)
+
+        self.assertEqual(
+            [name for page in pages for name in page],
+            list(DishType.objects.values_list("name", flat=True)),
+        )
+        self.assertEqual([len(page) for page in pages], [5, 5, 3])
+
+    def test_previous_cursor_returns_previous_page(self) -> None:
+        paginator = KeysetPaginator(DishType.objects.all(), 5, ("name",))
+        first = paginator.page(None)
+        second = paginator.page(first.next_cursor)
+
+        previous = paginator.page(second.previous_cursor)
+
+        self.assertEqual(list(previous.object_list), list(first.object_list))
+        self.assertFalse(previous.has_previous())
+        self.assertTrue(previous.has_next())
+
+    def test_descending_ordering(self) -> None:
+        paginator = KeysetPaginator(DishType.objects.all(), 5, ("-name",))
+
+        pages = self.walk_forward(paginator)
+
+        self.assertEqual(
+            [name for page in pages for name in page],
+            list(
+                DishType.objects.order_by("-name", "-pk")
+                .values_list("name", flat=True)
+            ),
+        )
+
+
+class KeysetListViewTests(TestCase):
+    def setUp(self) -> None:
+        self.cook = get_user_model().objects.create_user(
+            username="jamie.oliver",
+            password="nakedchef123",
+        )
+        self.client.force_login(self.cook)
+        DishType.objects.bulk_create(
+            DishType(name=f"Type {number:03}") for number in range(100)
+        )
+
+    def test_deep_page_costs_the_same_as_first_page(self) -> None:
+        response = self.client.get(DISH_TYPE_LIST_URL)
+        page = response.context["page_obj"]
+        for _ in range(15):
+            page = self.client.get(
+                DISH_TYPE_LIST_URL, {"cursor": page.next_cursor}
+            ).context["page_obj"]
+
+        with self.assertNumQueries(3):
+            first = self.client.get(DISH_TYPE_LIST_URL)
+        with self.assertNumQueries(3):
+            deep = self.client.get(
+                DISH_TYPE_LIST_URL, {"cursor": page.next_cursor}
+            )
+
+        self.assertEqual(
+            [dish_type.name for dish_type in first.context["dish_type_list"]],
+            ["Type 000", "Type 001", "Type 002", "Type 003", "Type 004"],
+        )
+        self.assertEqual(
+            [dish_type.name for dish_type in deep.context["dish_type_list"]],
+            ["Type 080", "Type 081", "Type 082", "Type 083", "Type 084"],
+        )
+        self.assertContains(deep, "cursor=")
+
+    def test_invalid_cursor_is_not_found(self) -> None:
+        response = self.client.get(DISH_TYPE_LIST_URL, {"cursor": "forged"})
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_cursor_with_wrong_key_length_is_not_found(self) -> None:
+        cursor = encode_cursor(NEXT, ["Type 001"])
+
+        response = self.client.get(DISH_TYPE_LIST_URL, {"cursor": cursor})
+
+        self.assertEqual(response.status_code, 404)
+
+
+class SortedListViewTests(TestCase):
+    def setUp(self) -> None:
+        cooks = get_user_model().objects.bulk_create(
+            get_user_model()(username=f"cook{number}") for number in range(7)
+        )
+        self.client.force_login(cooks[0])
+        dish_type = DishType.objects.create(name="Mains")
+        for number in range(7):
+            dish = Dish.objects.create(
+                name=f"DISH {number}",
+                description="",
+                price=1,
+                dish_type=dish_type,
+            )
+            dish.cooks.set(cooks[:number % 4])
+
+    def names(self, **params: str) -> list[str]:
+        names = []
+        while True:
+            page = self.client.get(DISH_LIST_URL, params).context["page_obj"]
+            names += [dish.name for dish in page.object_list]
+            if not page.has_next():
+                return names
+            params["cursor"] = page.next_cursor
+
+    def test_sort_by_cook_count(self) -> None:
+        self.assertEqual(
+            self.names(sort="-cooks"),
+            [
+                "DISH 3", "DISH 6", "DISH 2", "DISH 5",
+                "DISH 1", "DISH 4", "DISH 0",
+            ],
+        )
+        self.assertEqual(
+            self.names(sort="cooks"), list(reversed(self.names(sort="-cooks")))
+        )
+
+    def test_sort_replaces_search_ranking(self) -> None:
+        self.assertEqual(
+            self.names(name="dish", sort="-cooks"), self.names(sort="-cooks")
+        )
+        self.assertContains(
+            self.client.get(DISH_LIST_URL, {"name": "dish", "sort": "-cooks"}),
+            "&#9660;",
+        )
+
+    def test_ranked_search_shows_no_sort(self) -> None:
+        response = self.client.get(DISH_LIST_URL, {"name": "dish 1"})
+
+        self.assertIsNone(response.context["sort"])
+        self.assertNotContains(response, "&#9650;")
+        self.assertNotContains(response, "&#9660;")
+
+    def test_unknown_sort_keeps_default_order(self) -> None:
+        self.assertEqual(
+            self.names(sort="price"),
+            [f"DISH {number}" for number in range(7)],
+        )
+
+
+class QueryTransformTests(TestCase):
+    def test_cursor_replaces_page(self) -> None:
+        request = RequestFactory().get("/", {"name": "pie", "page": "3"})
+
+        query = QueryDict(query_transform(request, cursor="abc"))
+
+        self.assertEqual(query.dict(), {"name": "pie", "cursor": "abc"})
+
+    def test_clearing_cursor_keeps_filters(self) -> None:
+        request = RequestFactory().get("/", {"name": "pie", "cursor": "abc"})
+
+        query = QueryDict(query_transform(request, cursor=None))
+
+        self.assertEqual(query.dict(), {"name": "pie"})
+
+    def test_sort_drops_position_and_toggles(self) -> None:
+        request = RequestFactory().get("/", {"name": "pie", "cursor": "abc"})
+
+        query = QueryDict(sort_transform(request, "cooks"))
+
+        self.assertEqual(query.dict(), {"name": "pie", "sort": "cooks"})
+        self.assertEqual(
+            QueryDict(
+                sort_transform(RequestFactory().get("/", query), "cooks")
+            ).dict(),
+            {"name": "pie", "sort": "-cooks"},
+        )
@@ -0,0 +1,154 @@
+import sqlite3
+import tempfile
+import threading
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.db.utils import ConnectionHandler
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from restaurant.backends import pool as pooling
+from restaurant.backends.pool import ConnectionPool, PoolTimeout, pool_stats
+
+
+def connect() -> sqlite3.Connection:
+    return sqlite3.connect(":memory:", check_same_thread=False)
+
+
+class ConnectionPoolTests(SimpleTestCase):
+    def test_released_connections_are_reused(self) -> None:
+        pool = ConnectionPool(max_size=2)
+
+        first = pool.acquire(connect)
+        pool.release(first)
+        second = pool.acquire(connect)
+
+        self.assertIs(second, first)
+        stats = pool.stats()
+        self.assertEqual(stats["connections_created"], 1)
+        self.assertEqual(stats["connections_reused"], 1)
+        self.assertEqual(stats["checked_out"], 1)
+        self.assertEqual(stats["idle"], 0)
+
+    def test_dead_connections_are_replaced(self) -> None:
+        pool = ConnectionPool(max_size=2)
+        first = pool.acquire(connect)
+        pool.release(first)
+        # What a database restart does to an idle connection.
+        first.close()
+
+        second = pool.acquire(connect)
+
+        self.assertIsNot(second, first)
+        second.execute("SELECT 1")
+        stats = pool.stats()
+        self.assertEqual(stats["health_check_failures"], 1)
+        self.assertEqual(stats["size"], 1)
+
+    def test_old_connections_are_recycled(self) -> None:
+        pool = ConnectionPool(max_size=2, max_lifetime=0)
+        first = pool.acquire(connect)
+        pool.release(first)
+
+        self.assertIsNot(pool.acquire(connect), first)
+        self.assertEqual(pool.stats()["connections_closed"], 1)
+
+    def test_unusable_connections_are_closed_on_release(self) -> None:
+        pool = ConnectionPool(max_size=1)
+        connection = pool.acquire(connect)
+
+        pool.release(connection, reusable=False)
+
+        self.assertEqual(pool.stats()["size"], 0)
+        with self.assertRaises(sqlite3.ProgrammingError):
+            connection.execute("SELECT 1")
+
+    def test_acquire_times_out_when_exhausted(self) -> None:
+        pool = ConnectionPool(max_size=1, timeout=0.05)
+        pool.acquire(connect)
+
+        with self.assertRaises(PoolTimeout):
+            pool.acquire(connect)
+        self.assertEqual(pool.stats()["timeouts"], 1)
+
+    def test_acquire_waits_for_a_release(self) -> None:
+        pool = ConnectionPool(max_size=1, timeout=5)
+        connection = pool.acquire(connect)
+        releaser = threading.Timer(0.05, pool.release, [connection])
+        releaser.start()
+
+        self.assertIs(pool.acquire(connect), connection)
+        releaser.join()
+        stats = pool.stats()
+        self.assertGreaterEqual(stats["waits"], 1)
+        self.assertGreater(stats["wait_ms"], 0)
+
+    def test_failed_connect_frees_its_slot(self) -> None:
+        pool = ConnectionPool(max_size=1, timeout=0.05)
+
+        def refuse() -> None:
+            raise sqlite3.OperationalError("connection refused")
+
+        with self.assertRaises(sqlite3.OperationalError):
+            pool.acquire(refuse)
+        self.assertIsNotNone(pool.acquire(connect))
+
+
+class PooledBackendTests(SimpleTestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.connections = ConnectionHandler(
+            {
+                "default": {
+                    "ENGINE": "restaurant.backends.sqlite3",
+                    "NAME": Path(directory.name) / "pooled.sqlite3",
+                    "POOL": {"MAX_SIZE": 2},
+                }
+            }
+        )
+        self.addCleanup(pooling._pools.clear)
+        self.addCleanup(self.connections.close_all)
+        self.connection = self.connections["default"]
+
+    def test_close_returns_the_connection_to_the_pool(self) -> None:
+        with self.connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        raw_connection = self.connection.connection
+
+        self.connection.close()
+        with self.connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+
+        self.assertIs(self.connection.connection, raw_connection)
+        stats = pool_stats()["default"]
+        self.assertEqual(stats["connections_reused"], 1)
+        self.assertEqual(stats["checked_out"], 1)
+
+    def test_connection_closed_in_transaction_is_dropped(self) -> None:
+        self.connection.set_autocommit(False)
+        raw_connection = self.connection.connection
+
+        self.connection.close()
+        self.connection.connect()
+
+        self.assertIsNot(self.connection.connection, raw_connection)
+
+
+class PoolMetricsViewTests(TestCase):
+    def test_staff_only(self) -> None:
+        user = get_user_model().objects.create_user(
+            username="test", password="test123",
+        )
+        self.client.force_login(user)
+        url = reverse("restaurant:db-pool-metrics")
+
+        self.assertEqual(self.client.get(url).status_code, 302)
+
+        user.is_staff = True
+        user.save()
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response.json(), dict)
@@ -0,0 +1,175 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from restaurant import caching, counters, visits
+from restaurant.models import DishType, Dish
+
+
+class QueryCountTests(TestCase):
+    """Every page issues a fixed number of queries, whatever the row count.
+
+    The query every logged-in request starts with (the user; the session
+    is read from the cache) is included in the counts.
+    """
+
+    rows = 1
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.cook = get_user_model().objects.create_user(
+            username="auguste.escoffier",
+            password="kingofchefs123",
+        )
+        dish_types = DishType.objects.bulk_create(
+            DishType(name=f"Dish type {number}") for number in range(cls.rows)
+        )
+        dishes = Dish.objects.bulk_create(
+            Dish(
+                name=f"Dish {number}",
+                description="",
+                price=10,
+                dish_type=dish_types[number],
+            )
+            for number in range(cls.rows)
+        )
+        cooks = get_user_model().objects.bulk_create(
+            get_user_model()(username=f"cook.{number}")
+            for number in range(cls.rows)
+        )
+        cls.dish_type = dish_types[0]
+        cls.dish = dishes[0]
+        # The first dish has every cook and the logged-in cook every dish.
+        Dish.cooks.through.objects.bulk_create(
+            [
+                Dish.cooks.through(dish=cls.dish, cook=cook)
+                for cook in cooks
+            ] + [
+                Dish.cooks.through(dish=dish, cook=cls.cook)
+                for dish in dishes
+            ]
+        )
+
+    def setUp(self) -> None:
+        cache.clear()
+        # Keeps the periodic visit flush out of the counted requests.
+        visits.flush()
+        self.client.force_login(self.cook)
+
+    def assertQueriesForGet(self, num: int, url_name: str, *args) -> None:
+        with self.assertNumQueries(num):
+            response = self.client.get(
+                reverse(f"restaurant:{url_name}", args=args)
+            )
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_index(self) -> None:
+        counters.reconcile()
+
+        # The user, the stored counters and the stored visit count.
+        self.assertQueriesForGet(3, "index")
+
+    def test_dish_type_list(self) -> None:
+        self.assertQueriesForGet(3, "dish-type-list")
+
+    def test_dish_type_create(self) -> None:
+        self.assertQueriesForGet(1, "dish-type-create")
+
+    def test_dish_type_update(self) -> None:
+        self.assertQueriesForGet(2, "dish-type-update", self.dish_type.pk)
+
+    def test_dish_type_delete(self) -> None:
+        self.assertQueriesForGet(2, "dish-type-delete", self.dish_type.pk)
+
+    def test_dish_list(self) -> None:
+        self.assertQueriesForGet(3, "dish-list")
+
+    def test_dish_detail(self) -> None:
+        # The dish's version for the page cache key, then the page itself.
+        self.assertQueriesForGet(4, "dish-detail", self.dish.pk)
+
+    def test_dish_create(self) -> None:
+        self.assertQueriesForGet(2, "dish-create")
+
+    def test_dish_update(self) -> None:
+        self.assertQueriesForGet(5, "dish-update", self.dish.pk)
+
+    def test_assign_cook(self) -> None:
+        with self.assertNumQueries(6):
+            response = self.client.post(
+                reverse("restaurant:assign-cook", args=[self.dish.pk])
+            )
+
+        self.assertEqual(response.status_code, 302)
+
+    def test_dish_delete(self) -> None:
+        self.assertQueriesForGet(2, "dish-delete", self.dish.pk)
+
+    def test_cook_list(self) -> None:
+        self.assertQueriesForGet(3, "cook-list")
+
+    def test_cook_detail(self) -> None:
+        # The cook's version, the cook, one page of dishes and the
+        # look-ahead past it.
+        self.assertQueriesForGet(5, "cook-detail", self.cook.pk)
+
+    def test_cook_create(self) -> None:
+        self.assertQueriesForGet(1, "cook-create")
+
+    def test_cook_update(self) -> None:
+        self.assertQueriesForGet(2, "cook-update", self.cook.pk)
+
+    def test_cook_delete(self) -> None:
+        self.assertQueriesForGet(2, "cook-delete", self.cook.pk)
+
+
+class HundredRowsQueryCountTests(QueryCountTests):
+    rows = 100
+
+
+class TenThousandRowsQueryCountTests(QueryCountTests):
+    rows = 10_000
+
+
+class CascadeDeleteQueryCountTests(TestCase):
+    def setUp(self) -> None:
+        self.cooks = get_user_model().objects.bulk_create(
+            get_user_model()(username=f"cook.{number}") for number in range(3)
+        )
+        caching.touch(Dish, DishType)
+        counters.reconcile()
+
+    def create_dish_type(self, dishes: int) -> DishType:
+        dish_type = DishType.objects.create(name=f"{dishes} dishes")
+        for number in range(dishes):
+            Dish.objects.create(
+                name=f"Dish {number}",
+                description="",
+                price=10,
+                dish_type=dish_type,
+            ).cooks.set(self.cooks[:number % 3])
+        return dish_type
+
+    def test_dish_type_delete(self) -> None:
+        # The dishes, then for all of them at once: their count, the
+        # counter, their cooks' counts and page versions, the search index
+        # and the stamp.
+        # Then the deletes and the dish type's own counter, index row and
+        # stamp. (Over 100 dishes, Django deletes them in more batches.)
+        for dishes in (1, 100):
+            dish_type = self.create_dish_type(dishes)
+            with self.assertNumQueries(12):
+                dish_type.delete()
+
+        self.assertEqual(
+            counters.get_counts()["num_dishes"], Dish.objects.count()
+        )
+        self.assertEqual(
+            list(
+                get_user_model().objects.order_by("pk")
+                .values_list("dish_count", flat=True)
+            ),
+            [0, 0, 0],
+        )
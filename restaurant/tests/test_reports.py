@@ -0,0 +1,132 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from restaurant import reports
+from restaurant.models import Dish, DishType, ReportRow
+
+REPORTS_URL = reverse("restaurant:reports")
+
+
+class ReportsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.cooks = [
+            get_user_model().objects.create_user(
+                username=username,
+                password="kitchen12345",
+                years_of_experience=years,
+            )
+            for username, years in (
+                ("ina.garten", 25), ("anne.burrell", 3), ("guy.fieri", None),
+            )
+        ]
+        soups, desserts = DishType.objects.bulk_create(
+            [DishType(name="Soups"), DishType(name="Desserts")]
+        )
+        DishType.objects.create(name="Salads")
+        for name, price, dish_type, cooks in (
+            ("BORSCHT", 45, soups, cls.cooks[:2]),
+            ("BOUILLABAISSE", 240, soups, cls.cooks[:1]),
+            ("PAVLOVA", 90, desserts, cls.cooks[:2]),
+        ):
+            Dish.objects.create(
+                name=name, description="", price=price, dish_type=dish_type,
+            ).cooks.set(cooks)
+
+    def setUp(self) -> None:
+        self.client.force_login(self.cooks[0])
+
+    def rows(self, report: str) -> list[tuple[str, dict]]:
+        return [
+            (row.label, row.data)
+            for row in ReportRow.objects.filter(report=report)
+        ]
+
+    def test_refresh(self) -> None:
+        self.assertEqual(reports.refresh(), 19)
+
+        self.assertEqual(
+            self.rows("price_by_dish_type"),
+            [
+                ("Desserts", {
+                    "dishes": 1, "min": "90.00", "avg": "90.00",
+                    "max": "90.00", "bands": [0, 1, 0, 0],
+                }),
+                ("Salads", {
+                    "dishes": 0, "min": None, "avg": None, "max": None,
+                    "bands": [0, 0, 0, 0],
+                }),
+                ("Soups", {
+                    "dishes": 2, "min": "45.00", "avg": "142.50",
+                    "max": "240.00", "bands": [1, 0, 0, 1],
+                }),
+            ],
+        )
+        self.assertEqual(
+            self.rows("cooks_per_dish_type"),
+            [
+                ("Desserts", {"cooks": 2, "assignments": 2}),
+                ("Salads", {"cooks": 0, "assignments": 0}),
+                ("Soups", {"cooks": 2, "assignments": 3}),
+            ],
+        )
+        self.assertEqual(
+            [(label, data["cooks"]) for label, data in self.rows(
+                "dishes_per_cook"
+            )],
+            [("0", 1), ("1–4", 2), ("5–19", 0), ("20–99", 0), ("100+", 0)],
+        )
+        self.assertEqual(
+            [(label, data["dishes"]) for label, data in self.rows(
+                "busiest_cooks"
+            )],
+            [("ina.garten", 3), ("anne.burrell", 2)],
+        )
+        self.assertEqual(
+            [(label, data["cooks"]) for label, data in self.rows(
+                "experience_mix"
+            )],
+            [
+                ("0–1", 0), ("2–4", 1), ("5–9", 0), ("10–19", 0),
+                ("20+", 1), ("unknown", 1),
+            ],
+        )
+
+    def test_page_reads_only_the_summary_table(self) -> None:
+        reports.refresh()
+        Dish.objects.create(
+            name="GAZPACHO", description="", price=30,
+            dish_type=DishType.objects.get(name="Soups"),
+        )
+
+        # The session's user and the report rows.
+        with self.assertNumQueries(2):
+            response = self.client.get(REPORTS_URL)
+
+        self.assertContains(response, "142.50")
+        self.assertContains(response, "As of")
+        self.assertEqual(
+            response.context["reports"]["price_by_dish_type"][2].data[
+                "dishes"
+            ],
+            2,
+        )
+
+    def test_page_before_first_refresh(self) -> None:
+        response = self.client.get(REPORTS_URL)
+
+        self.assertContains(response, "No reports yet.")
+
+    def test_refresh_replaces_rows(self) -> None:
+        reports.refresh()
+        Dish.objects.all().delete()
+        out = StringIO()
+
+        call_command("refresh_reports", stdout=out)
+
+        self.assertIn("Refreshed 17 report row(s)", out.getvalue())
+        self.assertEqual(self.rows("busiest_cooks"), [])
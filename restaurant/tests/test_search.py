@@ -0,0 +1,78 @@
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+
+from restaurant.models import DishType, Dish
+from restaurant.search import FTS5SearchBackend, search
+
+
+class SearchTests(TestCase):
+    def setUp(self) -> None:
+        self.dish_type = DishType.objects.create(
+            name="Pies",
+        )
+
+    def create_dish(self, name: str) -> Dish:
+        return Dish.objects.create(
+            name=name,
+            description="Baked until golden.",
+            price=50.0,
+            dish_type=self.dish_type,
+        )
+
+    def test_search_matches_substrings_case_insensitively(self) -> None:
+        pumpkin_pie = self.create_dish("PUMPKIN PIE")
+        self.create_dish("GAZPACHO")
+
+        self.assertEqual(
+            list(search(Dish.objects.all(), "mpkin")),
+            [pumpkin_pie],
+        )
+
+    def test_search_ranks_closer_matches_first(self) -> None:
+        long_name = self.create_dish("APPLE AND BLACKBERRY PIE WITH CREAM")
+        short_name = self.create_dish("APPLE PIE")
+
+        self.assertEqual(
+            list(search(Dish.objects.all(), "apple pie")),
+            [short_name],
+        )
+        self.assertEqual(
+            list(search(Dish.objects.all(), "apple")),
+            [short_name, long_name],
+        )
+
+    def test_short_terms_are_searched(self) -> None:
+        pie = self.create_dish("PIE")
+
+        self.assertEqual(list(search(Dish.objects.all(), "pi")), [pie])
+
+    def test_index_follows_updates_and_deletes(self) -> None:
+        dish = self.create_dish("PICNIC PORK PIE")
+        dish.name = "CHILLED SPANISH GAZPACHO"
+        dish.save()
+
+        self.assertFalse(search(Dish.objects.all(), "pork").exists())
+        self.assertTrue(search(Dish.objects.all(), "gazpacho").exists())
+
+        dish.delete()
+
+        self.assertFalse(search(Dish.objects.all(), "gazpacho").exists())
+
+    @skipUnless(connection.vendor == "sqlite", "FTS5 index")
+    def test_index_follows_dish_type_deletes(self) -> None:
+        self.create_dish("PICNIC PORK PIE")
+        self.create_dish("PUMPKIN PIE")
+
+        self.dish_type.delete()
+
+        table = FTS5SearchBackend.table_for(Dish)
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) FROM {table}")
+            self.assertEqual(cursor.fetchone(), (0,))
+
+    def test_empty_term_returns_queryset_unchanged(self) -> None:
+        self.create_dish("PUMPKIN PIE")
+
+        self.assertEqual(search(DishType.objects.all(), "").count(), 1)
@@ -0,0 +1,41 @@
+from django.test import SimpleTestCase
+
+from restaurant.management.commands.profile_startup import (
+    by_package,
+    parse_importtime,
+)
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      2000 |       2300 |     django.db.models.fields
+import time:       300 |       2600 |   django.db.models
+import time:       500 |        500 |   django.contrib.admin.options
+import time:       100 |       3200 | django
+Traceback (most recent call last):
+"""
+
+
+class ProfileStartupTests(SimpleTestCase):
+    def test_parse_importtime(self) -> None:
+        self.assertEqual(
+            parse_importtime(IMPORTTIME),
+            {
+                "_io": 120,
+                "django.db.models.fields": 2000,
+                "django.db.models": 300,
+                "django.contrib.admin.options": 500,
+                "django": 100,
+            },
+        )
+
+    def test_by_package(self) -> None:
+        self.assertEqual(
+            by_package(parse_importtime(IMPORTTIME)),
+            {
+                "_io": 120,
+                "django.db": 2300,
+                "django.contrib.admin": 500,
+                "django": 100,
+            },
+        )
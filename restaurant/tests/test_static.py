@@ -0,0 +1,37 @@
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.template.loader import render_to_string
+from django.test import SimpleTestCase, override_settings
+
+
+class CollectStaticTests(SimpleTestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.static_root = Path(directory.name)
+
+    def test_assets_are_fingerprinted_and_precompressed(self) -> None:
+        with override_settings(
+            STATIC_ROOT=self.static_root,
+            STATICFILES_STORAGE=(
+                "whitenoise.storage.CompressedManifestStaticFilesStorage"
+            ),
+        ):
+            call_command("collectstatic", "--no-input", stdout=StringIO())
+            # The sidebar fragment may be cached from an earlier render.
+            cache.clear()
+            html = render_to_string("base.html")
+
+        css = self.static_root / "vendor" / "bootstrap" / "css"
+        hashed = [path.name for path in css.glob("bootstrap.min.*.css")]
+        self.assertEqual(len(hashed), 1)
+        self.assertTrue((css / f"{hashed[0]}.gz").exists())
+        self.assertTrue((css / f"{hashed[0]}.br").exists())
+        self.assertIn(f"/static/vendor/bootstrap/css/{hashed[0]}", html)
+        self.assertNotIn("cdn.jsdelivr.net", html)
+        self.assertRegex(html, r"/static/favicon/favicon\.[0-9a-f]{12}\.png")
+        self.assertNotIn("/static/favicon/favicon.png", html)
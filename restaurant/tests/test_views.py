@@ -1,7 +1,11 @@
+import json
+
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.db.models.signals import m2m_changed
+from django.test import Client, TestCase
 from django.urls import reverse
 
+from restaurant.assignments import count_added
 from restaurant.models import DishType, Dish
 
 DISH_TYPE_LIST_URL = reverse("restaurant:dish-type-list")
@@ -134,6 +138,49 @@ class PrivateCookTests(TestCase):
             new_cook.years_of_experience, form_data["years_of_experience"]
         )
 
+    def test_cook_detail_shows_one_page_of_dishes(self) -> None:
+        dish_type = DishType.objects.create(name="Mains")
+        dishes = Dish.objects.bulk_create(
+            Dish(
+                name=f"DISH {number:02}",
+                description="",
+                price=10,
+                dish_type=dish_type,
+            )
+            for number in range(25)
+        )
+        self.user.dishes.set(dishes)
+        api_url = reverse("restaurant:api-cook-dishes", args=[self.user.pk])
+
+        response = self.client.get(
+            reverse("restaurant:cook-detail", args=[self.user.pk])
+        )
+        page = response.context["dishes"]
+        more = self.client.get(
+            api_url, {"cursor": page.next_cursor, "limit": 20},
+        ).json()
+
+        self.assertEqual(
+            [dish["name"] for dish in page.object_list],
+            [f"DISH {number:02}" for number in range(20)],
+        )
+        self.assertContains(response, "Load more dishes")
+        self.assertContains(response, api_url)
+        self.assertEqual(
+            more["results"][0],
+            {"id": dishes[20].pk, "name": "DISH 20", "dish_type": "Mains"},
+        )
+        self.assertEqual(len(more["results"]), 5)
+        self.assertIsNone(more["next"])
+
+    def test_cook_detail_without_dishes(self) -> None:
+        response = self.client.get(
+            reverse("restaurant:cook-detail", args=[self.user.pk])
+        )
+
+        self.assertContains(response, "No dishes!")
+        self.assertNotContains(response, "Load more dishes")
+
 
 class PrivateDishTests(TestCase):
     def setUp(self) -> None:
@@ -266,3 +313,202 @@ class PrivateDishTests(TestCase):
             response.context["dish_list"][0],
             dish_search,
         )
+
+    def test_list_and_detail_pages_have_no_repeated_queries(self) -> None:
+        # QueryDetectorMiddleware fails the request on an N+1 pattern.
+        for number in range(5):
+            dish = Dish.objects.create(
+                name=f"DISH {number}",
+                description="",
+                price=10,
+                dish_type=DishType.objects.create(name=f"Type {number}"),
+            )
+            dish.cooks.add(self.cook)
+
+        for url in (
+            DISH_LIST_URL,
+            reverse("restaurant:dish-detail", args=[dish.pk]),
+            reverse("restaurant:cook-detail", args=[self.cook.pk]),
+        ):
+            with self.subTest(url=url):
+                self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_toggle_assign_to_dish(self) -> None:
+        dish_type = DishType.objects.create(
+            name="Pastry",
+        )
+        dish = Dish.objects.create(
+            name="LEMON TART",
+            description="Sharp, creamy and very short pastry.",
+            price=60.0,
+            dish_type=dish_type,
+        )
+        toggle_url = reverse("restaurant:assign-cook", args=[dish.pk])
+
+        response = self.client.post(toggle_url)
+
+        self.assertRedirects(
+            response, reverse("restaurant:dish-detail", args=[dish.pk]),
+        )
+        self.assertIn(self.cook, dish.cooks.all())
+
+        self.client.post(toggle_url)
+
+        self.assertNotIn(self.cook, dish.cooks.all())
+
+    def test_toggle_assign_to_dish_json(self) -> None:
+        dish_type = DishType.objects.create(
+            name="Pastry",
+        )
+        dish = Dish.objects.create(
+            name="LEMON TART",
+            description="Sharp, creamy and very short pastry.",
+            price=60.0,
+            dish_type=dish_type,
+        )
+        toggle_url = reverse("restaurant:assign-cook", args=[dish.pk])
+
+        # The dish lock, the assignment and its INSERT, plus one UPDATE of
+        # the dish's and one of the cook's count and page version.
+        with self.assertNumQueries(6):
+            response = self.client.post(
+                toggle_url, HTTP_ACCEPT="application/json",
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["assigned"], True)
+        self.assertEqual(response.json()["cook"]["username"], "tom.cruise")
+        self.assertEqual(
+            self.client.post(
+                toggle_url, HTTP_ACCEPT="application/json",
+            ).json()["assigned"],
+            False,
+        )
+
+    def test_toggle_assign_counts_a_concurrent_add_once(self) -> None:
+        dish = Dish.objects.create(
+            name="LEMON TART",
+            description="Sharp, creamy and very short pastry.",
+            price=60.0,
+            dish_type=DishType.objects.create(name="Pastry"),
+        )
+
+        def add_first(action: str, **kwargs) -> None:
+            if action == "pre_add":
+                # Committed by another request after the view's read.
+                Dish.cooks.through.objects.create(dish=dish, cook=self.cook)
+                count_added(self.cook, {dish.pk})
+
+        m2m_changed.connect(add_first, sender=Dish.cooks.through)
+        self.addCleanup(
+            m2m_changed.disconnect, add_first, sender=Dish.cooks.through
+        )
+
+        response = self.client.post(
+            reverse("restaurant:assign-cook", args=[dish.pk]),
+            HTTP_ACCEPT="application/json",
+        )
+
+        self.assertEqual(response.json()["assigned"], True)
+        dish.refresh_from_db()
+        self.cook.refresh_from_db()
+        self.assertEqual((dish.cook_count, self.cook.dish_count), (1, 1))
+
+    def test_toggle_assign_to_missing_dish(self) -> None:
+        response = self.client.post(
+            reverse("restaurant:assign-cook", args=[404]),
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_toggle_assign_needs_post_with_csrf_token(self) -> None:
+        dish = Dish.objects.create(
+            name="LEMON TART",
+            description="Sharp, creamy and very short pastry.",
+            price=60.0,
+            dish_type=DishType.objects.create(name="Pastry"),
+        )
+        toggle_url = reverse("restaurant:assign-cook", args=[dish.pk])
+        client = Client(enforce_csrf_checks=True)
+        client.force_login(self.cook)
+
+        self.assertEqual(client.get(toggle_url).status_code, 405)
+        self.assertEqual(client.post(toggle_url).status_code, 403)
+        self.assertFalse(dish.cooks.exists())
+
+        page = client.get(reverse("restaurant:dish-detail", args=[dish.pk]))
+        response = client.post(
+            toggle_url,
+            HTTP_ACCEPT="application/json",
+            HTTP_X_CSRFTOKEN=str(page.context["csrf_token"]),
+        )
+
+        self.assertEqual(response.json()["assigned"], True)
+
+
+class ExportTests(TestCase):
+    def setUp(self) -> None:
+        self.cook = get_user_model().objects.create_user(
+            username="tom.kerridge",
+            password="handandflowers1",
+        )
+        self.client.force_login(self.cook)
+        dish_type = DishType.objects.create(
+            name="Pies",
+        )
+        for name in ("PUMPKIN PIE", "PICNIC PORK PIE", "GAZPACHO"):
+            dish = Dish.objects.create(
+                name=name,
+                description="",
+                price=50,
+                dish_type=dish_type,
+            )
+            dish.cooks.add(self.cook)
+
+    def test_login_required(self) -> None:
+        self.client.logout()
+
+        response = self.client.get(reverse("restaurant:dish-export"))
+
+        self.assertNotEqual(response.status_code, 200)
+
+    def test_dish_csv_export_honours_search(self) -> None:
+        response = self.client.get(
+            reverse("restaurant:dish-export"), {"name": "pie"},
+        )
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertEqual(
+            b"".join(response.streaming_content).decode().splitlines(),
+            [
+                "name,description,price,dish_type,cooks",
+                "PUMPKIN PIE,,50.00,Pies,tom.kerridge",
+                "PICNIC PORK PIE,,50.00,Pies,tom.kerridge",
+            ],
+        )
+
+    def test_cook_json_export(self) -> None:
+        response = self.client.get(
+            reverse("restaurant:cook-export"), {"format": "json"},
+        )
+
+        self.assertEqual(
+            json.loads(b"".join(response.streaming_content)),
+            [
+                {
+                    "username": "tom.kerridge",
+                    "first_name": "",
+                    "last_name": "",
+                    "years_of_experience": 0,
+                },
+            ],
+        )
+
+    def test_empty_json_export(self) -> None:
+        response = self.client.get(
+            reverse("restaurant:dish-export"),
+            {"format": "json", "name": "trifle"},
+        )
+
+        self.assertEqual(json.loads(b"".join(response.streaming_content)), [])
@@ -0,0 +1,121 @@
+import time
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DatabaseError
+from django.db.models import F
+from django.test import TestCase
+from django.urls import reverse
+
+from restaurant import visits
+from restaurant.models import VisitCount
+
+INDEX_URL = reverse("restaurant:index")
+
+
+class VisitCounterTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        # Drops visits left over by other tests: their cooks are gone.
+        visits.flush()
+        self.cook = get_user_model().objects.create_user(
+            username="test",
+            password="test123",
+        )
+
+    def test_visits_are_counted_without_writes(self) -> None:
+        self.client.force_login(self.cook)
+        self.client.get(INDEX_URL)
+
+        response = self.client.get(INDEX_URL)
+
+        self.assertEqual(response.context["num_visits"], 2)
+        self.assertFalse(VisitCount.objects.exists())
+
+    def test_index_does_not_modify_the_session(self) -> None:
+        self.client.force_login(self.cook)
+
+        response = self.client.get(INDEX_URL)
+
+        self.assertNotIn("sessionid", response.cookies)
+
+    def test_flush_writes_totals(self) -> None:
+        for _ in range(3):
+            visits.record_visit(self.cook.pk)
+
+        self.assertEqual(visits.flush(), 1)
+        self.assertEqual(
+            VisitCount.objects.get(cook=self.cook).count, 3
+        )
+
+        visits.record_visit(self.cook.pk)
+        visits.flush()
+        self.assertEqual(
+            VisitCount.objects.get(cook=self.cook).count, 4
+        )
+
+    def test_totals_survive_a_cache_flush(self) -> None:
+        visits.record_visit(self.cook.pk)
+        visits.flush()
+        cache.clear()
+
+        self.assertEqual(visits.record_visit(self.cook.pk), 2)
+
+    def test_flushes_periodically(self) -> None:
+        visits.record_visit(self.cook.pk)
+        self.assertFalse(VisitCount.objects.exists())
+
+        with mock.patch.object(visits, "FLUSH_INTERVAL", 0):
+            visits.record_visit(self.cook.pk)
+
+        self.assertEqual(
+            VisitCount.objects.get(cook=self.cook).count, 2
+        )
+
+    def test_deleted_cooks_are_skipped(self) -> None:
+        visits.record_visit(self.cook.pk)
+        self.cook.delete()
+
+        self.assertEqual(visits.flush(), 0)
+
+    def test_flushes_add_to_other_workers_counts(self) -> None:
+        visits.record_visit(self.cook.pk)
+        visits.flush()
+        # Another worker flushes the visits it counted meanwhile.
+        VisitCount.objects.filter(cook=self.cook).update(count=F("count") + 5)
+
+        self.assertEqual(visits.record_visit(self.cook.pk), 7)
+        visits.flush()
+
+        self.assertEqual(VisitCount.objects.get(cook=self.cook).count, 7)
+
+    def test_totals_show_other_workers_visits(self) -> None:
+        visits.record_visit(self.cook.pk)
+        # Another worker flushes 5 visits after this one read the total.
+        VisitCount.objects.create(cook=self.cook, count=5)
+
+        self.assertEqual(visits.record_visit(self.cook.pk), 2)
+        later = time.time() + visits.FLUSH_INTERVAL + 1
+        with mock.patch("time.time", return_value=later):
+            self.assertEqual(visits.record_visit(self.cook.pk), 8)
+
+    def test_pending_visits_survive_cache_eviction(self) -> None:
+        visits.record_visit(self.cook.pk)
+        visits.record_visit(self.cook.pk)
+        cache.clear()
+
+        self.assertEqual(visits.flush(), 1)
+        self.assertEqual(VisitCount.objects.get(cook=self.cook).count, 2)
+
+    def test_failed_flush_keeps_visits(self) -> None:
+        visits.record_visit(self.cook.pk)
+
+        with mock.patch.object(
+            visits, "_add", side_effect=DatabaseError("gone away")
+        ):
+            with self.assertLogs("restaurant.visits", "ERROR"):
+                self.assertEqual(visits.flush(), 0)
+
+        visits.flush()
+        self.assertEqual(VisitCount.objects.get(cook=self.cook).count, 1)
@@ -0,0 +1,68 @@
+from django.contrib.auth import get_user_model
+from django.template import engines
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from restaurant.warmup import warm_up
+
+
+class WarmUpTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.loader = engines["django"].engine.template_loaders[0]
+        self.loader.reset()
+        self.addCleanup(self.loader.reset)
+
+    def test_templates_are_compiled_into_the_cached_loader(self) -> None:
+        result = warm_up()
+
+        cached = self.loader.get_template_cache
+        for name in (
+            "base.html",
+            "includes/sidebar.html",
+            "restaurant/dish_list.html",
+            "bootstrap4/field.html",
+            # Included by bootstrap4/field.html.
+            "bootstrap4/layout/help_text_and_errors.html",
+        ):
+            with self.subTest(name=name):
+                self.assertIn(name, cached)
+        self.assertEqual(result["templates"], len(cached))
+
+    def test_unused_app_templates_are_left_to_load_on_use(self) -> None:
+        warm_up()
+
+        cached = self.loader.get_template_cache
+        for name in (
+            "admin/base.html",
+            "bootstrap3/field.html",
+            "bootstrap4/layout/inline_field.html",
+        ):
+            with self.subTest(name=name):
+                self.assertNotIn(name, cached)
+
+
+class WarmedPagesTests(TestCase):
+    def setUp(self) -> None:
+        self.loader = engines["django"].engine.template_loaders[0]
+        self.loader.reset()
+        self.addCleanup(self.loader.reset)
+        self.client.force_login(
+            get_user_model().objects.create_user(
+                username="tom.cruise", password="cruisecook123"
+            )
+        )
+
+    def test_pages_need_no_template_after_warm_up(self) -> None:
+        warm_up()
+        warmed = set(self.loader.get_template_cache)
+
+        for name in (
+            "restaurant:dish-list",
+            "restaurant:dish-create",
+            "restaurant:cook-create",
+            "restaurant:dish-type-create",
+        ):
+            with self.subTest(name=name):
+                response = self.client.get(reverse(name))
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(set(self.loader.get_template_cache), warmed)
@@ -1,7 +1,10 @@
+from django.conf import settings
 from django.urls import path
 
+from restaurant import api
 from restaurant.views import (
     index,
+    menu_reports,
     DishTypeListView,
     DishListView,
     DishDetailView,
@@ -11,19 +14,40 @@ from restaurant.views import (
     DishTypeUpdateView,
     DishTypeDeleteView,
     DishCreateView,
-    assign_driver,
+    toggle_assign_to_dish,
     CookCreateView,
     CookYearsOfExperienceUpdateView,
     CookDeleteView,
     DishUpdateView,
     DishDeleteView,
+    dish_export,
+    cook_export,
+    performance_metrics,
+    db_pool_metrics,
 )
 
+if settings.ASYNC_VIEWS:
+    from restaurant import async_views
+
+    index = async_views.index
+    dish_type_list = async_views.dish_type_list
+    dish_list = async_views.dish_list
+    dish_detail = async_views.dish_detail
+    cook_list = async_views.cook_list
+    cook_detail = async_views.cook_detail
+else:
+    dish_type_list = DishTypeListView.as_view()
+    dish_list = DishListView.as_view()
+    dish_detail = DishDetailView.as_view()
+    cook_list = CookListView.as_view()
+    cook_detail = CookDetailView.as_view()
+
 urlpatterns = [
     path("", index, name="index"),
+    path("reports/", menu_reports, name="reports"),
     path(
         "dish_types/",
-        DishTypeListView.as_view(),
+        dish_type_list,
         name="dish-type-list",
     ),
     path(
@@ -43,26 +67,32 @@ urlpatterns = [
     ),
     path(
         "dishes/",
-        DishListView.as_view(),
+        dish_list,
         name="dish-list",
     ),
+    path("dishes/export/", dish_export, name="dish-export"),
     path(
         "dishes/<int:pk>/",
-        DishDetailView.as_view(),
+        dish_detail,
         name="dish-detail",
     ),
     path("dishes/create/", DishCreateView.as_view(), name="dish-create"),
     path("dishes/<int:pk>/update/", DishUpdateView.as_view(), name="dish-update"),
-    path("dishes/<int:pk>/assign-driver/", assign_driver, name="assign-cook"),
+    path(
+        "dishes/<int:pk>/toggle-assign/",
+        toggle_assign_to_dish,
+        name="assign-cook",
+    ),
     path("dishes/<int:pk>/delete/", DishDeleteView.as_view(), name="dish-delete"),
     path(
         "cooks/",
-        CookListView.as_view(),
+        cook_list,
         name="cook-list",
     ),
+    path("cooks/export/", cook_export, name="cook-export"),
     path(
         "cooks/<int:pk>/",
-        CookDetailView.as_view(),
+        cook_detail,
         name="cook-detail",
     ),
     path("cooks/create/", CookCreateView.as_view(), name="cook-create"),
@@ -76,6 +106,40 @@ urlpatterns = [
         CookDeleteView.as_view(),
         name="cook-delete"
     ),
+    path(
+        "api/dish_types/",
+        api.dish_type_list,
+        name="api-dish-type-list",
+    ),
+    path(
+        "api/dish_types/<int:pk>/",
+        api.dish_type_detail,
+        name="api-dish-type-detail",
+    ),
+    path("api/dishes/", api.dish_list, name="api-dish-list"),
+    path(
+        "api/dishes/<int:pk>/",
+        api.dish_detail,
+        name="api-dish-detail",
+    ),
+    path("api/cooks/", api.cook_list, name="api-cook-list"),
+    path(
+        "api/cooks/autocomplete/",
+        api.cook_autocomplete,
+        name="api-cook-autocomplete",
+    ),
+    path(
+        "api/cooks/<int:pk>/",
+        api.cook_detail,
+        name="api-cook-detail",
+    ),
+    path(
+        "api/cooks/<int:pk>/dishes/",
+        api.cook_dishes_list,
+        name="api-cook-dishes",
+    ),
+    path("metrics/", performance_metrics, name="metrics"),
+    path("metrics/db/", db_pool_metrics, name="db-pool-metrics"),
 ]
 
 app_name = "restaurant"
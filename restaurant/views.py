@@ -1,38 +1,50 @@
-from http.client import HTTPResponse
-from typing import Any
+import csv
+import json
+from typing import Any, Iterable, Iterator
 
+from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth import get_user_model
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.handlers.wsgi import WSGIRequest
-from django.db.models import QuerySet
-from django.http import HttpResponsePermanentRedirect, HttpResponseRedirect
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Prefetch, QuerySet
+from django.db.models.signals import m2m_changed
+from django.http import (
+    Http404,
+    HttpResponse,
+    HttpResponseRedirect,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 from django.shortcuts import render, redirect
 from django.urls import reverse_lazy
 from django.views import generic
+from django.views.decorators.http import require_POST
 
+from restaurant import counters, menu, metrics, reports, visits
+from restaurant.assignments import (
+    COOK_DISHES_ORDERING,
+    cook_dishes,
+    insert_assignments,
+)
+from restaurant.backends.pool import pool_stats
+from restaurant.caching import CachedPageMixin
 from restaurant.forms import (
     CookCreationForm,
     CookYearsOfExperienceUpdateForm,
     DishForm, DishTypeSearchForm, DishSearchForm, CookSearchForm,
 )
 from restaurant.models import Cook, DishType, Dish
+from restaurant.pagination import KeysetPaginationMixin, KeysetPaginator
+from restaurant.search import search
 
 
 @login_required
-def index(request) -> HTTPResponse:
-    num_cooks = Cook.objects.count()
-    num_dish_types = DishType.objects.count()
-    num_dishes = Dish.objects.count()
-
-    num_visits = request.session.get("num_visits", 0)
-    request.session["num_visits"] = num_visits + 1
-
+def index(request) -> HttpResponse:
     context = {
-        "num_cooks": num_cooks,
-        "num_dish_types": num_dish_types,
-        "num_dishes": num_dishes,
-        "num_visits": num_visits + 1,
+        **counters.get_counts(),
+        "num_visits": visits.record_visit(request.user.pk),
     }
 
     return render(
@@ -41,7 +53,25 @@ def index(request) -> HTTPResponse:
     )
 
 
-class DishTypeListView(LoginRequiredMixin, generic.ListView):
+@login_required
+def menu_reports(request: WSGIRequest) -> HttpResponse:
+    # Reads the precomputed rows only; refresh_reports recomputes them.
+    rows, refreshed_at = reports.load()
+
+    return render(
+        request,
+        template_name="restaurant/reports.html",
+        context={
+            "reports": rows,
+            "refreshed_at": refreshed_at,
+            "price_bands": reports.price_band_labels(),
+        },
+    )
+
+
+class DishTypeListView(
+        LoginRequiredMixin, KeysetPaginationMixin, generic.ListView
+):
     model = DishType
     template_name = "restaurant/dish_type_list.html"
     context_object_name = "dish_type_list"
@@ -65,9 +95,7 @@ class DishTypeListView(LoginRequiredMixin, generic.ListView):
         form = DishTypeSearchForm(self.request.GET)
 
         if form.is_valid():
-            return self.queryset.filter(
-                name__icontains=form.cleaned_data["name"]
-            )
+            return search(self.queryset, form.cleaned_data["name"])
 
         return self.queryset
 
@@ -95,10 +123,14 @@ class DishTypeDeleteView(LoginRequiredMixin, generic.DeleteView):
     success_url = reverse_lazy("restaurant:dish-type-list")
 
 
-class DishListView(LoginRequiredMixin, generic.ListView):
+class DishListView(
+        LoginRequiredMixin, KeysetPaginationMixin, generic.ListView
+):
     model = Dish
     queryset = Dish.objects.select_related("dish_type")
     paginate_by = 5
+    # Backed by dish_name_id_idx and dish_cook_count_id_idx.
+    sort_orderings = {"name": ("name",), "cooks": ("cook_count",)}
 
     def get_context_data(
             self, *, object_list: Any = None, **kwargs: Any
@@ -117,16 +149,32 @@ class DishListView(LoginRequiredMixin, generic.ListView):
         form = DishSearchForm(self.request.GET)
 
         if form.is_valid():
-            return self.queryset.filter(
-                name__icontains=form.cleaned_data["name"]
-            )
+            return search(self.queryset, form.cleaned_data["name"])
 
         return self.queryset
 
 
-class DishDetailView(LoginRequiredMixin, generic.DetailView):
+class DishDetailView(
+        LoginRequiredMixin, CachedPageMixin, generic.DetailView
+):
     model = Dish
 
+    def get_queryset(self) -> QuerySet[Dish]:
+        return Dish.objects.select_related("dish_type").prefetch_related(
+            Prefetch(
+                "cooks",
+                queryset=Cook.objects.only(
+                    "username", "first_name", "last_name",
+                ),
+            )
+        ).annotate(
+            is_assigned=Exists(
+                Dish.cooks.through.objects.filter(
+                    dish_id=OuterRef("pk"), cook_id=self.request.user.pk,
+                )
+            )
+        )
+
 
 class DishCreateView(LoginRequiredMixin, generic.CreateView):
     model = Dish
@@ -145,10 +193,14 @@ class DishDeleteView(LoginRequiredMixin, generic.DeleteView):
     success_url = reverse_lazy("restaurant:dish-list")
 
 
-class CookListView(LoginRequiredMixin, generic.ListView):
+class CookListView(
+        LoginRequiredMixin, KeysetPaginationMixin, generic.ListView
+):
     model = Cook
     paginate_by = 5
     queryset = get_user_model().objects.all()
+    # Backed by cook_dish_count_id_idx.
+    sort_orderings = {"dishes": ("dish_count",)}
 
     def get_context_data(
             self, *, object_list: Any = None, **kwargs: Any
@@ -167,16 +219,96 @@ class CookListView(LoginRequiredMixin, generic.ListView):
         form = CookSearchForm(self.request.GET)
 
         if form.is_valid():
-            return self.queryset.filter(
-                username__icontains=form.cleaned_data["username"]
-            )
+            return search(self.queryset, form.cleaned_data["username"])
 
         return self.queryset
 
 
-class CookDetailView(LoginRequiredMixin, generic.DetailView):
+@login_required
+def dish_export(request: WSGIRequest) -> StreamingHttpResponse:
+    queryset = Dish.objects.all()
+    form = DishSearchForm(request.GET)
+    if form.is_valid():
+        queryset = search(queryset, form.cleaned_data["name"])
+
+    return _export_response(
+        request, "dishes", menu.DISH, menu.export_dishes(queryset),
+    )
+
+
+class CookDetailView(
+        LoginRequiredMixin, CachedPageMixin, generic.DetailView
+):
     model = Cook
-    queryset = Cook.objects.prefetch_related("dishes__dish_type")
+    queryset = Cook.objects.all()
+    # The rest is fetched page by page from api-cook-dishes.
+    dishes_paginate_by = 20
+
+    def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        context["dishes"] = KeysetPaginator(
+            cook_dishes(self.object.pk),
+            self.dishes_paginate_by,
+            COOK_DISHES_ORDERING,
+        ).page(None)
+        return context
+
+
+@login_required
+def cook_export(request: WSGIRequest) -> StreamingHttpResponse:
+    queryset = get_user_model().objects.all()
+    form = CookSearchForm(request.GET)
+    if form.is_valid():
+        queryset = search(queryset, form.cleaned_data["username"])
+
+    return _export_response(
+        request, "cooks", menu.COOK, menu.export_cooks(queryset),
+    )
+
+
+class _Echo:
+    def write(self, value: str) -> str:
+        return value
+
+
+def _csv_rows(
+        fieldnames: Iterable[str], records: Iterable[dict[str, Any]]
+) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    yield writer.writerow(fieldnames)
+    for record in records:
+        if isinstance(record.get("cooks"), list):
+            record["cooks"] = menu.COOKS_SEPARATOR.join(record["cooks"])
+        yield writer.writerow(record[field] for field in fieldnames)
+
+
+def _json_array(records: Iterable[dict[str, Any]]) -> Iterator[str]:
+    separator = "["
+    for record in records:
+        yield separator + json.dumps(record)
+        separator = ",\n"
+    yield "[]" if separator == "[" else "]"
+
+
+def _export_response(
+        request: WSGIRequest,
+        file_name: str,
+        kind: str,
+        records: Iterable[dict[str, Any]],
+) -> StreamingHttpResponse:
+    if request.GET.get("format") == "json":
+        response = StreamingHttpResponse(
+            _json_array(records), content_type="application/json",
+        )
+        file_name = f"{file_name}.json"
+    else:
+        response = StreamingHttpResponse(
+            _csv_rows(menu.FIELDS[kind], records), content_type="text/csv",
+        )
+        file_name = f"{file_name}.csv"
+
+    response["Content-Disposition"] = f'attachment; filename="{file_name}"'
+    return response
 
 
 class CookCreateView(LoginRequiredMixin, generic.CreateView):
@@ -197,12 +329,64 @@ class CookDeleteView(LoginRequiredMixin, generic.DeleteView):
 
 
 @login_required
-def assign_driver(
-        request: WSGIRequest, pk: Any
-) -> HttpResponsePermanentRedirect | HttpResponseRedirect:
-    driver = Cook.objects.get(id=request.user.id)
-    if Dish.objects.get(id=pk) in driver.cars.all():
-        driver.cars.remove(pk)
-    else:
-        driver.cars.add(pk)
+@require_POST
+def toggle_assign_to_dish(
+        request: WSGIRequest, pk: int
+) -> JsonResponse | HttpResponseRedirect:
+    cook = request.user
+    through = Dish.cooks.through
+    assignment = through.objects.filter(dish_id=pk, cook_id=cook.pk)
+    using = assignment.db
+
+    # The receivers keep assignment counts, which must commit with the row.
+    with transaction.atomic(using=using, savepoint=False):
+        # Locking the dish makes a concurrent toggle of it wait here, then
+        # read the assignment as this one leaves it: two clicks flip it
+        # twice instead of both counting the same change.
+        if not Dish.objects.select_for_update().filter(pk=pk).exists():
+            raise Http404("No dish found matching the query.")
+        is_assigned = assignment.exists()
+
+        action = "remove" if is_assigned else "add"
+        signal_kwargs = {
+            "sender": through,
+            "instance": cook,
+            "reverse": True,
+            "model": Dish,
+            "pk_set": {pk},
+            "using": using,
+        }
+        m2m_changed.send(action=f"pre_{action}", **signal_kwargs)
+        if is_assigned:
+            assignment.delete()
+        elif not insert_assignments(pk, [cook.pk], using):
+            # Added meanwhile without the lock (e.g. by set_dish_cooks),
+            # and already counted there.
+            signal_kwargs["pk_set"] = set()
+        m2m_changed.send(action=f"post_{action}", **signal_kwargs)
+
+    if "application/json" in request.headers.get("Accept", ""):
+        return JsonResponse(
+            {
+                "dish": pk,
+                "assigned": not is_assigned,
+                "cook": {
+                    "id": cook.pk,
+                    "username": cook.username,
+                    "first_name": cook.first_name,
+                    "last_name": cook.last_name,
+                },
+            }
+        )
+
     return redirect("restaurant:dish-detail", pk=pk)
+
+
+@staff_member_required
+def performance_metrics(request: WSGIRequest) -> JsonResponse:
+    return JsonResponse(metrics.summary())
+
+
+@staff_member_required
+def db_pool_metrics(request: WSGIRequest) -> JsonResponse:
+    return JsonResponse(pool_stats())
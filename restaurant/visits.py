@@ -0,0 +1,118 @@
+import logging
+import threading
+import time
+from collections import Counter
+from typing import Iterable
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Case, F, Value, When
+
+from restaurant.models import Cook, VisitCount
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "restaurant:visits:"
+FLUSH_INTERVAL = 30
+
+# Visits counted in this process and not yet added to ``VisitCount``.
+_pending: Counter[int] = Counter()
+_lock = threading.Lock()
+_last_flush = time.monotonic()
+
+
+def _cache_key(cook_id: int) -> str:
+    return f"{KEY_PREFIX}{cook_id}"
+
+
+def _stored(cook_id: int) -> int:
+    key = _cache_key(cook_id)
+    stored = cache.get(key)
+    if stored is None:
+        stored = VisitCount.objects.filter(cook_id=cook_id).values_list(
+            "count", flat=True
+        ).first() or 0
+        # Expires so that the visits other workers flush show up here.
+        cache.set(key, stored, FLUSH_INTERVAL)
+    return stored
+
+
+def record_visit(cook_id: int) -> int:
+    """Count a visit of ``cook_id`` and return their total.
+
+    The visit is added to this process's pending increments, which
+    ``flush`` adds to ``VisitCount`` at most every ``FLUSH_INTERVAL``
+    seconds. Each worker only ever adds its own increments, so the stored
+    count stays exact however many workers run. The total shown is the
+    stored count, re-read at most every ``FLUSH_INTERVAL`` seconds, plus
+    the visits pending here.
+    """
+    with _lock:
+        _pending[cook_id] += 1
+        due = time.monotonic() - _last_flush >= FLUSH_INTERVAL
+
+    if due:
+        flush()
+
+    stored = _stored(cook_id)
+    with _lock:
+        return stored + _pending[cook_id]
+
+
+def flush(cook_ids: Iterable[int] | None = None) -> int:
+    """Add the pending visits of ``cook_ids`` (by default, of every cook
+    visited since the last flush) to ``VisitCount``.
+
+    The increments are taken out of ``_pending`` under the lock and added
+    with ``F("count") + delta`` in one UPDATE, so concurrent flushes from
+    other workers add up instead of overwriting each other. A failed flush
+    is logged and keeps the visits for the next one: it runs as part of a
+    page view (and at exit), which must not fail because of it.
+    """
+    global _last_flush
+
+    with _lock:
+        _last_flush = time.monotonic()
+        if cook_ids is None:
+            deltas = dict(_pending)
+            _pending.clear()
+        else:
+            deltas = {
+                cook_id: _pending.pop(cook_id)
+                for cook_id in cook_ids if cook_id in _pending
+            }
+
+    if not deltas:
+        return 0
+    try:
+        flushed = _add(deltas)
+    except Exception:
+        logger.exception("Could not flush the visits of %d cook(s).", len(deltas))
+        with _lock:
+            _pending.update(deltas)
+        return 0
+
+    # The visits moved from pending to stored: re-read the stored counts.
+    cache.delete_many([_cache_key(cook_id) for cook_id in deltas])
+    return flushed
+
+
+def _add(deltas: dict[int, int]) -> int:
+    existing = list(
+        Cook.objects.filter(pk__in=deltas).values_list("pk", flat=True)
+    )
+    if not existing:
+        return 0
+
+    with transaction.atomic():
+        VisitCount.objects.bulk_create(
+            [VisitCount(cook_id=pk) for pk in existing],
+            ignore_conflicts=True,
+        )
+        VisitCount.objects.filter(cook_id__in=existing).update(
+            count=F("count") + Case(
+                *(When(cook_id=pk, then=Value(deltas[pk])) for pk in existing),
+                default=Value(0),
+            )
+        )
+    return len(existing)
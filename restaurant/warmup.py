@@ -0,0 +1,116 @@
+import logging
+import time
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from django.conf import settings
+from django.template import (
+    Template,
+    TemplateDoesNotExist,
+    TemplateSyntaxError,
+    engines,
+)
+from django.template.backends.django import DjangoTemplates
+from django.template.loader_tags import ExtendsNode, IncludeNode
+from django.template.loaders.base import Loader
+from django.urls import get_resolver
+
+logger = logging.getLogger(__name__)
+
+
+def template_names(directory: Path) -> set[str]:
+    return {
+        path.relative_to(directory).as_posix()
+        for path in directory.rglob("*")
+        if path.is_file()
+    }
+
+
+def template_dirs(loaders: Iterable[Loader]) -> Iterator[Path]:
+    for loader in loaders:
+        if hasattr(loader, "loaders"):
+            # The cached loader wraps the ones that find the files.
+            yield from template_dirs(loader.loaders)
+        elif hasattr(loader, "get_dirs"):
+            yield from map(Path, loader.get_dirs())
+
+
+def app_template_prefixes() -> tuple[str, ...]:
+    # The app templates the site's pages render from code: form widgets and
+    # the form and field templates of the crispy pack ``|crispy`` uses. The
+    # admin's templates, the other packs and the unused layouts load on
+    # first use.
+    pack = settings.CRISPY_TEMPLATE_PACK
+    return ("django/forms/", f"{pack}/uni_form.html", f"{pack}/field.html")
+
+
+def referenced_templates(template: Template) -> set[str]:
+    """The names ``template`` includes or extends, where they are literal
+    strings."""
+    names = set()
+    nodes = template.nodelist.get_nodes_by_type((IncludeNode, ExtendsNode))
+    for node in nodes:
+        name = (
+            node.template if isinstance(node, IncludeNode)
+            else node.parent_name
+        )
+        if isinstance(name.var, str) and not name.filters:
+            names.add(name.var)
+    return names
+
+
+def templates_to_compile(engine: DjangoTemplates) -> set[str]:
+    """The templates the warmup starts from: every template in the
+    project's directories, and the app templates under
+    ``app_template_prefixes()``."""
+    project_dirs = set(map(Path, engine.engine.dirs))
+    names = set()
+    for directory in template_dirs(engine.engine.template_loaders):
+        found = template_names(directory)
+        if directory not in project_dirs:
+            found = {
+                name for name in found
+                if name.startswith(app_template_prefixes())
+            }
+        # A name found in several directories loads from the first one.
+        names |= found
+    return names
+
+
+def compile_templates() -> int:
+    """Load the templates the site renders, so the engines' cached loaders
+    hold them compiled: those from ``templates_to_compile`` and the ones
+    they include or extend. Return the number of templates loaded."""
+    compiled = 0
+    for engine in engines.all():
+        if not isinstance(engine, DjangoTemplates):
+            continue
+        pending = sorted(templates_to_compile(engine), reverse=True)
+        seen = set(pending)
+        while pending:
+            name = pending.pop()
+            try:
+                template = engine.get_template(name)
+            except (TemplateDoesNotExist, TemplateSyntaxError) as error:
+                logger.warning("Template %s not compiled: %s", name, error)
+                continue
+            compiled += 1
+            for referenced in referenced_templates(template.template) - seen:
+                seen.add(referenced)
+                pending.append(referenced)
+    return compiled
+
+
+def warm_up() -> dict[str, float]:
+    """Do the one-off work a worker would otherwise do on its first
+    requests: import views and forms, resolve the URLconf and compile the
+    templates."""
+    start = time.perf_counter()
+    # Populating the resolver imports the URLconfs and with them every
+    # view and form module; ``{% url %}`` would otherwise do it lazily.
+    get_resolver().reverse_dict
+    templates = compile_templates()
+
+    ms = (time.perf_counter() - start) * 1000
+    logger.info("Warmed up %s templates in %.0f ms", templates, ms)
+    return {"templates": templates, "ms": round(ms, 2)}
@@ -7,6 +7,7 @@ For more information on this file, see
 https://docs.djangoproject.com/en/4.1/howto/deployment/asgi/
 """
 
+import atexit
 import os
 
 from django.core.asgi import get_asgi_application
@@ -14,3 +15,17 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "restaurant_kitchen_service.settings")
 
 application = get_asgi_application()
+
+# Runs before the worker accepts connections (in the master with
+# gunicorn --preload), so the first request does not pay for imports and
+# template compilation.
+from django.conf import settings  # noqa: E402
+
+from restaurant import visits  # noqa: E402
+from restaurant.warmup import warm_up  # noqa: E402
+
+if settings.WARMUP:
+    warm_up()
+
+# Visits still pending when a worker is recycled or stopped would be lost.
+atexit.register(visits.flush)
@@ -10,8 +10,8 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.1/ref/settings/
 """
 import os
+import sys
 from pathlib import Path
-import dj_database_url
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -43,13 +43,18 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.forms",
     "crispy_forms",
     "restaurant",
 ]
 
 MIDDLEWARE = [
+    # First, so probes skip HTTPS redirects, sessions and host checks.
+    "restaurant.middleware.HealthCheckMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    "restaurant.middleware.PerformanceMiddleware",
+    "restaurant.middleware.QueryDetectorMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -65,8 +70,19 @@ TEMPLATES = [
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [BASE_DIR / 'templates']
         ,
-        "APP_DIRS": True,
         "OPTIONS": {
+            # Compiled templates are kept for the life of the process, in
+            # development too (runserver's autoreloader clears them on
+            # change). restaurant.warmup fills the cache at startup.
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
+            ],
             "context_processors": [
                 "django.template.context_processors.debug",
                 "django.template.context_processors.request",
@@ -79,8 +95,20 @@ TEMPLATES = [
 
 CRISPY_TEMPLATE_PACK = "bootstrap4"
 
+# Render widgets with the engine above, so widget templates can live in
+# templates/ and are cached and warmed up like the pages.
+FORM_RENDERER = "django.forms.renderers.TemplatesSetting"
+
 WSGI_APPLICATION = "restaurant_kitchen_service.wsgi.application"
 
+# Route the read-heavy pages to the async views in restaurant.async_views,
+# for deployments served over ASGI (e.g. uvicorn).
+ASYNC_VIEWS = os.environ.get("ASYNC_VIEWS") == "1"
+
+# Compile every template and import the views when the WSGI/ASGI
+# application is loaded (see restaurant.warmup).
+WARMUP = os.environ.get("WARMUP", "1") == "1"
+
 # Database
 # https://docs.djangoproject.com/en/4.1/ref/settings/#databases
 
@@ -91,9 +119,76 @@ DATABASES = {
     }
 }
 
-# dj-database-url
-db_from_env = dj_database_url.config(conn_max_age=500)
-DATABASES["default"].update(db_from_env)
+# Connection pooling (restaurant.backends): DB_POOL_SIZE > 0 swaps in the
+# pooled variant of the backend. Connections then go back to the pool at
+# the end of each request instead of being kept per thread.
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "0"))
+
+POOLED_ENGINES = {
+    "django.db.backends.postgresql": "restaurant.backends.postgresql",
+    "django.db.backends.sqlite3": "restaurant.backends.sqlite3",
+}
+
+# dj-database-url, imported only when there is a URL to parse.
+if "DATABASE_URL" in os.environ:
+    import dj_database_url
+
+    DATABASES["default"].update(
+        dj_database_url.config(conn_max_age=0 if DB_POOL_SIZE else 500)
+    )
+
+# Check persistent connections before reuse, so a worker survives a
+# database restart instead of failing its next request.
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+
+if DB_POOL_SIZE:
+    DATABASES["default"]["ENGINE"] = POOLED_ENGINES[
+        DATABASES["default"]["ENGINE"]
+    ]
+    DATABASES["default"]["POOL"] = {
+        "MAX_SIZE": DB_POOL_SIZE,
+        "TIMEOUT": float(os.environ.get("DB_POOL_TIMEOUT", "10")),
+        "MAX_LIFETIME": int(os.environ.get("DB_POOL_MAX_LIFETIME", "1800")),
+    }
+
+# Cache
+# https://docs.djangoproject.com/en/4.1/topics/cache/
+# LocMemCache is private to each process, so whatever workers must agree
+# on (change stamps, page versions, counters) lives in the database
+# instead. REDIS_URL shares one cache between every worker.
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "restaurant-kitchen-service",
+    }
+}
+
+if "REDIS_URL" in os.environ:
+    CACHES["default"] = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.environ["REDIS_URL"],
+    }
+
+# N+1 and slow-query detection (restaurant.middleware)
+# Problems fail the request under `manage.py test`; in production a sample
+# of requests is checked and problems are logged.
+
+RESTAURANT_QUERY_DETECTOR_RAISE = "test" in sys.argv
+
+RESTAURANT_QUERY_DETECTOR_SAMPLE_RATE = float(
+    os.environ.get("QUERY_DETECTOR_SAMPLE_RATE", "0.01")
+)
+
+# Sessions
+# https://docs.djangoproject.com/en/4.1/topics/http/sessions/
+# SESSION_BACKEND picks the engine: db, cache, cached_db or signed_cookies.
+# cached_db serves reads from the cache; plain cache needs a shared cache
+# (REDIS_URL) once more than one worker runs.
+
+SESSION_ENGINE = "django.contrib.sessions.backends." + os.environ.get(
+    "SESSION_BACKEND", "cached_db"
+)
 
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
@@ -133,6 +228,15 @@ STATICFILES_DIRS = [
 
 STATIC_ROOT = BASE_DIR / "staticfiles"
 
+# collectstatic writes content-hashed copies plus .gz and .br variants;
+# WhiteNoise serves the hashed names with a far-future, immutable
+# Cache-Control. The manifest only exists after collectstatic, so keep the
+# plain storage for local development and tests.
+if not DEBUG:
+    STATICFILES_STORAGE = (
+        "whitenoise.storage.CompressedManifestStaticFilesStorage"
+    )
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.1/ref/settings/#default-auto-field
 